@@ -7,14 +7,28 @@ from .camera import Camera
 from .assets import init_after_display
 from .state import reset_juego, activar_pantalla_nivel
 from .entities.enemy import respawnear_enemigo, crear_enemigos
-from .entities.powerups import PowerUp, BombPickup, BombProjectile
-from .entities.boss import Boss
+from .entities.powerups import BombPickup, POWERUP_POOL, BOMB_POOL
+from .entities.boss import Boss, submit_bullets as submit_boss_bullets
+from .entities.bullet import update_bullets, compact as compact_bullets
 from .audio import play_music, Volumes
 from .menu_bg import MenuBG
-from .ui_helpers import draw_letterbox, draw_focus_ring, draw_slider
+from .ui_helpers import draw_letterbox, draw_focus_ring, draw_slider, CachedLayer
+from .overlay import OVERLAYS
+from .render_queue import RenderQueue
+from .timestep import SIM
+from .spatial import SpatialHash
+from .pool import POOLS
 from .character import CharacterSelect
 from .shooting import shoot_pattern
 from .gif import load_gif_frames
+from .loader import AssetLoader
+from .clips import should_stream
+from .prefetch import BackgroundPrefetcher
+from .manifest import get_manifest
+from .registry import REGISTRY
+from .startup import STARTUP
+from .dirty import DirtyPresenter
+from .display import open_display, toggle_fullscreen
 
 # Estado adicional sin tocar constants.py
 LEVEL_SELECT = "LEVEL_SELECT"
@@ -22,32 +36,48 @@ LEVEL_SELECT = "LEVEL_SELECT"
 class GameApp:
     def __init__(self):
         # Ventana y fuentes
-        self.ventana = pygame.display.set_mode((ANCHO, ALTO))
+        self.ventana = open_display((ANCHO, ALTO))
         pygame.display.set_caption(GAME_TITLE)
         self.clock = pygame.time.Clock()
+        STARTUP.mark("set_mode")
 
         self.fuente = load_font(24)
         self.fuente_grande = load_font(48)
         self.fuente_titulo = load_font(56)
+        STARTUP.mark("fuentes")
+
+        # Decodificación en paralelo; los cargadores recogen lo precargado
+        self._preload_assets()
+        STARTUP.mark("assets: precarga paralela")
 
         # Carga de imágenes/GIFs tras set_mode
         init_after_display()
+        STARTUP.mark("assets: sprites y atlas")
 
         # Sonidos SFX
         self.s_gameover = cargar_sonido("assets/music/game-over.mp3", 0.6)
         self.s_disparo  = cargar_sonido("assets/music/laser-shot-ingame-230500.mp3", 0.4)
         self.s_explosion= cargar_sonido("assets/music/break.mp3", 0.5)
         self.s_power    = cargar_sonido("assets/music/powerup.mp3", 0.6)
+        STARTUP.mark("audio: efectos")
 
         # Módulos auxiliares
         # NOTA: el fondo de juego (self.bg) se re-crea cuando eliges planeta
         self.bg = AnimatedBackground("assets/scenes/fondo.gif", "assets/scenes/fondo-gf.gif")
         self.menu_bg = MenuBG("assets/scenes/space.gif")
         self.cam = Camera()
+        self.render_queue = RenderQueue()
+        self.render_fps = FPS   # tope de frames dibujados (0 = sin tope)
+        # fase amplia de colisiones: una rejilla por grupo, se rehace cada paso
+        self.grid_enemies = SpatialHash()
+        self.grid_pickups = SpatialHash()
+        self.grid_shots = SpatialHash()
         self.vol = Volumes(self.s_gameover, self.s_disparo, self.s_explosion, self.s_power)
+        STARTUP.mark("assets: fondos")
 
         # Música
         play_music("assets/music/game.mp3", volume=0.5, loop=True, fade_ms=800)
+        STARTUP.mark("audio: música")
 
         # Hiscore & Estado
         self.hiscore = leer_hiscore()
@@ -56,9 +86,13 @@ class GameApp:
         self.juego["boss"] = None
         self.juego["boss_active"] = False
         self.juego["boss_threshold_cleared"].clear()
+        STARTUP.mark("estado inicial")
 
         # Menús
         self.estado = MENU_MAIN
+        # Tarjeta del menú principal: se re-dibuja solo al cambiar índice o skin
+        card = pygame.Rect(0, 0, 560, 420); card.center = (ANCHO//2, ALTO//2 - 20)
+        self.main_card_layer = CachedLayer(card.inflate(8, 8), self._render_main_card, mode="colorkey")
         self.menu_main_items = ["INICIO", "PERSONAJE", "DIFICULTAD", "OPCIONES"]
         self.menu_main_index = 0
 
@@ -71,13 +105,39 @@ class GameApp:
 
         # Personajes
         self.character = CharacterSelect()  # maneja selected_ship, previews, UI
+        STARTUP.mark("assets: personajes")
 
         # Selección de nivel (planetas)
         self.level_selected = 1
         self._init_planet_select()
+        self.bg_prefetch = BackgroundPrefetcher()
+        STARTUP.mark("assets: planetas")
 
         # Varios
         self.fullscreen = False
+        self.dirty = DirtyPresenter()
+
+    # -----------------
+    # Precarga paralela de assets de arranque
+    # -----------------
+    def _preload_assets(self):
+        loader = AssetLoader()
+        loader.add_gif("assets/extra/asteroides.gif", (ASTEROID_W, ASTEROID_H))
+        loader.add_gif("assets/extra/nave.gif", (PLAYER_W, PLAYER_H))
+        loader.add_gif("assets/personajes/jefe.gif", (BOSS_W, BOSS_H))
+        loader.add_image("assets/extra/bala.png", (14, 30))
+        loader.add_image("assets/extra/bala-2.png", (24, 32))
+        # los fondos pesados se decodifican en streaming, no se precargan
+        for path in ("assets/scenes/fondo.gif", "assets/scenes/fondo-gf.gif", "assets/scenes/space.gif"):
+            if not should_stream(path, (ANCHO, ALTO)):
+                loader.add_gif(path, (ANCHO, ALTO))
+        for path in ("assets/extra/nave.gif", "assets/extra/nave-f.jpg",
+                     "assets/extra/nave-m.gif", "assets/extra/nave-t.gif"):
+            loader.add_gif(path, (100, 100))
+        loader.add_image("assets/scenes/plants/espacio.png", (ANCHO, ALTO), alpha=False)
+        for i in range(1, 9):
+            loader.add_image(f"assets/scenes/plants/{i}.png", (88, 88))
+        self.load_report = loader.run()
 
     # -----------------
     # Inicializar mini-menú de planetas
@@ -85,8 +145,7 @@ class GameApp:
     def _init_planet_select(self):
         # Fondo del selector
         try:
-            img = pygame.image.load("assets/scenes/plants/espacio.png").convert()
-            self.planet_bg = pygame.transform.smoothscale(img, (ANCHO, ALTO))
+            self.planet_bg = REGISTRY.acquire(LEVEL_MENU_BG, (ANCHO, ALTO), "opaque")[0][0]
         except Exception:
             self.planet_bg = None
 
@@ -96,14 +155,13 @@ class GameApp:
         for i in range(1, 9):
             path = f"assets/scenes/plants/{i}.png"
             try:
-                img = pygame.image.load(path).convert_alpha()
+                # tamaño uniforme (sin perder proporción)
+                img = REGISTRY.acquire(path, (88, 88), "image")[0][0]
             except Exception:
                 # placeholder
                 img = pygame.Surface((88, 88), pygame.SRCALPHA)
                 pygame.draw.circle(img, (120, 180, 255), (44, 44), 44)
                 dibujar_texto(img, str(i), self.fuente_grande, (0,0,40), 44, 44, centrado=True)
-            # tamaño uniforme (sin perder proporción)
-            img = pygame.transform.smoothscale(img, (88, 88))
             self.planets.append(img)
 
         # Disposición: 2 filas x 4 columnas
@@ -127,6 +185,8 @@ class GameApp:
         self.planet_index = 0  # resaltado actual
         # Flecha (triángulo) encima del planeta seleccionado
         self.arrow_offset = -70  # distancia vertical sobre el centro del planeta
+        # Selector completo en una capa; se re-dibuja solo al cambiar planet_index
+        self.planet_layer = CachedLayer(pygame.Rect(0, 0, ANCHO, ALTO), self._render_planet_select, mode="opaque")
 
     # -----------------
     # Helpers de juego
@@ -135,25 +195,39 @@ class GameApp:
         d = DIFFICULTY_PRESETS.get(self.difficulty_name, DIFFICULTY_PRESETS["MEDIA"])
         return d["enemy_speed"], d["boss_hp"]
 
+    def _level_background_path(self, level_n: int):
+        """Ruta del fondo principal del nivel N (.gif/.png o el genérico)."""
+        found = get_manifest().resolve(f"bg:level:{level_n}")
+        return found[0] if found else "assets/scenes/fondo.gif"  # fallback
+
+    def _prefetch_level_backgrounds(self):
+        """Precarga el fondo del planeta resaltado y de sus vecinos."""
+        if not hasattr(self, "_level_bg_paths"):
+            self._level_bg_paths = [self._level_background_path(n) for n in range(1, 9)]
+        i = self.planet_index
+        wanted = [self._level_bg_paths[(i + d) % 8] for d in (0, 1, -1)]
+        self.bg_prefetch.request(list(dict.fromkeys(wanted)))
+        self.bg_prefetch.poll()
+
     def _apply_level_background(self, level_n: int):
         """Crea el AnimatedBackground del nivel elegido."""
         # fondo principal del nivel N
-        # soporta .png/.gif indistintamente (load_gif_frames debe manejar 1 frame si es png)
-        main_path_candidates = [f"assets/scenes/fondo-{level_n}.gif",
-                                f"assets/scenes/fondo-{level_n}.png"]
+        chosen = self._level_background_path(level_n)
         # el boss usa 'fondo-gf.gif' como antes
         boss_path = "assets/scenes/fondo-gf.gif"
-        # escoger el primero existente
-        chosen = None
-        for p in main_path_candidates:
-            try:
-                with open(p, "rb"):
-                    chosen = p; break
-            except Exception:
-                continue
-        if not chosen:
-            chosen = "assets/scenes/fondo.gif"  # fallback
+        hit = self.bg_prefetch.claim(chosen)
+        t0 = pygame.time.get_ticks()
+        old_bg = self.bg
         self.bg = AnimatedBackground(chosen, boss_path)
+        # soltar después de crear el nuevo: el fondo del jefe sigue compartido
+        old_bg.release()
+        stall = pygame.time.get_ticks() - t0
+        if not hit:
+            self.bg_prefetch.record_stall(stall)
+        st = self.bg_prefetch.stats()
+        print(f"[INFO] Fondo nivel {level_n}: {'precargado' if hit else 'carga síncrona'} "
+              f"({stall} ms); aciertos {st['hits']}/{st['hits'] + st['misses']}, "
+              f"stall evitado {st['stall_avoided_ms']:.0f} ms")
 
     # -----------------
     # Loop principal
@@ -161,25 +235,17 @@ class GameApp:
     def run(self):
         running = True
         while running:
-            dt = self.clock.tick(FPS)
+            dt = self.clock.tick(self.render_fps)
             ahora = pygame.time.get_ticks()
 
-            # Cámara suave
-            if self.juego.get("player"):
-                tx, ty = self.cam.target_from_player(self.juego["player"].rect, ANCHO, ALTO)
-                self.cam.update(tx, ty)
-
-            # Fondos
+            # Fondos (solo se animan aquí; se dibujan una vez en draw_scene)
             if self.estado in (MENU_MAIN, MENU_OPTIONS, MENU_DIFFICULTY, MENU_CHARACTER):
                 self.menu_bg.update(dt)  # Actualiza animación + zoom del fondo
-                self.menu_bg.draw(self.ventana)  # Dibuja el fondo con zoom
             elif self.estado == LEVEL_SELECT:
                 self.menu_bg.update(dt)  # Mantiene la animación + zoom
-                self.menu_bg.draw(self.ventana)  # Dibuja el fondo con zoom y movimiento
+                self._prefetch_level_backgrounds()
             elif self.estado in (LEVEL_INTRO, JUGANDO, BOSS_INTRO, PAUSA, GAME_OVER, STORY_INTRO):
-
                 self.bg.update(dt)
-                self.bg.draw(self.ventana)
             # Eventos
             for evento in pygame.event.get():
                 if evento.type == pygame.QUIT:
@@ -188,14 +254,90 @@ class GameApp:
                     running = self.handle_keydown(evento, ahora, running)
                 elif evento.type == pygame.MOUSEBUTTONDOWN and self.estado == LEVEL_SELECT:
                     self.handle_level_click(evento.pos, ahora)
-
-            # Lógica principal
-            self.update_logic(dt, ahora)
-
-            # Dibujo
-            self.draw_scene(ahora)
-
-            pygame.display.flip()
+                elif evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.dirty.invalidate()
+
+            # Lógica principal a paso fijo (independiente de los frames dibujados)
+            for _ in range(SIM.advance(dt)):
+                if self.juego.get("player"):
+                    # Cámara suave
+                    tx, ty = self.cam.target_from_player(self.juego["player"].rect, ANCHO, ALTO)
+                    self.cam.update(tx, ty)
+                self.update_logic(SIM.step_ms, ahora)
+
+            # Dibujo: en pantallas casi estáticas solo si algo cambió
+            rects = self.dirty.begin(self._static_regions())
+            if rects != []:
+                self.draw_scene(ahora)
+            self.dirty.present(rects)
+            if STARTUP.first_frame() and STARTUP.stop_after_first_frame:
+                running = False
+
+        st = self.dirty.stats()
+        if st["frames"]:
+            print(f"[INFO] Presentación: {st['frames']} frames, {st['flips']} completos, "
+                  f"{st['partial']} parciales, {st['skipped']} sin cambios "
+                  f"(área presentada {st['fill_ratio']:.0%})")
+        grids = (self.grid_enemies, self.grid_pickups, self.grid_shots)
+        queries = sum(g.queries for g in grids)
+        if queries:
+            print(f"[INFO] Colisiones: {queries} consultas, "
+                  f"{sum(g.tests for g in grids) / queries:.2f} pruebas por consulta, "
+                  f"rejilla en {sum(g.grid_builds for g in grids)} de "
+                  f"{sum(g.builds for g in grids)} construcciones")
+        for pool in POOLS:
+            st = pool.stats()
+            if st["created"]:
+                print(f"[INFO] Reserva {st['name']}: {st['created']} creados, {st['reused']} reutilizados "
+                      f"({st['reuse_rate']:.0%}), pico {st['high_water']} en uso, {st['free']}/{st['max_free']} libres")
+                if st["double_releases"]:
+                    print(f"[AVISO] Reserva {st['name']}: {st['double_releases']} liberaciones repetidas ignoradas")
+        st = SIM.stats()
+        if st["frames"]:
+            print(f"[INFO] Simulación: {st['steps']} pasos a {st['hz']} Hz en {st['frames']} frames "
+                  f"({st['steps_per_frame']:.2f} por frame, {st['dropped_ms']:.0f} ms descartados)")
+        st = self.render_queue.stats()
+        if st["frames"]:
+            print(f"[INFO] Cola de dibujo: {st['frames']} frames, por frame {st['avg_submitted']:.1f} enviados, "
+                  f"{st['avg_culled']:.1f} descartados, {st['avg_drawn']:.1f} dibujados "
+                  f"en {st['avg_batches']:.1f} blits")
+        st = OVERLAYS.stats()
+        if st["reuses"]:
+            print(f"[INFO] Overlays: {st['allocations']} superficies creadas, "
+                  f"{st['reuses']} reutilizadas ({st['avoided_per_s']:.0f}/s evitadas)")
+
+    def _static_regions(self):
+        """
+        Regiones {(estado, nombre): (Rect, clave)} de las pantallas casi
+        estáticas para la presentación por rects sucios; None si el estado
+        cambia cada frame (juego, selector de personaje).
+        """
+        e = self.estado
+        screen = self.ventana.get_rect()
+        if e in (MENU_MAIN, MENU_OPTIONS, MENU_DIFFICULTY):
+            regions = {(e, "fondo"): (screen, self.menu_bg.signature())}
+            if e == MENU_MAIN:
+                card = pygame.Rect(0, 0, 560, 420); card.center = (ANCHO//2, ALTO//2 - 20)
+                regions[(e, "menu")] = (card.inflate(12, 12),
+                                        (self.menu_main_index, self.character.selected_ship))
+            elif e == MENU_OPTIONS:
+                regions[(e, "menu")] = (pygame.Rect(0, 120, ANCHO, 260),
+                                        (self.options_index, self.vol.master, self.vol.sfx, self.vol.music))
+            else:
+                regions[(e, "menu")] = (pygame.Rect(0, 140, ANCHO, 60 * len(DIFFICULTY_ORDER) + 20),
+                                        self.difficulty_name)
+            return regions
+        if e == LEVEL_SELECT:
+            return {(e, "planetas"): (screen, self.planet_index)}
+        if e == LEVEL_INTRO:
+            return {(e, "texto"): (screen, (self.juego["intro_text"], self.difficulty_name))}
+        if e == PAUSA:
+            return {(e, "pausa"): (screen, None)}
+        if e == GAME_OVER:
+            return {(e, "resumen"): (screen, (self.juego["puntaje"], self.hiscore))}
+        if e == STORY_INTRO:
+            return {(e, "historia"): (screen, self.character.selected_ship)}
+        return None
 
 
     def activar_pantalla_nivel(juego, ahora):
@@ -207,8 +349,8 @@ class GameApp:
     def handle_keydown(self, evento, ahora, running):
         if evento.key == pygame.K_F11:
             self.fullscreen = not self.fullscreen
-            flags = pygame.FULLSCREEN if self.fullscreen else 0
-            self.ventana = pygame.display.set_mode((ANCHO, ALTO), flags)
+            self.ventana = toggle_fullscreen(self.fullscreen, (ANCHO, ALTO))
+            self.dirty.invalidate()
 
         if evento.key == pygame.K_m:
             self.vol.muted = not self.vol.muted
@@ -296,7 +438,7 @@ class GameApp:
             if evento.key == pygame.K_RETURN:
                 self.estado = JUGANDO
             if evento.key == pygame.K_r:
-                self.juego = reset_juego()
+                self.juego = reset_juego(self.juego)
                 if self.difficulty_name == "EXTREMA" and len(self.juego["enemigos"]) < 12:
                     self.juego["enemigos"] += crear_enemigos(2)
                 self.estado = LEVEL_INTRO
@@ -307,7 +449,7 @@ class GameApp:
         # GAME OVER
         elif self.estado == GAME_OVER:
             if evento.key == pygame.K_r:
-                self.juego = reset_juego()
+                self.juego = reset_juego(self.juego)
                 if self.difficulty_name == "EXTREMA" and len(self.juego["enemigos"]) < 12:
                     self.juego["enemigos"] += crear_enemigos(2)
                 self.estado = LEVEL_INTRO
@@ -343,7 +485,7 @@ class GameApp:
     def _choose_level(self, level_n: int, ahora):
         self.level_selected = level_n
         # Reinicia juego y aplica nivel
-        self.juego = reset_juego()
+        self.juego = reset_juego(self.juego)
         self.juego["nivel"] = level_n  # forzar que el nivel mostrado sea el elegido
         activar_pantalla_nivel(self.juego, ahora)
         self.juego["intro_text"] = f"NIVEL {level_n}"
@@ -416,9 +558,7 @@ class GameApp:
             # --- SIN JEFE ---
             if not j["boss_active"]:
                 # balas jugador
-                for bala in j["balas"][:]:
-                    if not bala.update():
-                        j["balas"].remove(bala)
+                update_bullets(j["balas"])
 
                 # enemigos
                 vel_enemigo = (j["vel_enemigo_base"] + (j["nivel"] - 1) * 0.9) * enemy_mul
@@ -431,47 +571,47 @@ class GameApp:
                         respawnear_enemigo(enemigo)
 
                 # colisiones balas/enemigos
-                for bala in j["balas"][:]:
-                    impactado = None
-                    for enemigo in j["enemigos"]:
-                        if bala.rect.colliderect(enemigo.rect):
-                            impactado = enemigo; break
+                grid = self.grid_enemies.build(j["enemigos"])
+                for bala in j["balas"]:
+                    impactado = grid.first(bala.rect)
                     if impactado:
-                        try: j["balas"].remove(bala)
-                        except ValueError: pass
+                        bala.alive = False
                         drop_x, drop_y = impactado.rect.centerx, impactado.rect.centery
                         respawnear_enemigo(impactado)
+                        grid.move(impactado)
                         j["puntaje"] += 10
                         reproducir(self.s_explosion)
                         if random.random() < 0.12:
                             tipo = random.choice(['S', 'F', 'P'])
-                            j["powerups"].append(PowerUp(tipo, drop_x, drop_y))
+                            j["powerups"].append(POWERUP_POOL.acquire(tipo, drop_x, drop_y))
                             reproducir(self.s_power)
+                compact_bullets(j["balas"])
 
                 # daño al jugador por choque
                 if ahora >= j["invulnerable_hasta"]:
-                    for enemigo in j["enemigos"]:
-                        if j["player"].rect.colliderect(enemigo.rect):
-                            j["vidas"] -= 1
-                            j["invulnerable_hasta"] = ahora + j["invulnerable_ms"]
-                            respawnear_enemigo(enemigo)
-                            reproducir(self.s_explosion)
-                            j["player"].rect.centerx = ANCHO // 2
-                            j["player"].rect.bottom = ALTO - 10
-                            j["player"].angle = 0.0
-                            j["player"].target_angle = 0.0
-                            break
+                    enemigo = grid.first(j["player"].rect)
+                    if enemigo:
+                        j["vidas"] -= 1
+                        j["invulnerable_hasta"] = ahora + j["invulnerable_ms"]
+                        respawnear_enemigo(enemigo)
+                        reproducir(self.s_explosion)
+                        j["player"].rect.centerx = ANCHO // 2
+                        j["player"].rect.bottom = ALTO - 10
+                        j["player"].angle = 0.0
+                        j["player"].target_angle = 0.0
 
                 # powerups
                 for pu in j["powerups"][:]:
                     if not pu.update():
-                        j["powerups"].remove(pu); continue
-                    if pu.rect.colliderect(j["player"].rect):
+                        j["powerups"].remove(pu)
+                        POWERUP_POOL.release(pu)
+                if j["powerups"]:
+                    for pu in self.grid_pickups.build(j["powerups"]).query(j["player"].rect):
                         if pu.tipo == 'S': j["s_active_until"] = ahora + 8000
                         elif pu.tipo == 'F': j["f_active_until"] = ahora + 8000
                         elif pu.tipo == 'P': j["p_active_until"] = ahora + 8000
-                        try: j["powerups"].remove(pu)
-                        except ValueError: pass
+                        j["powerups"].remove(pu)
+                        POWERUP_POOL.release(pu)
                         reproducir(self.s_power)
 
             # --- CON JEFE ---
@@ -479,31 +619,21 @@ class GameApp:
                 boss = j["boss"]
                 boss_bullets = j["boss_bullets"]
 
-                for bala in j["balas"][:]:
-                    if not bala.update():
-                        j["balas"].remove(bala)
+                update_bullets(j["balas"])
 
                 boss.update(dt, ahora, j["player"].rect, boss_bullets)
 
                 # daño al jefe
-                for bala in j["balas"][:]:
-                    if boss.rect.colliderect(bala.rect):
-                        try: j["balas"].remove(bala)
-                        except ValueError: pass
-                        boss.hp -= 10
-                        reproducir(self.s_explosion)
+                hits = self.grid_shots.build(j["balas"]).query(boss.rect)
+                for bala in hits:
+                    bala.alive = False
+                    boss.hp -= 10
+                    reproducir(self.s_explosion)
+                if hits:
+                    compact_bullets(j["balas"])
 
-                # balas del boss
-                for b in boss_bullets[:]:
-                    r = b["rect"]; t = b.get("type","normal")
-                    if t == "wave":
-                        b["phase"] = b.get("phase",0.0) + b.get("phase_speed",0.12)
-                        r.x += int(3.2 * math.sin(b["phase"]))
-                        r.y += int(b["vy"])
-                    else:
-                        r.x += int(b["vx"]); r.y += int(b["vy"])
-                    if r.top > ALTO or r.right < 0 or r.left > ANCHO:
-                        boss_bullets.remove(b)
+                # balas del boss (movimiento y descarte vectorizados)
+                boss_bullets.step(SIM.scale)
 
                 # === BOMB PICKUP ===
                 if j["bomb_pickup"] is None and ahora >= j["next_bomb_spawn_time"]:
@@ -520,14 +650,19 @@ class GameApp:
                         j["next_bomb_spawn_time"] = min(j["next_bomb_spawn_time"], ahora + 1200)
                     elif bp.rect.colliderect(j["player"].rect):
                         px, py = j["player"].rect.centerx, j["player"].rect.top
-                        j["bombs"].append(BombProjectile(px, py, boss.rect, reproducir, self.s_explosion))
+                        j["bombs"].append(BOMB_POOL.acquire(px, py, boss.rect, reproducir, self.s_explosion))
                         j["bomb_pickup"] = None
                         reproducir(self.s_power)
 
                 for bomb in j["bombs"][:]:
-                    bomb.update(ahora, boss)
+                    bomb.update(ahora)
                     if not bomb.active:
                         j["bombs"].remove(bomb)
+                        BOMB_POOL.release(bomb)
+                flying = [bomb for bomb in j["bombs"] if not bomb.exploded]
+                if flying:
+                    for bomb in self.grid_shots.build(flying).query(boss.rect):
+                        bomb.hit(ahora, boss)
 
                 # daño al jugador
                 if ahora >= j["invulnerable_hasta"]:
@@ -542,23 +677,26 @@ class GameApp:
                                 j["player"].rect.bottom = ALTO - 10
                                 j["player"].angle = 0.0
                                 j["player"].target_angle = 0.0
-                    for b in boss_bullets[:]:
-                        if b["rect"].colliderect(j["player"].rect):
-                            boss_bullets.remove(b)
-                            j["vidas"] -= 1
-                            j["invulnerable_hasta"] = ahora + j["invulnerable_ms"]
-                            reproducir(self.s_explosion)
-                            j["player"].rect.centerx = ANCHO // 2
-                            j["player"].rect.bottom = ALTO - 10
-                            j["player"].angle = 0.0
-                            j["player"].target_angle = 0.0
+                    # el jugador se recoloca tras cada impacto: se sigue buscando desde ahí
+                    hits = boss_bullets.hits(j["player"].rect)
+                    while hits:
+                        i = hits[0]
+                        boss_bullets.kill(i)
+                        j["vidas"] -= 1
+                        j["invulnerable_hasta"] = ahora + j["invulnerable_ms"]
+                        reproducir(self.s_explosion)
+                        j["player"].rect.centerx = ANCHO // 2
+                        j["player"].rect.bottom = ALTO - 10
+                        j["player"].angle = 0.0
+                        j["player"].target_angle = 0.0
+                        hits = [k for k in boss_bullets.hits(j["player"].rect) if k > i]
 
                 # derrota del boss
                 if boss.hp <= 0:
                     j["boss_active"] = False
                     j["boss_threshold_cleared"].add(j["nivel"])
                     j["boss"] = None; j["boss_bullets"].clear()
-                    j["bombs"].clear(); j["bomb_pickup"] = None
+                    BOMB_POOL.release_all(j["bombs"]); j["bomb_pickup"] = None
                     j["puntaje"] += 100
                     j["nivel"] += 1
                     j["vel_enemigo_base"] += 0.8
@@ -578,6 +716,51 @@ class GameApp:
                 if j["puntaje"] > self.hiscore:
                     self.hiscore = j["puntaje"]; guardar_hiscore(self.hiscore)
 
+    # -----------------
+    # Capas estáticas (CachedLayer)
+    # -----------------
+    def _render_main_card(self, surf, origin):
+        ox, oy = origin
+        card = pygame.Rect(0, 0, 560, 420); card.center = (ANCHO//2 - ox, ALTO//2 - 20 - oy)
+        pygame.draw.rect(surf, GRIS, card, border_radius=18)
+        pygame.draw.rect(surf, (70,70,85), card.inflate(8,8), 4, border_radius=22)
+        dibujar_texto(surf, GAME_TITLE.upper(), self.fuente_titulo, ORO, card.centerx, card.top + 65, centrado=True)
+        for i, label in enumerate(self.menu_main_items):
+            color = AMARILLO if i == self.menu_main_index else BLANCO
+            dibujar_texto(surf, label, self.fuente_grande, color, card.centerx, card.top + 140 + i*55, centrado=True)
+        dibujar_texto(surf, f"Personaje: {SHIP_DISPLAY[self.character.selected_ship]}", self.fuente, AMARILLO, card.centerx, card.bottom - 60, centrado=True)
+        dibujar_texto(surf, "Créditos: created by TodTete", self.fuente, BLANCO, card.centerx, card.bottom - 20, centrado=True)
+
+    def _render_planet_select(self, surf, origin):
+        if self.planet_bg:
+            surf.blit(self.planet_bg, (0, 0))
+        else:
+            surf.fill((0,0,0))
+        # Título
+        dibujar_texto(surf, "ELIGE TU PLANETA", self.fuente_titulo, ORO, ANCHO//2, 70, centrado=True)
+        # Render de planetas + flecha
+        for i, img in enumerate(self.planets):
+            surf.blit(img, self.planet_rects[i])
+
+        # Flecha sobre el seleccionado (triángulo)
+        sel_rect = self.planet_rects[self.planet_index]
+        arrow_x = sel_rect.centerx
+        arrow_y = sel_rect.top + self.arrow_offset
+        pts = [(arrow_x, arrow_y),
+               (arrow_x - 16, arrow_y + 24),
+               (arrow_x + 16, arrow_y + 24)]
+        pygame.draw.polygon(surf, AMARILLO, pts)
+        pygame.draw.polygon(surf, (90, 70, 0), pts, 2)
+
+        # Bordes sutiles en todos, más fuerte en el seleccionado
+        for i, r in enumerate(self.planet_rects):
+            pygame.draw.rect(surf, (120,120,150), r.inflate(10,10), 2, border_radius=18)
+        pygame.draw.rect(surf, AMARILLO, sel_rect.inflate(14,14), 3, border_radius=20)
+
+        # Leyenda
+        dibujar_texto(surf, "←/→ para mover  |  ENTER o clic para seleccionar  |  ESC volver",
+                      self.fuente, BLANCO, ANCHO//2, ALTO - 50, centrado=True)
+
     # -----------------
     # Draw
     # -----------------
@@ -585,27 +768,13 @@ class GameApp:
         # Fondo
         if self.estado in (MENU_MAIN, MENU_OPTIONS, MENU_DIFFICULTY, MENU_CHARACTER):
             self.menu_bg.draw(self.ventana)
-        elif self.estado == LEVEL_SELECT:
-            if self.planet_bg:
-                self.ventana.blit(self.planet_bg, (0, 0))
-            else:
-                self.ventana.fill((0,0,0))
-        else:
+        else:  # LEVEL_SELECT lleva el fondo dentro de su capa
             if self.estado in (JUGANDO, BOSS_INTRO, GAME_OVER, LEVEL_INTRO, PAUSA):
                 self.bg.draw(self.ventana)
 
         # Capas por estado
         if self.estado == MENU_MAIN:
-            card = pygame.Rect(0, 0, 560, 420); card.center = (ANCHO//2, ALTO//2 - 20)
-            pygame.draw.rect(self.ventana, GRIS, card, border_radius=18)
-            pygame.draw.rect(self.ventana, (70,70,85), card.inflate(8,8), 4, border_radius=22)
-            dibujar_texto(self.ventana, GAME_TITLE.upper(), self.fuente_titulo, ORO, ANCHO//2, card.top + 65, centrado=True)
-            for i, label in enumerate(self.menu_main_items):
-                color = AMARILLO if i == self.menu_main_index else BLANCO
-                dibujar_texto(self.ventana, label, self.fuente_grande, color, ANCHO//2, card.top + 140 + i*55, centrado=True)
-            from .constants import SHIP_DISPLAY
-            dibujar_texto(self.ventana, f"Personaje: {SHIP_DISPLAY[self.character.selected_ship]}", self.fuente, AMARILLO, ANCHO//2, card.bottom - 60, centrado=True)
-            dibujar_texto(self.ventana, "Créditos: created by TodTete", self.fuente, BLANCO, ANCHO//2, card.bottom - 20, centrado=True)
+            self.main_card_layer.draw(self.ventana, key=(self.menu_main_index, self.character.selected_ship))
 
         elif self.estado == MENU_CHARACTER:
             self.character.draw(self.ventana, self.fuente_titulo, self.fuente)
@@ -634,30 +803,7 @@ class GameApp:
             dibujar_texto(self.ventana, "↑/↓ selecciona, ENTER volver", self.fuente, AZUL, ANCHO//2, ALTO - 60, centrado=True)
 
         elif self.estado == LEVEL_SELECT:
-            # Título
-            dibujar_texto(self.ventana, "ELIGE TU PLANETA", self.fuente_titulo, ORO, ANCHO//2, 70, centrado=True)
-            # Render de planetas + flecha
-            for i, img in enumerate(self.planets):
-                self.ventana.blit(img, self.planet_rects[i])
-
-            # Flecha sobre el seleccionado (triángulo)
-            sel_rect = self.planet_rects[self.planet_index]
-            arrow_x = sel_rect.centerx
-            arrow_y = sel_rect.top + self.arrow_offset
-            pts = [(arrow_x, arrow_y),
-                   (arrow_x - 16, arrow_y + 24),
-                   (arrow_x + 16, arrow_y + 24)]
-            pygame.draw.polygon(self.ventana, AMARILLO, pts)
-            pygame.draw.polygon(self.ventana, (90, 70, 0), pts, 2)
-
-            # Bordes sutiles en todos, más fuerte en el seleccionado
-            for i, r in enumerate(self.planet_rects):
-                pygame.draw.rect(self.ventana, (120,120,150), r.inflate(10,10), 2, border_radius=18)
-            pygame.draw.rect(self.ventana, AMARILLO, sel_rect.inflate(14,14), 3, border_radius=20)
-
-            # Leyenda
-            dibujar_texto(self.ventana, "←/→ para mover  |  ENTER o clic para seleccionar  |  ESC volver",
-                          self.fuente, BLANCO, ANCHO//2, ALTO - 50, centrado=True)
+            self.planet_layer.draw(self.ventana, key=self.planet_index)
 
         #33333333
         elif self.estado == STORY_INTRO:
@@ -701,31 +847,29 @@ class GameApp:
             visible = True
             if self.estado != PAUSA and pygame.time.get_ticks() < self.juego["invulnerable_hasta"]:
                 visible = ((ahora // 100) % 2 == 0)
-            self.juego["player"].draw(self.ventana, self.cam.apply_point, visible=visible)
+            # Entidades: cola por capas (descarta lo que está fuera de pantalla)
+            q = self.render_queue
+            # entre pasos se interpola; en pausa/intro la escena está quieta
+            q.begin(self.cam.apply_point, SIM.alpha if self.estado == JUGANDO else 1.0)
+            self.juego["player"].submit(q, self.cam.apply_point, visible=visible)
 
             for bala in self.juego["balas"]:
-                bala.draw(self.ventana, self.cam.apply_rect)
+                bala.submit(q)
 
             if not self.juego["boss_active"]:
                 for enemigo in self.juego["enemigos"]:
-                    enemigo.draw(self.ventana, self.cam.apply_rect)
+                    enemigo.submit(q)
                 for pu in self.juego["powerups"]:
-                    pu.draw(self.ventana, self.fuente, self.cam.apply_rect, self.cam.apply_point, dibujar_texto, NEGRO)
+                    pu.submit(q, self.fuente)
             else:
-                self.juego["boss"].draw(self.ventana, self.cam.apply_rect, ahora)
-                for b in self.juego["boss_bullets"]:
-                    color = (255,140,0)
-                    t = b.get("type","normal")
-                    if t == "wave": color = (255,200,0)
-                    elif t == "aim": color = (255,80,80)
-                    elif t == "spread": color = (255,160,60)
-                    elif t == "burst": color = (255,100,0)
-                    pygame.draw.rect(self.ventana, color, self.cam.apply_rect(b["rect"]))
+                self.juego["boss"].submit(q, self.cam.apply_rect)
+                submit_boss_bullets(q, self.juego["boss_bullets"])
                 if self.juego["bomb_pickup"]:
-                    self.juego["bomb_pickup"].draw(self.ventana, self.cam.apply_rect)
+                    self.juego["bomb_pickup"].submit(q)
 
             for bomb in self.juego["bombs"]:
-                bomb.draw(self.ventana, self.cam.apply_rect, self.cam.apply_point)
+                bomb.submit(q, self.cam.apply_point)
+            q.flush(self.ventana)
 
             # HUD
             dibujar_texto(self.ventana, f"Puntaje: {self.juego['puntaje']}", self.fuente, BLANCO, 10, 10)
@@ -1,140 +1,208 @@
 import pygame
 from .gif import load_gif_frames
+from .loader import load_image
+from .registry import REGISTRY
+from .atlas import SpriteAtlas
+from .manifest import get_manifest
+from .rotcache import RotationCache
 from .constants import (
-    ASTEROID_W, ASTEROID_H, PLAYER_W, PLAYER_H, BOSS_W, BOSS_H
+    ASTEROID_W, ASTEROID_H, PLAYER_W, PLAYER_H, PLAYER_TILT_MAX, BOSS_W, BOSS_H, LEVEL_COUNT
 )
 
-# Singletons (se llenan tras set_mode)
-ASTEROID_FRAMES = ASTEROID_DURS = None, None
-PLAYER_FRAMES = PLAYER_DURS = None, None
-BOSS_FRAMES = BOSS_DURS = None, None
-BALA_IMG = None
-BALA2_IMG = None       # << NUEVO (bala ancha)
+# Rol -> clave del registro en uso (se llenan tras set_mode).
+# Roles: "asteroid", "player", "boss", "bala", "bala2"
+_ACTIVE = {}
 PLAYER_SKIN = "BRAYAN" # << NUEVO (tracking actual)
 
-def _cargar_asteroid_frames():
-    for ruta in ("assets/extra/asteroides.gif",):
-        frames, durs = load_gif_frames(ruta, size=(ASTEROID_W, ASTEROID_H))
-        if frames:
-            print(f"[INFO] Asteroides: {len(frames)} frames")
-            return frames, durs
+# Atlas de sprites y, por rol, (página, Rect) y vista de cada frame
+ATLAS = SpriteAtlas()
+_REGIONS = {}
+_VIEWS = {}
+
+# Rotaciones de la nave del skin actual (se prearman al cambiar de skin)
+PLAYER_ROT = RotationCache()
+
+def _atlas_key(reg_key, i):
+    path, size, fmt = reg_key
+    return f"{path}@{size[0]}x{size[1]}/{fmt}#{i}"
+
+def _refresh_regions(role):
+    """Resuelve los frames del rol en el atlas (o el frame suelto si no está)."""
+    key = _ACTIVE[role]
+    regions, views = [], []
+    for i, frame in enumerate(REGISTRY.peek(*key)[0]):
+        akey = _atlas_key(key, i)
+        reg = ATLAS.region(akey)
+        regions.append(reg if reg else (frame, frame.get_rect()))
+        views.append(ATLAS.surface(akey) if reg else frame)
+    _REGIONS[role] = regions
+    _VIEWS[role] = views
+
+def _use(role, path, size, fmt, loader):
+    """Toma la clave nueva del registro y suelta la que tenía el rol."""
+    frames, durs = REGISTRY.acquire(path, size, fmt, loader=loader)
+    old = _ACTIVE.get(role)
+    _ACTIVE[role] = REGISTRY.key(path, size, fmt)
+    if old:
+        REGISTRY.release(*old)
+    _refresh_regions(role)
+    return frames, durs
+
+def sprite(role):
+    """(frames, durations) compartidos del rol indicado."""
+    return REGISTRY.peek(*_ACTIVE[role])
+
+def image(role):
+    """Primer frame del rol (sprites estáticos como las balas)."""
+    return REGISTRY.peek(*_ACTIVE[role])[0][0]
+
+def region(role, idx=0):
+    """(superficie, área) para blit(surface, pos, área): sub-rect del atlas."""
+    return _REGIONS[role][idx]
+
+def regions(role):
+    return _REGIONS[role]
+
+def views(role):
+    """Frames como Surface (subsurfaces del atlas) para rotar/escalar."""
+    return _VIEWS[role]
+
+def _cargar_asteroid_frames(ruta, size):
+    frames, durs = load_gif_frames(ruta, size=size)
+    if frames:
+        print(f"[INFO] Asteroides: {len(frames)} frames")
+        return frames, durs
     print("[AVISO] No 'asteroides.gif'. Placeholder.")
     surf = pygame.Surface((ASTEROID_W, ASTEROID_H), pygame.SRCALPHA)
     surf.fill((200, 80, 80, 180))
     return [surf], [120]
 
 def _frames_from_image(path, size):
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        img = pygame.transform.smoothscale(img, size)
-        return [img], [120]
-    except Exception as e:
-        print(f"[AVISO] No '{path}': {e}")
-        ph = pygame.Surface(size, pygame.SRCALPHA)
-        ph.fill((30,120,240,200))
-        return [ph], [120]
+    if get_manifest().exists(path):
+        try:
+            return [load_image(path, size)], [120]
+        except Exception as e:
+            print(f"[AVISO] No '{path}': {e}")
+    else:
+        print(f"[AVISO] No '{path}': no existe")
+    ph = pygame.Surface(size, pygame.SRCALPHA)
+    ph.fill((30,120,240,200))
+    return [ph], [120]
+
+def _cargar_nave_gif(ruta, size):
+    frames, durs = load_gif_frames(ruta, size=size)
+    if frames:
+        print(f"[INFO] Nave (BRAYAN): {len(frames)} frames")
+        return frames, durs
+    print("[AVISO] No 'nave.gif'. Placeholder.")
+    surf = pygame.Surface((PLAYER_W, PLAYER_H), pygame.SRCALPHA)
+    pygame.draw.polygon(surf, (30,120,240),
+                        [(PLAYER_W//2,4),(10,PLAYER_H-6),(PLAYER_W-10,PLAYER_H-6)])
+    return [surf], [120]
+
+# BRAYAN = gif animado; el resto: imagen fija escalada
+_SKIN_SOURCES = {
+    "BRAYAN":   ("assets/extra/nave.gif",   "gif",   _cargar_nave_gif),
+    "FERNANDA": ("assets/extra/nave-f.gif", "image", _frames_from_image),
+    "MARLIN":   ("assets/extra/nave-m.gif", "image", _frames_from_image),
+    "TETE":     ("assets/extra/nave-t.gif", "image", _frames_from_image),
+}
 
 def _cargar_player_frames_for_skin(skin):
-    # BRAYAN = gif animado; el resto: imagen fija escalada
-    if skin == "BRAYAN":
-        for ruta in ("assets/extra/nave.gif",):
-            frames, durs = load_gif_frames(ruta, size=(PLAYER_W, PLAYER_H))
-            if frames:
-                print(f"[INFO] Nave (BRAYAN): {len(frames)} frames")
-                return frames, durs
-        print("[AVISO] No 'nave.gif'. Placeholder.")
-        surf = pygame.Surface((PLAYER_W, PLAYER_H), pygame.SRCALPHA)
-        pygame.draw.polygon(surf, (30,120,240),
-                            [(PLAYER_W//2,4),(10,PLAYER_H-6),(PLAYER_W-10,PLAYER_H-6)])
-        return [surf], [120]
-    elif skin == "FERNANDA":
-        return _frames_from_image("assets/extra/nave-f.gif", (PLAYER_W, PLAYER_H))
-    elif skin == "MARLIN":
-        return _frames_from_image("assets/extra/nave-m.gif", (PLAYER_W, PLAYER_H))
-    elif skin == "TETE":
-        return _frames_from_image("assets/extra/nave-t.gif", (PLAYER_W, PLAYER_H))
-    else:
-        return _frames_from_image("assets/extra/nave-m.gif", (PLAYER_W, PLAYER_H))
+    ruta, fmt, loader = _SKIN_SOURCES.get(skin, _SKIN_SOURCES["MARLIN"])
+    return _use("player", ruta, (PLAYER_W, PLAYER_H), fmt, loader)
 
-def _cargar_boss_frames():
-    for ruta in ("assets/personajes/jefe.gif",):
-        frames, durs = load_gif_frames(ruta, size=(BOSS_W, BOSS_H))
-        if frames:
-            print(f"[INFO] Jefe: {len(frames)} frames")
-            return frames, durs
+def _cargar_boss_gif(ruta, size):
+    frames, durs = load_gif_frames(ruta, size=size)
+    if frames:
+        print(f"[INFO] Jefe: {len(frames)} frames")
+        return frames, durs
     print("[AVISO] No 'jefe.gif'. Placeholder.")
     surf = pygame.Surface((BOSS_W, BOSS_H), pygame.SRCALPHA)
     pygame.draw.rect(surf, (140,25,25), (0,0,BOSS_W,BOSS_H), border_radius=16)
     return [surf], [120]
 
-def _cargar_imagen_bala():
-    try:
-        img = pygame.image.load("assets/extra/bala.png").convert_alpha()
-        img = pygame.transform.smoothscale(img, (14, 30))
-        return img
-    except Exception as e:
-        print(f"[AVISO] No 'assets/extra/bala.png': {e}")
-        ph = pygame.Surface((14, 30), pygame.SRCALPHA)
-        pygame.draw.rect(ph, (255,255,255), ph.get_rect(), border_radius=3)
-        return ph
-
-def _cargar_imagen_bala2():
-    # bala ancha para Fernanda
+def _cargar_imagen_bala(ruta, size):
     try:
-        img = pygame.image.load("assets/extra/bala-2.png").convert_alpha()
-        # Ligeramente más ancha (antes 20x32)
-        img = pygame.transform.smoothscale(img, (24, 32))
-        return img
+        return [load_image(ruta, size)], [120]
     except Exception as e:
-        print(f"[AVISO] No 'assets/extra/bala-2.png': {e}")
-        ph = pygame.Surface((44, 52), pygame.SRCALPHA)
+        print(f"[AVISO] No '{ruta}': {e}")
+        ph = pygame.Surface(size, pygame.SRCALPHA)
         pygame.draw.rect(ph, (255,255,255), ph.get_rect(), border_radius=3)
-        return ph
+        return [ph], [120]
 
 def set_player_skin(skin):
     """Cambiar el skin del jugador y recargar frames tras set_mode."""
-    global PLAYER_FRAMES, PLAYER_DURS, PLAYER_SKIN
+    global PLAYER_SKIN
     PLAYER_SKIN = skin
-    PLAYER_FRAMES, PLAYER_DURS = _cargar_player_frames_for_skin(skin)
+    _cargar_player_frames_for_skin(skin)
+    _prebuild_player_rotations()
+
+def _prebuild_player_rotations():
+    ms = PLAYER_ROT.prebuild(PLAYER_SKIN, _VIEWS["player"], PLAYER_TILT_MAX)
+    print(f"[INFO] Rotaciones nave ({PLAYER_SKIN}): {PLAYER_ROT.stats()['surfaces']} en {ms:.1f} ms")
+
+def player_rotated(idx, angle):
+    """Frame `idx` de la nave rotado `angle` grados, desde la caché."""
+    views = _VIEWS["player"]
+    idx %= len(views)
+    return PLAYER_ROT.rotated(PLAYER_SKIN, idx, views[idx], angle)
 
 def init_after_display():
-    global ASTEROID_FRAMES, ASTEROID_DURS, PLAYER_FRAMES, PLAYER_DURS
-    global BOSS_FRAMES, BOSS_DURS, BALA_IMG, BALA2_IMG
-    ASTEROID_FRAMES, ASTEROID_DURS = _cargar_asteroid_frames()
+    _use("asteroid", "assets/extra/asteroides.gif", (ASTEROID_W, ASTEROID_H), "gif", _cargar_asteroid_frames)
     # Default: BRAYAN
-    PLAYER_FRAMES,   PLAYER_DURS   = _cargar_player_frames_for_skin("BRAYAN")
-    BOSS_FRAMES,     BOSS_DURS     = _cargar_boss_frames()
-    BALA_IMG = _cargar_imagen_bala()
-    BALA2_IMG = _cargar_imagen_bala2()
+    _cargar_player_frames_for_skin("BRAYAN")
+    _use("boss", "assets/personajes/jefe.gif", (BOSS_W, BOSS_H), "gif", _cargar_boss_gif)
+    _use("bala", "assets/extra/bala.png", (14, 30), "image", _cargar_imagen_bala)
+    # bala ancha para Fernanda (antes 20x32)
+    _use("bala2", "assets/extra/bala-2.png", (24, 32), "image", _cargar_imagen_bala)
+    build_atlas()
+    _prebuild_player_rotations()
+
+def build_atlas():
+    """
+    Empaqueta en el atlas los sprites pequeños: asteroides, balas, frames de
+    todas las naves y los jefes de cada planeta.
+    """
+    keys = [_ACTIVE[r] for r in ("asteroid", "bala", "bala2", "boss")]
+    for skin, (ruta, fmt, loader) in _SKIN_SOURCES.items():
+        REGISTRY.acquire(ruta, (PLAYER_W, PLAYER_H), fmt, loader=loader)
+        keys.append(REGISTRY.key(ruta, (PLAYER_W, PLAYER_H), fmt))
+    for planet_id in range(1, LEVEL_COUNT + 1):
+        found = get_manifest().resolve(f"boss:planet:{planet_id}")
+        if found:
+            key = REGISTRY.key(found[0], (BOSS_W, BOSS_H), found[1])
+            if key not in keys:
+                REGISTRY.acquire(*key)
+                keys.append(key)
+
+    sprites = {}
+    for key in keys:
+        for i, frame in enumerate(REGISTRY.peek(*key)[0]):
+            sprites[_atlas_key(key, i)] = frame
+    ATLAS.build(sprites)
+
+    # los pixeles ya viven en el atlas: soltar las cargas solo para empaquetar
+    for key in keys[4:]:
+        REGISTRY.release(*key)
+    for role in _ACTIVE:
+        _refresh_regions(role)
 
 def cargar_boss_por_planeta(planet_id):
     """
     Carga los frames del jefe asociado al planeta actual.
-    Busca versiones animadas y estáticas; si no encuentra, usa un placeholder.
+    El manifiesto ya sabe qué archivo (jefe-N.png/.jpg, jefe.gif, jefe.png)
+    y formato corresponde; si no hay ninguno, usa un placeholder.
     """
-    candidatos = [
-        f"assets/personajes/jefe-{planet_id}.png",
-        f"assets/personajes/jefe-{planet_id}.jpg",
-        "assets/personajes/jefe.gif",
-        "assets/personajes/jefe.png",
-    ]
-
-    for ruta in candidatos:
-        try:
-            frames, durs = load_gif_frames(ruta, size=(BOSS_W, BOSS_H))
-            if frames:
-                print(f"[INFO] Jefe del planeta {planet_id} cargado desde {ruta}")
-                return frames, durs
-        except Exception:
-            pass
-
+    found = get_manifest().resolve(f"boss:planet:{planet_id}")
+    if found:
+        ruta, fmt = found
         try:
-            frames, durs = _frames_from_image(ruta, (BOSS_W, BOSS_H))
-            if frames:
-                print(f"[INFO] Jefe del planeta {planet_id} (imagen estática) {ruta}")
-                return frames, durs
-        except Exception:
-            pass
+            frames, durs = _use("boss", ruta, (BOSS_W, BOSS_H), fmt, None)
+            print(f"[INFO] Jefe del planeta {planet_id} cargado desde {ruta}")
+            return frames, durs
+        except Exception as e:
+            print(f"[AVISO] Error cargando jefe '{ruta}': {e}")
 
     print(f"[AVISO] No se encontró jefe para planeta {planet_id}. Se usa placeholder.")
     surf = pygame.Surface((BOSS_W, BOSS_H), pygame.SRCALPHA)
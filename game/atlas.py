@@ -0,0 +1,99 @@
+import os, json, hashlib
+import pygame
+from .constants import ATLAS_PAGE_SIZE, ATLAS_LAYOUT_PATH
+
+def pack_rects(sizes, page_size=ATLAS_PAGE_SIZE, padding=1):
+    """
+    Empaquetado por estantes (shelf): ordena por alto y llena filas de
+    izquierda a derecha, abriendo página nueva cuando no cabe.
+    sizes: {clave: (w, h)} -> ({clave: (pagina, x, y, w, h)}, n_paginas)
+    """
+    order = sorted(sizes, key=lambda k: (-sizes[k][1], -sizes[k][0], k))
+    placements = {}
+    page = x = y = shelf_h = 0
+    for k in order:
+        w, h = sizes[k]
+        pw, ph = w + padding, h + padding
+        if pw > page_size or ph > page_size:
+            raise ValueError(f"Sprite '{k}' ({w}x{h}) no cabe en una página de atlas")
+        if x + pw > page_size:
+            x = 0; y += shelf_h; shelf_h = 0
+        if y + ph > page_size:
+            page += 1; x = y = shelf_h = 0
+        placements[k] = (page, x, y, w, h)
+        x += pw; shelf_h = max(shelf_h, ph)
+    return placements, (page + 1 if placements else 0)
+
+def _signature(sizes, page_size):
+    raw = json.dumps([page_size, sorted((k, list(v)) for k, v in sizes.items())])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+class SpriteAtlas:
+    """
+    Pocas superficies grandes con todos los sprites pequeños. Los dibujos
+    hacen blit de un sub-rect de la página (o usan su subsurface).
+    La disposición se guarda en disco y solo se recalcula si cambian los sprites.
+    """
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, layout_path=ATLAS_LAYOUT_PATH):
+        self.page_size = page_size
+        self.layout_path = layout_path
+        self.pages = []
+        self._regions = {}     # clave -> (pagina Surface, Rect)
+        self._subs = {}        # clave -> subsurface (creada bajo demanda)
+
+    def _load_layout(self, signature):
+        try:
+            with open(self.layout_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("signature") == signature:
+                return {k: tuple(v) for k, v in data["rects"].items()}, data["pages"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def _save_layout(self, signature, placements, n_pages):
+        try:
+            os.makedirs(os.path.dirname(self.layout_path) or ".", exist_ok=True)
+            with open(self.layout_path, "w", encoding="utf-8") as f:
+                json.dump({"signature": signature, "pages": n_pages,
+                           "rects": {k: list(v) for k, v in placements.items()}}, f)
+        except OSError as e:
+            print(f"[AVISO] No se pudo guardar el layout del atlas: {e}")
+
+    def build(self, sprites):
+        """sprites: {clave: Surface}. Reemplaza el contenido del atlas."""
+        sizes = {k: s.get_size() for k, s in sprites.items()}
+        signature = _signature(sizes, self.page_size)
+        layout = self._load_layout(signature)
+        if layout:
+            placements, n_pages = layout
+        else:
+            placements, n_pages = pack_rects(sizes, self.page_size)
+            self._save_layout(signature, placements, n_pages)
+
+        self.pages = []
+        for _ in range(n_pages):
+            page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA).convert_alpha()
+            page.fill((0,0,0,0))
+            self.pages.append(page)
+        self._regions.clear(); self._subs.clear()
+        for k, (p, x, y, w, h) in placements.items():
+            # ADD sobre transparente = copia exacta (incluye el alfa)
+            self.pages[p].blit(sprites[k], (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+            self._regions[k] = (self.pages[p], pygame.Rect(x, y, w, h))
+        print(f"[INFO] Atlas: {len(placements)} sprites en {n_pages} página(s)"
+              f"{' (layout en caché)' if layout else ''}")
+
+    def region(self, key):
+        """(página, Rect) del sprite o None si no está en el atlas."""
+        return self._regions.get(key)
+
+    def surface(self, key):
+        """Subsurface del sprite (vista sobre la página, sin copiar pixeles)."""
+        sub = self._subs.get(key)
+        if sub is None:
+            reg = self._regions.get(key)
+            if reg is None:
+                return None
+            sub = self._subs[key] = reg[0].subsurface(reg[1])
+        return sub
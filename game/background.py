@@ -1,62 +1,172 @@
 import pygame
 from .gif import load_gif_frames
-from .constants import ANCHO, ALTO
+from .constants import ANCHO, ALTO, BG_TRANSITION_MS, BG_TRANSITION_CURVE
+from .clips import open_clip
+from .loader import load_image
+from .manifest import get_manifest
 
 def _load_any_frames(path, size):
     """Carga frames desde GIF si aplica; si es PNG/JPG devuelve un frame."""
-    frames, durs = [], []
-    # Intento 1: como GIF
+    # el manifiesto conoce el formato: una sola decodificación directa
+    if get_manifest().format_of(path) == "gif":
+        return load_gif_frames(path, size=size)
     try:
-        frames, durs = load_gif_frames(path, size=size)
-        if frames:
-            return frames, durs
-    except Exception:
-        pass
-    # Intento 2: imagen estática
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        img = pygame.transform.smoothscale(img, size)
-        return [img], [120]
+        return [load_image(path, size)], [120]
     except Exception as e:
         print(f"[AVISO] No se pudo cargar fondo '{path}': {e}")
         surf = pygame.Surface(size, pygame.SRCALPHA)
         surf.fill((0,0,0,255))
         return [surf], [120]
 
+# Curvas de la transición: progreso lineal t (0..1) -> opacidad del fondo entrante
+CURVES = {
+    "linear":   lambda t: t,
+    "ease":     lambda t: t * t * (3.0 - 2.0 * t),
+    "dissolve": lambda t: t,   # mismo progreso, pero pixel a pixel (tramado)
+}
+
+def _bayer(n):
+    """Matriz de Bayer n x n (n potencia de 2) con umbrales 0..n*n-1."""
+    m = [[0]]
+    while len(m) < n:
+        k = len(m)
+        nm = [[0] * (2 * k) for _ in range(2 * k)]
+        for y in range(k):
+            for x in range(k):
+                v = 4 * m[y][x]
+                nm[y][x], nm[y][x + k] = v, v + 2
+                nm[y + k][x], nm[y + k][x + k] = v + 3, v + 1
+        m = nm
+    return m
+
+class Crossfade:
+    """
+    Mezcla de dos fondos sin crear Surfaces por frame: todo se reserva en
+    prepare() y se reutiliza.
+    - linear/ease: el frame entrante se copia a un scratch opaco con alfa de
+      superficie (la mezcla opaca es bastante más rápida que la per-pixel).
+    - dissolve: un mapa de umbrales de 8 bits (Bayer 16x16, 256 niveles) cuya
+      paleta se reescribe según el progreso; se pasa a una máscara y se
+      compone en el scratch con colorkey.
+    El coste por frame no depende de la duración de la transición.
+    """
+    KEY = (255, 255, 255)
+
+    def __init__(self, size=(ANCHO, ALTO), curve=BG_TRANSITION_CURVE):
+        self.size = size
+        self.curve = curve if curve in CURVES else "linear"
+        self._thresholds = self._mask = self._scratch = None
+        self.allocations = 0        # Surfaces creadas (solo en prepare)
+        self.frame_allocations = 0  # Surfaces creadas dentro de draw (debe ser 0)
+        self.frames = 0
+
+    def _alloc(self, *args, **kwargs):
+        self.allocations += 1
+        return pygame.Surface(*args, **kwargs)
+
+    def prepare(self):
+        """Reserva las superficies de la mezcla (al empezar la transición)."""
+        if self._scratch is not None:
+            return
+        self._scratch = self._alloc(self.size).convert()
+        if self.curve != "dissolve":
+            return
+        self._scratch.set_colorkey(self.KEY)
+        ramp = [(i, i, i) for i in range(256)]
+        tile = self._alloc((16, 16), depth=8); tile.set_palette(ramp)
+        for y, row in enumerate(_bayer(16)):
+            for x, v in enumerate(row):
+                tile.set_at((x, y), (v, v, v))
+        w, h = self.size
+        self._thresholds = self._alloc(self.size, depth=8)
+        self._thresholds.set_palette(ramp)
+        for y in range(0, h, 16):
+            for x in range(0, w, 16):
+                self._thresholds.blit(tile, (x, y))
+        self._mask = self._alloc(self.size).convert()
+
+    def release(self):
+        self._thresholds = self._mask = self._scratch = None
+
+    def _set_level(self, level, revealed, hidden):
+        self._thresholds.set_palette([revealed] * level + [hidden] * (256 - level))
+
+    def draw(self, surface, img_from, img_to, t):
+        """Dibuja img_from y encima img_to con progreso t (0..1)."""
+        before = self.allocations
+        self.frames += 1
+        t = CURVES[self.curve](max(0.0, min(1.0, t)))
+        surface.blit(img_from, (0, 0))
+        sc = self._scratch
+        if sc is None:
+            # sin prepare(): se modula el alfa del frame en el sitio (sin copia)
+            prev = img_to.get_alpha()
+            img_to.set_alpha(int(255 * t))
+            surface.blit(img_to, (0, 0))
+            img_to.set_alpha(prev)
+            self.frame_allocations += self.allocations - before
+            return
+        sc.blit(img_to, (0, 0))
+        if self.curve == "dissolve":
+            level = int(256 * t)
+            # 1) revelados <= 254 para no chocar con el colorkey
+            self._set_level(level, (254, 254, 254), (255, 255, 255))
+            self._mask.blit(self._thresholds, (0, 0))
+            sc.blit(self._mask, (0, 0), special_flags=pygame.BLEND_MIN)
+            # 2) ocultos = colorkey (dejan ver img_from)
+            self._set_level(level, (0, 0, 0), self.KEY)
+            self._mask.blit(self._thresholds, (0, 0))
+            sc.blit(self._mask, (0, 0), special_flags=pygame.BLEND_MAX)
+        else:
+            sc.set_alpha(int(255 * t))
+        surface.blit(sc, (0, 0))
+        self.frame_allocations += self.allocations - before
+
+    def stats(self):
+        return {"curve": self.curve, "frames": self.frames,
+                "allocations": self.allocations,
+                "frame_allocations": self.frame_allocations}
+
 class AnimatedBackground:
     def __init__(self, path_main="assets/scenes/fondo.gif", path_boss="assets/scenes/fondo-gf.gif"):
-        self.frames_a, self.durs_a = _load_any_frames(path_main, size=(ANCHO, ALTO))
-        self.frames_b, self.durs_b = _load_any_frames(path_boss, size=(ANCHO, ALTO))
+        # Clips compartidos vía registro, o en streaming si son muy pesados
+        self.clip_a = open_clip(path_main, (ANCHO, ALTO), loader=_load_any_frames)
+        self.clip_b = open_clip(path_boss, (ANCHO, ALTO), loader=_load_any_frames)
         self.use_b = False
-        self.idx_a = self.idx_b = 0
-        self.t_accum_a = self.t_accum_b = 0
         self.transition = False
         self.transition_time = 0.0
-        self.transition_duration = 1200
+        self.transition_duration = BG_TRANSITION_MS
         self.alpha = 0
+        self.fade = Crossfade((ANCHO, ALTO))
 
     def set_main_path(self, path_main):
         """Cambia el fondo principal (del nivel actual)."""
-        self.frames_a, self.durs_a = _load_any_frames(path_main, size=(ANCHO, ALTO))
-        self.idx_a = 0
-        self.t_accum_a = 0
+        clip = open_clip(path_main, (ANCHO, ALTO), loader=_load_any_frames)
+        self.clip_a.release()
+        self.clip_a = clip
+
+    def release(self):
+        """Suelta los clips (al reemplazar este fondo)."""
+        self.clip_a.release()
+        self.clip_b.release()
+        self.fade.release()
 
     def switch_to_boss(self):
         if not self.transition and not self.use_b:
             self.transition = True; self.transition_time = 0.0; self.alpha = 0
+            self.fade.prepare()
 
     def switch_to_main(self):
         if not self.transition and self.use_b:
             self.transition = True; self.transition_time = 0.0; self.alpha = 0
+            self.fade.prepare()
 
     def update(self, dt):
-        self.t_accum_a += dt
-        if self.t_accum_a >= self.durs_a[self.idx_a]:
-            self.t_accum_a = 0; self.idx_a = (self.idx_a + 1) % len(self.frames_a)
-
-        self.t_accum_b += dt
-        if self.t_accum_b >= self.durs_b[self.idx_b]:
-            self.t_accum_b = 0; self.idx_b = (self.idx_b + 1) % len(self.frames_b)
+        # Solo avanzan los clips visibles (el oculto no consume decodificación)
+        if self.transition or not self.use_b:
+            self.clip_a.update(dt)
+        if self.transition or self.use_b:
+            self.clip_b.update(dt)
 
         if self.transition:
             self.transition_time += dt
@@ -68,13 +178,10 @@ class AnimatedBackground:
 
     def draw(self, surface):
         if not self.transition:
-            surface.blit((self.frames_b if self.use_b else self.frames_a)[self.idx_b if self.use_b else self.idx_a], (0,0))
+            (self.clip_b if self.use_b else self.clip_a).draw(surface)
         else:
+            t = min(1.0, self.transition_time / self.transition_duration)
             if not self.use_b:
-                img_a = self.frames_a[self.idx_a]
-                img_b = self.frames_b[self.idx_b].copy(); img_b.set_alpha(self.alpha)
-                surface.blit(img_a,(0,0)); surface.blit(img_b,(0,0))
+                self.fade.draw(surface, self.clip_a.frame, self.clip_b.frame, t)
             else:
-                img_b = self.frames_b[self.idx_b]
-                img_a = self.frames_a[self.idx_a].copy(); img_a.set_alpha(self.alpha)
-                surface.blit(img_b,(0,0)); surface.blit(img_a,(0,0))
+                self.fade.draw(surface, self.clip_b.frame, self.clip_a.frame, t)
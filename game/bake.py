@@ -0,0 +1,161 @@
+"""
+Horneado offline de assets: `python -m game.bake`
+
+Recorre los assets que usan los cargadores y escribe un único bundle con los
+pixeles ya decodificados y escalados. En tiempo de ejecución se lee con mmap.
+Es incremental: las entradas cuyo archivo fuente no cambió (hash de contenido)
+se copian del bundle anterior sin volver a decodificar.
+"""
+import os, sys, json, hashlib, argparse, time
+from .constants import (
+    ANCHO, ALTO, ASTEROID_W, ASTEROID_H, PLAYER_W, PLAYER_H, BOSS_W, BOSS_H,
+    LEVEL_COUNT, LEVEL_PLANET_DIR, LEVEL_MENU_BG, BUNDLE_PATH,
+)
+from .bundle import MAGIC, VERSION, HEADER, bundle_key, read_index
+from .manifest import get_manifest
+
+def collect_jobs():
+    """(ruta, tamaño, formato) de todo lo que piden los cargadores del juego."""
+    jobs = []
+    # assets.py
+    jobs.append(("assets/extra/asteroides.gif", (ASTEROID_W, ASTEROID_H), "gif"))
+    jobs.append(("assets/extra/nave.gif", (PLAYER_W, PLAYER_H), "gif"))
+    for ruta in ("assets/extra/nave-f.gif", "assets/extra/nave-m.gif", "assets/extra/nave-t.gif"):
+        jobs.append((ruta, (PLAYER_W, PLAYER_H), "image"))
+    jobs.append(("assets/personajes/jefe.gif", (BOSS_W, BOSS_H), "gif"))
+    manifest = get_manifest()
+    for planet_id in range(1, LEVEL_COUNT + 1):
+        found = manifest.resolve(f"boss:planet:{planet_id}")
+        if found:
+            jobs.append((found[0], (BOSS_W, BOSS_H), found[1]))
+    jobs.append(("assets/extra/bala.png", (14, 30), "image"))
+    jobs.append(("assets/extra/bala-2.png", (24, 32), "image"))
+    # background.py / menu_bg.py
+    for ruta in ("assets/scenes/fondo.gif", "assets/scenes/fondo-gf.gif", "assets/scenes/space.gif"):
+        jobs.append((ruta, (ANCHO, ALTO), "gif"))
+    for n in range(1, LEVEL_COUNT + 1):
+        found = manifest.resolve(f"bg:level:{n}")
+        if found:
+            jobs.append((found[0], (ANCHO, ALTO), found[1]))
+    # character.py
+    for ruta in ("assets/extra/nave.gif", "assets/extra/nave-f.jpg",
+                 "assets/extra/nave-m.gif", "assets/extra/nave-t.gif"):
+        jobs.append((ruta, (100, 100), "gif"))
+    # level_select.py y selector de planetas de app.py
+    jobs.append((LEVEL_MENU_BG, (ANCHO, ALTO), "image"))
+    for i in range(1, LEVEL_COUNT + 1):
+        ruta = os.path.join(LEVEL_PLANET_DIR, f"{i}.png").replace("\\", "/")
+        jobs.append((ruta, (100, 100), "image"))
+        jobs.append((ruta, (88, 88), "image"))
+    # solo lo que existe en disco
+    return [j for j in jobs if manifest.exists(j[0])]
+
+def _file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _decode(path, size, fmt):
+    if fmt == "gif":
+        from .gif import iter_gif_raw
+        out_size, frames, durs = None, [], []
+        for out_size, data, dur in iter_gif_raw(path, size):
+            frames.append(data); durs.append(dur)
+        return out_size, frames, durs
+    from .loader import _decode_image_raw
+    return _decode_image_raw(path, size)
+
+def _read_old(path):
+    """Índice y archivo abierto del bundle anterior (para reutilizar entradas)."""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return {}, None
+    try:
+        index = read_index(f)
+    except ValueError:
+        index = None
+    if index is None:
+        f.close()
+        return {}, None
+    return index, f
+
+def bake(out_path=BUNDLE_PATH, verbose=True):
+    t0 = time.perf_counter()
+    old_index, old_f = _read_old(out_path)
+    entries = []   # (clave, meta, fuente de pixeles)
+    seen = set()
+    reused = decoded = 0
+    try:
+        for path, size, fmt in collect_jobs():
+            key = bundle_key(path, size, fmt)
+            if key in seen:
+                continue
+            seen.add(key)
+            st = os.stat(path)
+            digest = _file_hash(path)
+            old = old_index.get(key)
+            meta = {"src_mtime": st.st_mtime_ns, "src_size": st.st_size, "hash": digest}
+            if old and old.get("hash") == digest and old_f:
+                n = old["w"] * old["h"] * 4 * len(old["durations"])
+                old_f.seek(old["offset"]); data = old_f.read(n)
+                meta.update(w=old["w"], h=old["h"], durations=old["durations"])
+                entries.append((key, meta, [data]))
+                reused += 1
+            else:
+                try:
+                    (w, h), frames, durs = _decode(path, size, fmt)
+                except Exception as e:
+                    print(f"[AVISO] No se pudo hornear '{path}': {e}")
+                    continue
+                meta.update(w=w, h=h, durations=durs)
+                entries.append((key, meta, frames))
+                decoded += 1
+                if verbose:
+                    print(f"[INFO] Horneado {key} ({len(durs)} frames)")
+    finally:
+        if old_f:
+            old_f.close()
+
+    # Offsets: se calculan con un índice provisional y se repite hasta estabilizar
+    index = {key: meta for key, meta, _ in entries}
+    base = 0
+    while True:
+        off = base
+        for key, meta, chunks in entries:
+            meta["offset"] = off
+            off += sum(len(c) for c in chunks)
+        blob = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        new_base = HEADER.size + len(blob)
+        if new_base == base:
+            break
+        base = new_base
+
+    tmp = out_path + ".tmp"
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(blob)))
+        f.write(blob)
+        for _, _, chunks in entries:
+            for c in chunks:
+                f.write(c)
+    os.replace(tmp, out_path)
+    if verbose:
+        print(f"[INFO] Bundle '{out_path}': {len(entries)} assets "
+              f"({decoded} decodificados, {reused} reutilizados), "
+              f"{os.path.getsize(out_path) / (1024*1024):.1f} MB en "
+              f"{(time.perf_counter() - t0):.1f} s")
+    return out_path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hornea los assets en un bundle mmap-able.")
+    parser.add_argument("-o", "--output", default=BUNDLE_PATH, help="ruta del bundle")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    bake(args.output, verbose=not args.quiet)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
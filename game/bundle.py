@@ -0,0 +1,110 @@
+import os, json, mmap, struct
+import pygame
+from .constants import BUNDLE_PATH
+
+# Formato del bundle (little endian):
+#   magic(4) version(u16) largo_indice(u32)
+#   índice JSON: {clave: {src_mtime, src_size, hash, w, h, durations, offset}}
+#   pixeles RGBA de todas las entradas (offset relativo al inicio del archivo)
+MAGIC = b"SABD"
+VERSION = 2   # v2: frames duplicados consecutivos ya fundidos
+HEADER = struct.Struct("<4sHI")
+
+def bundle_key(path, size, fmt):
+    # "opaque" comparte pixeles con "image"; solo cambia la conversión final
+    fmt = "image" if fmt == "opaque" else fmt
+    return f"{path}|{size[0]}x{size[1]}|{fmt}"
+
+def read_index(f):
+    """Lee la cabecera y el índice de un bundle abierto; None si no es válido."""
+    head = f.read(HEADER.size)
+    if len(head) != HEADER.size:
+        return None
+    magic, version, index_len = HEADER.unpack(head)
+    if magic != MAGIC or version != VERSION:
+        return None
+    return json.loads(f.read(index_len).decode("utf-8"))
+
+class Bundle:
+    """Bundle horneado por `python -m game.bake`, mapeado en memoria."""
+    def __init__(self, path=BUNDLE_PATH):
+        self.path = path
+        self.index = {}
+        self._mm = None
+        try:
+            with open(path, "rb") as f:
+                index = read_index(f)
+                if index is None:
+                    print(f"[AVISO] Bundle '{path}' inválido; se ignora")
+                    return
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.index = index
+            print(f"[INFO] Bundle: {len(index)} assets horneados")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[AVISO] No se pudo abrir el bundle '{path}': {e}")
+
+    def _entry(self, path, size, fmt):
+        if not self.index or not size:
+            return None
+        e = self.index.get(bundle_key(path, size, fmt))
+        if e is None:
+            return None
+        # si el archivo fuente cambió desde el horneado, no sirve
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if st.st_mtime_ns != e["src_mtime"] or st.st_size != e["src_size"]:
+            return None
+        return e
+
+    def has(self, path, size, fmt):
+        return self._entry(path, size, fmt) is not None
+
+    def frame_info(self, path, size, fmt="gif"):
+        """((w, h), n_frames) de una entrada horneada, o None."""
+        e = self._entry(path, size, fmt)
+        return ((e["w"], e["h"]), len(e["durations"])) if e else None
+
+    def iter_raw(self, path, size, fmt="gif"):
+        """Generador (out_size, bytes RGBA, duración) o None si no está horneado."""
+        e = self._entry(path, size, fmt)
+        if e is None:
+            return None
+        w, h = e["w"], e["h"]
+        frame_bytes = w * h * 4
+        def _gen():
+            for i, dur in enumerate(e["durations"]):
+                start = e["offset"] + i * frame_bytes
+                yield (w, h), self._mm[start:start + frame_bytes], dur
+        return _gen()
+
+    def load(self, path, size, fmt="gif"):
+        """(frames, durations) convertidos desde el bundle, o None."""
+        e = self._entry(path, size, fmt)
+        if e is None:
+            return None
+        w, h = e["w"], e["h"]
+        frame_bytes = w * h * 4
+        frames = []
+        mv = memoryview(self._mm)
+        try:
+            for i in range(len(e["durations"])):
+                start = e["offset"] + i * frame_bytes
+                raw = pygame.image.frombuffer(mv[start:start + frame_bytes], (w, h), "RGBA")
+                frames.append(raw.convert() if fmt == "opaque" else raw.convert_alpha())
+                del raw
+        finally:
+            mv.release()
+        return frames, list(e["durations"])
+
+_BUNDLE = None
+
+def get_bundle():
+    """Bundle compartido (se abre la primera vez que se pide)."""
+    global _BUNDLE
+    if _BUNDLE is None:
+        _BUNDLE = Bundle()
+    return _BUNDLE
@@ -1,4 +1,5 @@
 from .constants import CAM_LERP, CAM_FACTOR, CAM_MAX
+from .timestep import SIM
 import pygame
 
 class Camera:
@@ -13,8 +14,10 @@ class Camera:
         return tx, ty
 
     def update(self, tx, ty):
-        self.x += (tx - self.x) * CAM_LERP
-        self.y += (ty - self.y) * CAM_LERP
+        # CAM_LERP está pensado por paso de 60 Hz; se ajusta a la frecuencia de simulación
+        k = CAM_LERP if SIM.scale == 1.0 else 1.0 - (1.0 - CAM_LERP) ** SIM.scale
+        self.x += (tx - self.x) * k
+        self.y += (ty - self.y) * k
 
     def apply_point(self, x, y):
         return int(x + self.x), int(y + self.y)
@@ -1,5 +1,6 @@
 import pygame
 from . import assets as Assets
+from .registry import REGISTRY
 from .constants import ANCHO, ALTO, SHIP_ORDER, SHIP_DISPLAY, MENU_CHARACTER, BLANCO, AMARILLO, AZUL, MORADO
 
 # --- util para GIFs (con fallback si no hay Pillow) ---
@@ -7,6 +8,11 @@ def _load_frames(path, size=(100, 100)):
     """
     Carga un GIF o imagen estática con compatibilidad total.
     """
+    from .loader import take_preloaded
+    from .bundle import get_bundle
+    pre = take_preloaded("gif", path, size) or get_bundle().load(path, size, "gif")
+    if pre:
+        return pre
     try:
         from PIL import Image, ImageSequence
         img = Image.open(path)
@@ -45,10 +51,10 @@ class CharacterSelect:
 
         # Cargar frames (GIFs animados incluidos)
         self.previews = {
-            "BRAYAN":   _load_frames("assets/extra/nave.gif",   (100, 100)),
-            "FERNANDA": _load_frames("assets/extra/nave-f.jpg", (100, 100)),
-            "MARLIN":   _load_frames("assets/extra/nave-m.gif", (100, 100)),
-            "TETE":     _load_frames("assets/extra/nave-t.gif", (100, 100)),
+            "BRAYAN":   REGISTRY.acquire("assets/extra/nave.gif",   (100, 100), "gif", loader=_load_frames),
+            "FERNANDA": REGISTRY.acquire("assets/extra/nave-f.jpg", (100, 100), "gif", loader=_load_frames),
+            "MARLIN":   REGISTRY.acquire("assets/extra/nave-m.gif", (100, 100), "gif", loader=_load_frames),
+            "TETE":     REGISTRY.acquire("assets/extra/nave-t.gif", (100, 100), "gif", loader=_load_frames),
         }
 
         # Estado de animación por nave
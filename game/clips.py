@@ -0,0 +1,201 @@
+import threading, queue
+import pygame
+from .constants import (
+    ANCHO, ALTO, BG_STREAM_MIN_BYTES, BG_STREAM_RING, GIF_DELTA_ENABLED, GIF_DELTA_MIN_SAVING,
+)
+from .gif import pil_ok, iter_gif_raw, frames_from_raw, delta_encode
+from .gif_cache import iter_cached_raw, cached_frame_info
+from .bundle import get_bundle
+from .registry import REGISTRY, _default_loader, _surface_bytes
+
+class FrameClip:
+    """Animación con todos los frames en memoria (compartidos vía registro)."""
+    def __init__(self, path, size, loader=None):
+        self.path, self.size = path, size
+        self.frames, self.durations = REGISTRY.acquire(path, size, "gif", loader=loader)
+        self.idx = 0
+        self.t_accum = 0
+
+    @property
+    def frame(self):
+        return self.frames[self.idx]
+
+    def update(self, dt):
+        self.t_accum += dt
+        if self.t_accum >= self.durations[self.idx]:
+            self.t_accum = 0; self.idx = (self.idx + 1) % len(self.frames)
+
+    def draw(self, surface):
+        surface.blit(self.frame, (0,0))
+
+    def release(self):
+        REGISTRY.release(self.path, self.size, "gif")
+
+def _to_deltas(path, frames, boxes=None):
+    """[(rect, parche)] si los deltas ahorran memoria; si no, frames completos."""
+    full_bytes = _surface_bytes(frames)
+    full = pygame.Rect((0, 0), frames[0].get_size())
+    if len(frames) < 2:
+        return [(full, f) for f in frames]
+    deltas = delta_encode(frames, boxes)
+    # el lienzo donde se aplican los parches cuenta como un frame más
+    delta_bytes = _surface_bytes(deltas) + _surface_bytes(frames[:1])
+    if delta_bytes > full_bytes * (1.0 - GIF_DELTA_MIN_SAVING):
+        return [(full, f) for f in frames]
+    area = sum(r.w * r.h for r, _ in deltas[1:] if r) / (full.w * full.h * (len(deltas) - 1))
+    print(f"[INFO] Deltas '{path}': {full_bytes / 2**20:.1f} -> {delta_bytes / 2**20:.1f} MB, "
+          f"área media por frame {area:.0%}")
+    return deltas
+
+def _delta_loader(loader):
+    """Envuelve un cargador de frames para que devuelva deltas si compensan."""
+    def _load(path, size):
+        frames, durations = (loader or (lambda p, s: _default_loader(p, s, "gif")))(path, size)
+        return _to_deltas(path, frames), durations
+    return _load
+
+class DeltaClip:
+    """
+    Como FrameClip, pero guarda el primer frame completo y de los demás solo
+    el rectángulo que cambia. Los parches se aplican sobre un lienzo propio
+    con un blit de sub-rect. Si los deltas no ahorran memoria se usan los
+    frames completos tal cual (sin lienzo).
+    """
+    def __init__(self, path, size, loader=None):
+        self.path, self.size = path, size
+        self.deltas, self.durations = REGISTRY.acquire(path, size, "delta", loader=_delta_loader(loader))
+        self.idx = 0
+        self.t_accum = 0
+        full = pygame.Rect((0, 0), self.deltas[0][1].get_size())
+        if all(r == full for r, _ in self.deltas):
+            self._canvas = None
+        else:
+            self._canvas = self.deltas[0][1].copy()
+
+    @property
+    def frame(self):
+        return self._canvas if self._canvas is not None else self.deltas[self.idx][1]
+
+    def _apply(self, idx):
+        rect, patch = self.deltas[idx]
+        if patch is None:
+            return
+        # copia exacta (también el alfa): limpiar y sumar
+        self._canvas.fill((0,0,0,0), rect)
+        self._canvas.blit(patch, rect, special_flags=pygame.BLEND_RGBA_ADD)
+
+    def update(self, dt):
+        self.t_accum += dt
+        if self.t_accum >= self.durations[self.idx]:
+            self.t_accum = 0; self.idx = (self.idx + 1) % len(self.deltas)
+            if self._canvas is not None:
+                self._apply(self.idx)
+
+    def draw(self, surface):
+        surface.blit(self.frame, (0,0))
+
+    def release(self):
+        REGISTRY.release(self.path, self.size, "delta")
+
+class StreamingClip:
+    """
+    Animación decodificada bajo demanda: un hilo compone los frames y los deja
+    en una cola acotada (anillo de BG_STREAM_RING frames) por delante del
+    cabezal. La memoria residente es O(anillo) en vez de O(frames).
+    Si el hilo va atrasado se mantiene el frame actual en lugar de esperar.
+    """
+    def __init__(self, path, size, ring=BG_STREAM_RING):
+        self.path, self.size = path, size
+        self._queue = queue.Queue(maxsize=ring)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+        self.frame = None
+        self.duration = 100
+        self.t_accum = 0
+        # El primer frame se espera para no mostrar un fondo vacío
+        if not self._advance(block=True):
+            print(f"[AVISO] No se pudo abrir fondo en streaming '{path}'")
+            self.frame = pygame.Surface(size, pygame.SRCALPHA)
+            self.frame.fill((0,0,0,255))
+
+    def _worker(self):
+        try:
+            while not self._stop.is_set():
+                # bundle horneado o caché en disco: basta leer; si no, Pillow
+                source = (get_bundle().iter_raw(self.path, self.size, "gif")
+                          or iter_cached_raw(self.path, self.size)
+                          or iter_gif_raw(self.path, self.size))
+                for item in source:
+                    while not self._stop.is_set():
+                        try:
+                            self._queue.put(item, timeout=0.1); break
+                        except queue.Full:
+                            continue
+                    if self._stop.is_set():
+                        return
+        except Exception as e:
+            print(f"[AVISO] Error decodificando '{self.path}' en streaming: {e}")
+
+    def _advance(self, block=False):
+        try:
+            out_size, data, dur = self._queue.get(block=block, timeout=2.0 if block else None)
+        except queue.Empty:
+            return False
+        self.frame = frames_from_raw(out_size, [data])[0]
+        self.duration = dur
+        return True
+
+    def update(self, dt):
+        self.t_accum += dt
+        if self.t_accum >= self.duration and self._advance():
+            self.t_accum = 0
+
+    def draw(self, surface):
+        surface.blit(self.frame, (0,0))
+
+    def release(self):
+        self._stop.set()
+
+def should_stream(path, size):
+    """True si el GIF completo en memoria superaría BG_STREAM_MIN_BYTES."""
+    # bundle o caché ya saben cuántos frames hay; Pillow solo como último recurso
+    info = get_bundle().frame_info(path, size, "gif") or cached_frame_info(path, size)
+    if info:
+        (w, h), n = info
+    elif not pil_ok():
+        return False
+    else:
+        try:
+            from PIL import Image
+            with Image.open(path) as im:
+                n = getattr(im, "n_frames", 1)
+                w, h = size or im.size
+        except Exception:
+            return False
+    return n > 1 and w * h * 4 * n > BG_STREAM_MIN_BYTES
+
+def clip_format(size):
+    """Formato de registro con el que open_clip guarda una animación en memoria."""
+    return "delta" if GIF_DELTA_ENABLED and tuple(size) == (ANCHO, ALTO) else "gif"
+
+def hold_frames(path, size, frames, durations, boxes=None):
+    """
+    Retiene en el registro frames ya decodificados con la clave que usará
+    open_clip (p. ej. desde la precarga). Devuelve el formato usado.
+    """
+    fmt = clip_format(size)
+    if fmt == "delta":
+        loader = lambda p, s: (_to_deltas(p, frames, boxes), durations)
+    else:
+        loader = lambda p, s: (frames, durations)
+    REGISTRY.acquire(path, size, fmt, loader=loader)
+    return fmt
+
+def open_clip(path, size, loader=None):
+    """Elige streaming o frames en memoria según el tamaño de la animación."""
+    if should_stream(path, size):
+        return StreamingClip(path, size)
+    if clip_format(size) == "delta":
+        return DeltaClip(path, size, loader=loader)
+    return FrameClip(path, size, loader=loader)
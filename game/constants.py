@@ -54,6 +54,8 @@ BOSS_INTRO_MS = 1200
 # Sprites
 ASTEROID_W, ASTEROID_H = 40, 40
 PLAYER_W, PLAYER_H = 60, 60
+PLAYER_TILT_MAX = 22.0   # inclinación máxima de la nave (grados)
+PLAYER_ROT_STEP = 1.0    # paso de la caché de rotaciones (grados)
 BOSS_W, BOSS_H = 220, 100
 
 # Cámara
@@ -72,3 +74,82 @@ DIFFICULTY_PRESETS = {
 DIFFICULTY_ORDER = ["BAJA", "MEDIA", "ALTA", "EXTREMA"]
 
 STORY_INTRO = "STORY_INTRO"  # nueva pantalla de narración
+
+# Caché en disco de frames de GIF ya decodificados
+GIF_CACHE_ENABLED = True
+GIF_CACHE_DIR = ".cache/gif"
+GIF_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Hilos para la carga paralela de assets al inicio (0 = automático)
+ASSET_WORKERS = 0
+
+# Presupuesto de memoria de surfaces del registro de assets (bytes)
+ASSET_MEMORY_BUDGET = 192 * 1024 * 1024
+
+# Fondos en streaming: se decodifican bajo demanda en un hilo cuando
+# tenerlos completos en memoria superaría este tamaño (bytes)
+BG_STREAM_MIN_BYTES = 24 * 1024 * 1024
+BG_STREAM_RING = 4   # frames decodificados por adelantado
+
+# Atlas de sprites pequeños (asteroides, naves, balas, jefes)
+ATLAS_PAGE_SIZE = 1024
+ATLAS_LAYOUT_PATH = ".cache/atlas.json"
+
+# Bundle de assets horneados (`python -m game.bake`)
+BUNDLE_PATH = "assets/baked.bundle"
+
+# Precarga de fondos de nivel en el selector de planetas
+PREFETCH_CACHE_SIZE = 3          # fondos retenidos
+PREFETCH_CONVERT_PER_FRAME = 2   # frames convertidos a Surface por frame de juego
+
+# Fondos animados en memoria como deltas (solo el rectángulo que cambia)
+GIF_DELTA_ENABLED = True
+GIF_DELTA_MIN_SAVING = 0.15   # ahorro mínimo de memoria para usar deltas
+
+# Presupuesto de tiempo hasta el primer frame (`main.py --startup-budget`)
+STARTUP_BUDGET_MS = 2500
+
+# Caché de niveles de zoom del fondo de menú
+MENU_ZOOM_STEP = 0.005                    # zoom cuantizado (1.0, 1.005, ...)
+MENU_ZOOM_CACHE_BYTES = 32 * 1024 * 1024  # frames escalados retenidos
+
+# Caché de textos renderizados (dibujar_texto)
+TEXT_CACHE_SIZE = 512
+
+# Presentación por rectángulos sucios en pantallas casi estáticas
+DIRTY_RECTS_ENABLED = True
+DIRTY_MAX_AREA_RATIO = 0.5   # por encima de esta fracción de pantalla, flip completo
+
+# Transición de fondo (nivel <-> jefe)
+BG_TRANSITION_MS = 1200
+BG_TRANSITION_CURVE = "linear"   # "linear" | "ease" | "dissolve"
+
+# Pool de superficies translúcidas (láser del jefe, bandas de cine)
+OVERLAY_POOL_SIZE = 16   # superficies retenidas (LRU)
+
+# Presentación: la escena se dibuja siempre a ANCHO x ALTO (resolución interna)
+# y SDL la escala a la ventana / pantalla completa (pygame.SCALED)
+DISPLAY_SCALED = True
+
+# Simulación a paso fijo: la lógica avanza a SIM_HZ pasos por segundo sea cual
+# sea el refresco de pantalla (FPS solo limita los frames dibujados)
+SIM_HZ = 120
+SIM_BASE_HZ = 60      # las velocidades del juego están en px por frame a 60 Hz
+SIM_MAX_STEPS = 8     # tope de pasos por frame (evita la espiral de la muerte)
+
+# Colisiones: rejilla uniforme (spatial hash) para la fase amplia
+SPATIAL_CELL = 64     # lado de celda en px (algo mayor que un asteroide)
+# Por debajo de SPATIAL_MIN_ITEMS objetos las consultas recorren la lista con
+# collidelist (en C). Medido con `python tools/bench.py spatial`: la rejilla
+# solo gana a partir de unos 400 objetos por lista, así que en una partida
+# normal (12 asteroides, pocas balas) no se llega a montar; queda para estrés.
+SPATIAL_MIN_ITEMS = 384
+
+# Balas del jefe en estructura de arrays (game/projectiles.py)
+PROJECTILE_CAPACITY = 256       # capacidad inicial (crece duplicando)
+PROJECTILE_BACKEND = "auto"     # "auto" = NumPy si está instalado, "python" = listas
+
+# Reservas de entidades (game/pool.py): objetos libres que se retienen para reutilizar
+POOL_BULLETS = 256
+POOL_POWERUPS = 16
+POOL_BOMBS = 8
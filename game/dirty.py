@@ -0,0 +1,59 @@
+import pygame
+from .constants import ANCHO, ALTO, DIRTY_RECTS_ENABLED, DIRTY_MAX_AREA_RATIO
+
+class DirtyPresenter:
+    """
+    Presentación por rectángulos sucios para pantallas casi estáticas.
+    Cada frame el estado declara sus regiones como {nombre: (Rect, clave)};
+    una región está sucia si su clave cambió desde el frame anterior.
+    begin() decide:
+      None -> redibujar todo y flip (estado dinámico, cambio de estado o
+              demasiada área sucia),
+      []   -> nada cambió: ni dibujar ni presentar,
+      rects -> redibujar y presentar solo esos rects con display.update.
+    """
+    def __init__(self, size=(ANCHO, ALTO), max_ratio=DIRTY_MAX_AREA_RATIO, enabled=DIRTY_RECTS_ENABLED):
+        self.area = size[0] * size[1]
+        self.max_ratio = max_ratio
+        self.enabled = enabled
+        self._prev = None
+        self.frames = self.flips = self.partial = self.skipped = 0
+        self.pixels = 0   # pixeles presentados (fill rate)
+
+    def invalidate(self):
+        """Forzar un frame completo (cambio de modo de vídeo, ventana expuesta...)."""
+        self._prev = None
+
+    def begin(self, regions):
+        self.frames += 1
+        if not self.enabled or regions is None:
+            self._prev = None
+            return None
+        prev, self._prev = self._prev, regions
+        if prev is None or prev.keys() != regions.keys():
+            return None
+        rects = [rect for name, (rect, key) in regions.items() if prev[name][1] != key]
+        if not rects:
+            return rects
+        if sum(r.width * r.height for r in rects) > self.area * self.max_ratio:
+            return None
+        return rects
+
+    def present(self, rects):
+        if rects is None:
+            pygame.display.flip()
+            self.flips += 1
+            self.pixels += self.area
+        elif rects:
+            pygame.display.update(rects)
+            self.partial += 1
+            self.pixels += sum(r.width * r.height for r in rects)
+        else:
+            self.skipped += 1
+
+    def stats(self):
+        return {
+            "frames": self.frames, "flips": self.flips,
+            "partial": self.partial, "skipped": self.skipped,
+            "fill_ratio": self.pixels / (self.area * self.frames) if self.frames else 0.0,
+        }
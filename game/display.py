@@ -0,0 +1,45 @@
+import warnings
+import pygame
+from .constants import ANCHO, ALTO, DISPLAY_SCALED
+
+_SCALED = False   # lo que eligió open_display (se reutiliza al recrear el modo)
+
+def _set_mode(size, scaled, fullscreen=False):
+    global _SCALED
+    flags = pygame.FULLSCREEN if fullscreen else 0
+    if scaled:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")   # "no fast renderer available"
+                screen = pygame.display.set_mode(size, flags | pygame.SCALED)
+            _SCALED = True
+            return screen
+        except pygame.error as e:
+            print(f"[AVISO] Escalado SCALED no disponible: {e}")
+    _SCALED = False
+    return pygame.display.set_mode(size, flags)
+
+def open_display(size=(ANCHO, ALTO), scaled=DISPLAY_SCALED):
+    """
+    Ventana con resolución interna fija. Con SCALED el renderer de SDL escala
+    la superficie a la ventana (factor entero) o a la pantalla completa, así
+    el coste de dibujo no depende del tamaño del monitor.
+    """
+    return _set_mode(size, scaled)
+
+def toggle_fullscreen(fullscreen, size=(ANCHO, ALTO)):
+    """
+    Cambia a (o sale de) pantalla completa y devuelve la superficie de pantalla.
+    Con SCALED es un cambio de ventana del renderer: no hay set_mode, la
+    superficie y los sprites convertidos siguen valiendo. Si el driver no lo
+    permite (excepción o devuelve 0) se recrea el modo de vídeo con los
+    mismos flags que eligió open_display, SCALED incluido.
+    """
+    screen = pygame.display.get_surface()
+    if screen is not None and screen.get_flags() & pygame.SCALED:
+        try:
+            if pygame.display.toggle_fullscreen():
+                return pygame.display.get_surface()
+        except pygame.error:
+            pass
+    return _set_mode(size, _SCALED, fullscreen)
@@ -1,6 +1,68 @@
 import pygame, random, math
 from .. import assets as Assets
 from ..constants import ANCHO, ALTO, BOSS_W, BOSS_H
+from ..overlay import OVERLAYS
+from ..render_queue import LAYER_ENEMIES, LAYER_BOSS_FX, LAYER_ENEMY_SHOTS
+from ..timestep import SIM, Motion
+from ..projectiles import KIND_LINEAR, KIND_WAVE
+
+# Color por tipo de bala del jefe
+BULLET_COLORS = {
+    "normal": (255,140,0), "wave": (255,200,0), "aim": (255,80,80),
+    "spread": (255,160,60), "burst": (255,100,0),
+}
+GLOW_PAD = 4
+_BULLET_SPRITES = {}   # (tipo, w, h, variante) -> (Surface, dx, dy, ancho, alto)
+_SPRITE_IDS = {}       # (tipo, w, h, variante) -> id guardado en el almacén de balas
+_SPRITE_KEYS = []      # id -> (tipo, w, h, variante)
+_SPRITE_TABLE = []     # id -> sprite resuelto (None hasta el primer dibujo)
+
+def bullet_sprite(tipo, w, h, variant="plain"):
+    """
+    Sprite prearmado de una bala del jefe: (Surface, dx, dy, ancho, alto), con
+    el desplazamiento respecto al rect de la bala.
+    Variantes: "plain" (rect sólido, como antes) y "glow" (halo translúcido).
+    """
+    key = (tipo, w, h, variant)
+    spr = _BULLET_SPRITES.get(key)
+    if spr is None:
+        color = BULLET_COLORS.get(tipo, BULLET_COLORS["normal"])
+        if variant == "glow":
+            p = GLOW_PAD
+            surf = pygame.Surface((w + 2*p, h + 2*p), pygame.SRCALPHA)
+            pygame.draw.rect(surf, color + (60,), surf.get_rect(), border_radius=p + 2)
+            pygame.draw.rect(surf, color + (120,), surf.get_rect().inflate(-p, -p), border_radius=p)
+            surf.fill(color, (p, p, w, h))
+            spr = (surf, -p, -p, w + 2*p, h + 2*p)
+        else:
+            surf = pygame.Surface((w, h)).convert()
+            surf.fill(color)
+            spr = (surf, 0, 0, w, h)
+        _BULLET_SPRITES[key] = spr
+    return spr
+
+def bullet_sprite_id(tipo, w, h, variant="plain"):
+    """Id entero de sprite para guardar en el almacén de balas."""
+    key = (tipo, w, h, variant)
+    sid = _SPRITE_IDS.get(key)
+    if sid is None:
+        sid = _SPRITE_IDS[key] = len(_SPRITE_KEYS)
+        _SPRITE_KEYS.append(key)
+        _SPRITE_TABLE.append(None)
+    return sid
+
+def submit_bullets(queue, bullets):
+    """Envía las balas del jefe a la cola (se vuelcan en un solo blits)."""
+    sprites = []
+    add = sprites.append
+    table = _SPRITE_TABLE
+    for x, y, sid in bullets.positions(queue.alpha):
+        spr = table[sid]
+        if spr is None:   # se resuelve en el primer dibujo (necesita la pantalla)
+            spr = table[sid] = bullet_sprite(*_SPRITE_KEYS[sid])
+        surf, dx, dy, w, h = spr
+        add((surf, x + dx, y + dy, w, h))
+    queue.submit_many(LAYER_ENEMY_SHOTS, sprites)
 
 class Boss:
     """
@@ -18,6 +80,11 @@ class Boss:
             frames, durs = Assets.cargar_boss_por_planeta(planet_id)
             self.frames = frames
             self.frame_durations = durs
+            # sub-rects del atlas si estos frames son los del rol "boss"
+            if Assets.sprite("boss")[0] is frames:
+                self.regions = Assets.regions("boss")
+            else:
+                self.regions = [(f, f.get_rect()) for f in frames]
             self.image = self.frames[0]
             self.current_frame = 0
             print(f"[INFO] Boss actualizado para planeta {planet_id}")
@@ -25,6 +92,7 @@ class Boss:
             print(f"[ERROR] No se pudo cargar el boss para planeta {planet_id}: {e}")
         self.w, self.h = BOSS_W, BOSS_H
         self.rect = pygame.Rect(ANCHO//2 - self.w//2, 60, self.w, self.h)
+        self.motion = Motion(self.rect)
         base_hp = 160 + (level-1)*80
         self.hp_max = int(base_hp * difficulty_hp_mul)
         self.hp = self.hp_max
@@ -47,9 +115,10 @@ class Boss:
         self.laser_start_t=0
         self.laser_x = ANCHO//2
 
-    def _shoot(self, boss_bullets, x, y, vx, vy, tipo="normal", w=10, h=18):
-        boss_bullets.append({"rect": pygame.Rect(int(x-w/2), int(y), w, h),
-                             "vx": vx, "vy": vy, "type": tipo})
+    def _shoot(self, boss_bullets, x, y, vx, vy, tipo="normal", w=10, h=18, sprite="plain"):
+        boss_bullets.spawn(int(x-w/2), int(y), w, h, vx, vy,
+                           KIND_WAVE if tipo == "wave" else KIND_LINEAR,
+                           bullet_sprite_id(tipo, w, h, sprite))
 
     def _aim_to_player(self, player_rect, speed):
         px, py = player_rect.centerx, player_rect.centery
@@ -89,11 +158,8 @@ class Boss:
                 cx = self.rect.left + 20 + i*(self.w-40)/5
                 cy = self.rect.bottom - 8
                 phase = random.uniform(0, math.pi*2)
-                boss_bullets.append({
-                    "rect": pygame.Rect(int(cx-5), int(cy), 10, 18),
-                    "vx": 0.0, "vy": base_vy,
-                    "type": "wave", "phase": phase, "phase_speed": 0.11 + random.random()*0.09
-                })
+                boss_bullets.spawn(int(cx-5), int(cy), 10, 18, 0.0, base_vy, KIND_WAVE,
+                                   bullet_sprite_id("wave", 10, 18), phase, 0.11 + random.random()*0.09)
 
     def _pattern_burst(self, ahora, boss_bullets):
         if ahora - self.last_shot >= 110:
@@ -117,7 +183,7 @@ class Boss:
                 self.laser_active=False; self.laser_rect=None
 
     def update(self, dt, ahora, player_rect, boss_bullets):
-        self.rect.x += int(self.move_speed) * self.dir
+        self.motion.step(int(self.move_speed) * self.dir * SIM.scale, 0)
         if self.rect.right >= ANCHO - 10: self.rect.right = ANCHO - 10; self.dir = -1
         elif self.rect.left <= 10: self.rect.left = 10; self.dir = 1
 
@@ -138,10 +204,16 @@ class Boss:
             self.anim_idx = (self.anim_idx + 1) % len(self.frames)
 
 
-    def draw(self, surface, cam_apply_rect, ahora):
-        frame = self.frames[self.anim_idx]
-        drect = cam_apply_rect(self.rect)
-        surface.blit(frame, drect.topleft)
+    def submit(self, queue, cam_apply_rect):
+        page, area = self.regions[self.anim_idx]
+        x, y = self.motion.at(queue.alpha)
+        rect = pygame.Rect(x, y, self.w, self.h)
+        queue.submit(LAYER_ENEMIES, page, rect, area)
+        queue.call(LAYER_BOSS_FX, lambda surface: self.draw_fx(surface, cam_apply_rect, rect))
+
+    def draw_fx(self, surface, cam_apply_rect, rect=None):
+        """Barra de vida y láser (dibujo inmediato, encima del sprite)."""
+        drect = cam_apply_rect(rect or self.rect)
 
         # Vida
         bar_w, bar_h = self.w, 10
@@ -156,8 +228,6 @@ class Boss:
             draw_rect = cam_apply_rect(self.laser_rect)
             if elapsed < self.laser_warn_ms:
                 alpha = 120 if (elapsed // 100) % 2 == 0 else 60
-                s = pygame.Surface((draw_rect.width, draw_rect.height), pygame.SRCALPHA)
-                s.fill((255,50,50,alpha)); surface.blit(s, draw_rect.topleft)
+                OVERLAYS.fill_rect(surface, draw_rect, (255,50,50), alpha)
             else:
-                s = pygame.Surface((draw_rect.width, draw_rect.height), pygame.SRCALPHA)
-                s.fill((255,0,0,200)); surface.blit(s, draw_rect.topleft)
+                OVERLAYS.fill_rect(surface, draw_rect, (255,0,0), 200)
@@ -1,19 +1,62 @@
 from .. import assets as Assets
-from ..constants import ALTO, ANCHO
+from ..constants import ALTO, ANCHO, POOL_BULLETS
+from ..render_queue import LAYER_SHOTS
+from ..timestep import SIM, Motion
+from ..pool import ObjectPool
 import pygame
 
 class Bala:
-    def __init__(self, x, y, vy=-9, image=None):  # << image opcional
-        self.image = image if image is not None else Assets.BALA_IMG
-        self.rect = self.image.get_rect(center=(x, y))
+    # sin __dict__: con ráfagas largas hay miles vivas a la vez
+    __slots__ = ("page", "area", "rect", "motion", "vx", "vy", "alive", "in_pool")
+
+    def __init__(self, x, y, vy=-9, image=None, role="bala"):  # << image opcional
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.motion = Motion(self.rect)
+        self.reset(x, y, vy, image, role)
+
+    def reset(self, x, y, vy=-9, image=None, role="bala"):
+        """Reinicia la bala (la reserva la reutiliza en vez de crear otra)."""
+        # sprite del atlas según el rol ("bala" / "bala2"), o imagen suelta
+        if image is not None:
+            self.page, self.area = image, image.get_rect()
+        else:
+            self.page, self.area = Assets.region(role)
+        self.rect.size = self.area.size
+        self.rect.center = (x, y)
+        self.motion.sync()
         self.vx = 0
         self.vy = vy
+        self.alive = True   # False = impactó; compact() la quita
 
     def update(self):
-        self.rect.x += self.vx
-        self.rect.y += self.vy
+        # vx/vy en px por frame a 60 Hz; cada paso avanza su parte
+        self.motion.step(self.vx * SIM.scale, self.vy * SIM.scale)
         return self.rect.bottom > 0 and self.rect.top < ALTO and self.rect.right > 0 and self.rect.left < ANCHO
 
-    def draw(self, surface, cam_apply_rect):
-        drect = cam_apply_rect(self.rect)
-        surface.blit(self.image, drect.topleft)
+    def submit(self, queue):
+        x, y = self.motion.at(queue.alpha)
+        queue.submit(LAYER_SHOTS, self.page, (x, y, self.rect.width, self.rect.height), self.area)
+
+BULLET_POOL = ObjectPool(Bala, POOL_BULLETS)
+
+def update_bullets(balas, pool=BULLET_POOL):
+    """Mueve las balas y quita en el sitio las que salen de pantalla (sin copiar la lista)."""
+    j = 0
+    for bala in balas:
+        if bala.update():
+            balas[j] = bala
+            j += 1
+        else:
+            pool.release(bala)
+    del balas[j:]
+
+def compact(balas, pool=BULLET_POOL):
+    """Quita en el sitio las balas con alive=False, conservando el orden."""
+    j = 0
+    for bala in balas:
+        if bala.alive:
+            balas[j] = bala
+            j += 1
+        else:
+            pool.release(bala)
+    del balas[j:]
@@ -1,22 +1,29 @@
 from .. import assets as Assets
 from ..constants import ASTEROID_W, ASTEROID_H, ALTO, ANCHO
+from ..render_queue import LAYER_ENEMIES
+from ..timestep import SIM, Motion, rect_delta
 import pygame
 
 class FallingEnemy:
     def __init__(self, x, y, w=ASTEROID_W, h=ASTEROID_H):
         self.rect = pygame.Rect(x, y, w, h)
+        self.motion = Motion(self.rect)
         self.anim_idx = 0; self.anim_accum = 0
 
     def update(self, dt_ms, vel_y):
-        self.rect.y += vel_y
+        # vel_y en px por frame a 60 Hz, redondeado como hacía `rect.y += vel_y`
+        self.motion.step(0, rect_delta(self.rect.y, vel_y) * SIM.scale)
+        frames, durs = Assets.sprite("asteroid")
         self.anim_accum += dt_ms
-        if self.anim_accum >= Assets.ASTEROID_DURS[self.anim_idx]:
+        if self.anim_accum >= durs[self.anim_idx]:
             self.anim_accum = 0
-            self.anim_idx = (self.anim_idx + 1) % len(Assets.ASTEROID_FRAMES)
+            self.anim_idx = (self.anim_idx + 1) % len(frames)
 
-    def draw(self, surface, cam_apply_rect):
-        drect = cam_apply_rect(self.rect)
-        surface.blit(Assets.ASTEROID_FRAMES[self.anim_idx], drect.topleft)
+    def submit(self, queue):
+        # los que esperan sobre la pantalla (y negativa) los descarta la cola
+        page, area = Assets.region("asteroid", self.anim_idx)
+        x, y = self.motion.at(queue.alpha)
+        queue.submit(LAYER_ENEMIES, page, (x, y, self.rect.width, self.rect.height), area)
 
 def crear_enemigos(cantidad):
     import random
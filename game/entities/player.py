@@ -1,5 +1,7 @@
 from .. import assets as Assets
-from ..constants import PLAYER_W, PLAYER_H, ALTO, ANCHO
+from ..constants import PLAYER_W, PLAYER_H, PLAYER_TILT_MAX, ALTO, ANCHO
+from ..render_queue import LAYER_PLAYER
+from ..timestep import SIM, Motion
 import pygame
 
 class Jugador:
@@ -7,25 +9,20 @@ class Jugador:
         self.w, self.h = PLAYER_W, PLAYER_H
         self.rect = pygame.Rect(0,0,self.w,self.h)
         self.rect.centerx = centerx; self.rect.bottom = bottom
+        self.motion = Motion(self.rect)
 
         self.anim_idx = 0; self.anim_accum = 0
         self.vel_base = 6; self.vel = self.vel_base
         self.angle = 0.0; self.target_angle = 0.0
-        self.ANGLE_MAX = 22.0; self.ANGLE_SPEED = 240.0
+        self.ANGLE_MAX = PLAYER_TILT_MAX; self.ANGLE_SPEED = 240.0
 
-        self.nose_local = (self.w/2, 6)        
-        self.frames = Assets.PLAYER_FRAMES
-        self.durations = Assets.PLAYER_DURS
-        self.frame_index = 0
-        self.frame_timer = 0
+        self.nose_local = (self.w/2, 6)
+        # punta del cañón relativa al centro (se rota con la caché de la nave)
+        self.nose_offset = (self.nose_local[0] - self.w/2, self.nose_local[1] - self.h/2)
 
     def get_muzzle_world(self):
-        from pygame.math import Vector2
-        base_center = Vector2(self.w/2, self.h/2)
-        nose = Vector2(self.nose_local)
-        offset = nose - base_center
-        spawn = Vector2(self.rect.center) + offset.rotate(-self.angle)
-        return int(spawn.x), int(spawn.y)
+        dx, dy = Assets.PLAYER_ROT.rotated_offset(self.nose_offset, self.angle)
+        return int(self.rect.centerx + dx), int(self.rect.centery + dy)
 
     def update(self, dt_ms, keys):
         dx=dy=0
@@ -33,7 +30,7 @@ class Jugador:
         if keys[pygame.K_RIGHT]: dx += self.vel
         if keys[pygame.K_UP]:    dy -= self.vel
         if keys[pygame.K_DOWN]:  dy += self.vel
-        self.rect.move_ip(dx,dy)
+        self.motion.step(dx * SIM.scale, dy * SIM.scale)
         self.rect.clamp_ip(pygame.Rect(0,0,ANCHO,ALTO))
 
         if dx>0: self.target_angle = +self.ANGLE_MAX
@@ -46,20 +43,18 @@ class Jugador:
         elif self.angle > self.target_angle:
             self.angle = max(self.angle-max_delta, self.target_angle)
 
+        # Animación de la nave (frames compartidos del skin actual)
+        frames, durs = Assets.sprite("player")
+        self.anim_idx %= len(frames)
         self.anim_accum += dt_ms
-        if self.anim_accum >= Assets.PLAYER_DURS[self.anim_idx]:
+        if self.anim_accum >= durs[self.anim_idx]:
             self.anim_accum = 0
-            self.anim_idx = (self.anim_idx + 1) % len(Assets.PLAYER_FRAMES)    # Animación de la nave
-        if len(self.frames) > 1:
-            self.frame_timer += dt
-            if self.frame_timer >= self.durations[self.frame_index]:
-                self.frame_timer = 0
-                self.frame_index = (self.frame_index + 1) % len(self.frames)
+            self.anim_idx = (self.anim_idx + 1) % len(frames)
 
-    def draw(self, surface, cam_apply_point, visible=True):
+    def submit(self, queue, cam_apply_point, visible=True):
         if not visible: return
-        frame = Assets.PLAYER_FRAMES[self.anim_idx]
-        rotated = pygame.transform.rotozoom(frame, -self.angle, 1.0)
-        rrect = rotated.get_rect(center=self.rect.center)
+        rotated = Assets.player_rotated(self.anim_idx, self.angle)
+        x, y = self.motion.at(queue.alpha)
+        rrect = rotated.get_rect(center=(x + self.w // 2, y + self.h // 2))
         rrect.center = cam_apply_point(rrect.centerx, rrect.centery)
-        surface.blit(rotated, rrect)
\ No newline at end of file
+        queue.submit_screen(LAYER_PLAYER, rotated, rrect)
\ No newline at end of file
@@ -1,49 +1,95 @@
 import pygame, random, math
-from ..constants import ALTO, ANCHO, VERDE, AMARILLO, MORADO
+from ..constants import ALTO, ANCHO, VERDE, AMARILLO, MORADO, NEGRO, POOL_POWERUPS, POOL_BOMBS
+from ..render_queue import LAYER_PICKUPS, LAYER_BOMB_PICKUP, LAYER_BOMBS
+from ..utils import dibujar_texto
+from ..timestep import SIM, Motion, rect_delta
+from ..pool import ObjectPool
+
+# Sprites prearmados: clave -> (Surface, dx, dy) respecto al rect de la entidad
+_SPRITES = {}
+
+def _circles_sprite(key, size, colors):
+    """Bomba dibujada con círculos (relleno, borde, brillo central)."""
+    spr = _SPRITES.get(key)
+    if spr is None:
+        fill, border, core, core_r = colors
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        c = (size // 2, size // 2)
+        pygame.draw.circle(surf, fill, c, size // 2)
+        pygame.draw.circle(surf, border, c, size // 2, 2)
+        pygame.draw.circle(surf, core, c, core_r)
+        spr = _SPRITES[key] = (surf, 0, 0)
+    return spr
 
 class PowerUp:
     def __init__(self, tipo, x, y):
+        self.rect = pygame.Rect(0, 0, 24, 24)
+        self.motion = Motion(self.rect)
+        self.reset(tipo, x, y)
+
+    def reset(self, tipo, x, y):
         self.tipo = tipo
-        self.rect = pygame.Rect(x-12, y-12, 24, 24)
+        self.rect.update(x-12, y-12, 24, 24)
+        self.motion.sync()
         self.speed = 3.0
 
     def update(self):
-        self.rect.y += self.speed
+        self.motion.step(0, self.speed * SIM.scale)
         return self.rect.top <= ALTO
 
-    def draw(self, surface, fuente, cam_apply_rect, cam_apply_point, dibujar_texto, NEGRO):
-        color = VERDE if self.tipo=='S' else AMARILLO if self.tipo=='F' else MORADO
-        pygame.draw.rect(surface, color, cam_apply_rect(self.rect), border_radius=6)
-        cx, cy = cam_apply_point(self.rect.centerx, self.rect.centery-10)
-        dibujar_texto(surface, self.tipo, fuente, NEGRO, cx, cy, centrado=True)
+    def _sprite(self, fuente):
+        """Caja de color con la letra (la letra sobresale 10 px por arriba)."""
+        key = ("powerup", self.tipo, self.rect.size, id(fuente))
+        spr = _SPRITES.get(key)
+        if spr is None:
+            color = VERDE if self.tipo=='S' else AMARILLO if self.tipo=='F' else MORADO
+            box = pygame.Rect((0, 0), self.rect.size)
+            text = fuente.render(self.tipo, True, NEGRO).get_rect(center=(box.centerx, box.centery-10))
+            bounds = box.union(text)
+            surf = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, box.move(-bounds.x, -bounds.y), border_radius=6)
+            dibujar_texto(surf, self.tipo, fuente, NEGRO, box.centerx - bounds.x, box.centery - 10 - bounds.y, centrado=True)
+            spr = _SPRITES[key] = (surf, bounds.x, bounds.y)
+        return spr
+
+    def submit(self, queue, fuente):
+        surf, dx, dy = self._sprite(fuente)
+        x, y = self.motion.at(queue.alpha)
+        queue.submit(LAYER_PICKUPS, surf, (x + dx, y + dy, surf.get_width(), surf.get_height()))
 
 class BombPickup:
     LIFETIME_MS = 7000
     def __init__(self, x, y, now_ms):
         self.rect = pygame.Rect(x-14, y-14, 28, 28)
+        self.motion = Motion(self.rect)
         self.vy=1.6; self.phase = random.uniform(0,math.pi*2)
         self.active=True; self.spawn_time = now_ms
 
     def update(self, ahora):
         if not self.active: return
-        self.phase += 0.06
-        self.rect.y += self.vy
-        self.rect.x += int(2.0 * math.sin(self.phase))
+        # desplazamientos por frame a 60 Hz: x truncada con int() como antes,
+        # y redondeada como hacía `rect.y += self.vy`
+        self.phase += 0.06 * SIM.scale
+        self.motion.step(int(2.0 * math.sin(self.phase)) * SIM.scale, rect_delta(self.rect.y, self.vy) * SIM.scale)
         if self.rect.top > ALTO or (ahora - self.spawn_time) > self.LIFETIME_MS:
             self.active=False
 
-    def draw(self, surface, cam_apply_rect):
+    def submit(self, queue):
         if not self.active: return
-        r = cam_apply_rect(self.rect)
-        pygame.draw.circle(surface, (255,230,60), r.center, r.width//2)
-        pygame.draw.circle(surface, (150,120,0), r.center, r.width//2, 2)
-        pygame.draw.circle(surface, (255,255,255), r.center, 3)
+        surf = _circles_sprite("bomb_pickup", self.rect.width, ((255,230,60), (150,120,0), (255,255,255), 3))[0]
+        x, y = self.motion.at(queue.alpha)
+        queue.submit(LAYER_BOMB_PICKUP, surf, (x, y, self.rect.width, self.rect.height))
 
 class BombProjectile:
     EXPLOSION_MS = 700
     def __init__(self, x, y, target_rect, reproducir, sonido_explosion):
-        import math
-        self.rect = pygame.Rect(x-12, y-12, 24, 24)
+        self.rect = pygame.Rect(0, 0, 24, 24)
+        self.motion = Motion(self.rect)
+        self.reset(x, y, target_rect, reproducir, sonido_explosion)
+
+    def reset(self, x, y, target_rect, reproducir, sonido_explosion):
+        self.rect.update(x-12, y-12, 24, 24)
+        self.motion.sync()
         tx, ty = target_rect.centerx, target_rect.centery
         dx, dy = (tx - x), (ty - y)
         mag = math.hypot(dx, dy) or 1.0; speed = 6.0
@@ -51,34 +97,40 @@ class BombProjectile:
         self.active=True; self.exploded=False; self.explosion_start=0; self.radius=18
         self._reproducir = reproducir; self._sonido_explosion = sonido_explosion
 
-    def update(self, ahora, boss):
-        import math
+    def update(self, ahora):
         if not self.active: return
         if not self.exploded:
-            self.rect.x += int(self.vx); self.rect.y += int(self.vy)
+            self.motion.step(int(self.vx) * SIM.scale, int(self.vy) * SIM.scale)
             if (self.rect.bottom < 0 or self.rect.top > ALTO or 
                 self.rect.right < 0 or self.rect.left > ANCHO):
                 self.active=False
-            elif boss and self.rect.colliderect(boss.rect):
-                self.trigger(ahora)
-                boss.hp -= int(boss.hp_max * 0.45)
         else:
             t = ahora - self.explosion_start
             self.radius = 18 + int(180 * min(1.0, t/self.EXPLOSION_MS))
             if t >= self.EXPLOSION_MS: self.active=False
 
+    def hit(self, ahora, boss):
+        """Impacto contra el jefe (lo detecta la rejilla de colisiones)."""
+        self.trigger(ahora)
+        boss.hp -= int(boss.hp_max * 0.45)
+
     def trigger(self, ahora):
         if not self.exploded:
             self.exploded=True; self.explosion_start=ahora
             self._reproducir(self._sonido_explosion)
 
-    def draw(self, surface, cam_apply_rect, cam_apply_point):
+    def submit(self, queue, cam_apply_point):
         if not self.active: return
         if not self.exploded:
-            r = cam_apply_rect(self.rect)
-            pygame.draw.circle(surface, (255,160,0), r.center, r.width//2)
-            pygame.draw.circle(surface, (100,60,0), r.center, r.width//2, 2)
-            pygame.draw.circle(surface, (255,255,255), r.center, 4)
+            surf = _circles_sprite("bomb", self.rect.width, ((255,160,0), (100,60,0), (255,255,255), 4))[0]
+            x, y = self.motion.at(queue.alpha)
+            queue.submit(LAYER_BOMBS, surf, (x, y, self.rect.width, self.rect.height))
         else:
-            cx, cy = cam_apply_point(self.rect.centerx, self.rect.centery)
-            pygame.draw.circle(surface, (255,120,0), (cx,cy), self.radius, 6)
+            # el anillo crece cada frame: dibujo inmediato en su capa
+            center = cam_apply_point(self.rect.centerx, self.rect.centery)
+            radius = self.radius
+            queue.call(LAYER_BOMBS, lambda surface: pygame.draw.circle(surface, (255,120,0), center, radius, 6))
+
+# Reservas: los power-ups y las bombas se reutilizan en vez de crearse en cada drop
+POWERUP_POOL = ObjectPool(PowerUp, POOL_POWERUPS)
+BOMB_POOL = ObjectPool(BombProjectile, POOL_BOMBS)
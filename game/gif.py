@@ -1,14 +1,139 @@
+import hashlib
 import pygame
-try:
-    from PIL import Image
-    PIL_OK = True
-except Exception as e:
-    print("[AVISO] Pillow no disponible, los GIF se verán estáticos:", e)
-    PIL_OK = False
+from .gif_cache import load_cached_frames, read_cached_raw, store_cached_frames
+
+# Pillow se importa en el primer uso: con bundle o caché en disco no hace falta
+Image = ImageChops = None
+_PIL_STATE = None   # None = sin probar, True/False = resultado
+
+def pil_ok():
+    """Importa Pillow la primera vez; False si no está instalado."""
+    global Image, ImageChops, _PIL_STATE
+    if _PIL_STATE is None:
+        try:
+            from PIL import Image as _Image, ImageChops as _ImageChops
+            Image, ImageChops = _Image, _ImageChops
+            _PIL_STATE = True
+        except Exception as e:
+            print("[AVISO] Pillow no disponible, los GIF se verán estáticos:", e)
+            _PIL_STATE = False
+    return _PIL_STATE
+
+def _iter_composed(path, size):
+    if not pil_ok():
+        raise RuntimeError("Pillow no disponible")
+    im = Image.open(path)
+    frame_count = getattr(im, "n_frames", 1)
+    canvas_size = im.size
+    prev = Image.new("RGBA", canvas_size, (0,0,0,0))
+
+    for i in range(frame_count):
+        im.seek(i)
+        dur = max(20, int(im.info.get("duration", 100)))
+        curr = im.convert("RGBA")
+        composed = prev.copy()
+        composed.alpha_composite(curr, dest=(0,0))
+
+        disposal = getattr(im, "disposal", im.info.get("disposal", 0))
+        next_prev = Image.new("RGBA", canvas_size, (0,0,0,0)) if disposal == 2 else composed
+
+        out_img = composed if not size or size==canvas_size else composed.resize(size, Image.LANCZOS)
+        yield out_img.size, out_img.tobytes(), dur
+        prev = next_prev
+
+def iter_gif_raw(path, size):
+    """
+    Genera (out_size, bytes RGBA, duración) frame a frame, ya compuestos y
+    escalados, sin tocar pygame (apto para hilos). Los frames consecutivos
+    idénticos (mismo hash) se funden en uno con la suma de sus duraciones.
+    """
+    pending, pending_hash = None, None
+    for out_size, data, dur in _iter_composed(path, size):
+        h = hashlib.sha1(data).digest()
+        if pending and h == pending_hash:
+            pending[2] += dur
+            continue
+        if pending:
+            yield tuple(pending)
+        pending, pending_hash = [out_size, data, dur], h
+    if pending:
+        yield tuple(pending)
+
+def decode_gif_raw(path, size):
+    """
+    Decodifica, compone y escala los frames sin tocar pygame (apto para hilos).
+    Devuelve (out_size, raw_frames, durations) con raw_frames en bytes RGBA.
+    """
+    cached = read_cached_raw(path, size)
+    if cached:
+        return cached
+
+    raw_frames, durations, out_size = [], [], None
+    for out_size, data, dur in iter_gif_raw(path, size):
+        raw_frames.append(data); durations.append(dur)
+
+    if not raw_frames:
+        raise ValueError("GIF sin frames")
+    store_cached_frames(path, size, out_size, raw_frames, durations)
+    return out_size, raw_frames, durations
+
+def frames_from_raw(out_size, raw_frames):
+    """Paso final en el hilo principal: buffers RGBA -> Surfaces convertidas."""
+    frames = []
+    for data in raw_frames:
+        raw = pygame.image.frombuffer(data, out_size, "RGBA")
+        frames.append(raw.convert_alpha())
+        del raw
+    return frames
+
+def delta_boxes(out_size, raw_frames):
+    """
+    Caja (x0, y0, x1, y1) de lo que cambia en cada frame respecto al anterior,
+    None si nada; el frame 0 es siempre completo. Sin pygame (apto para hilos).
+    """
+    pil_ok()
+    boxes = [(0, 0, out_size[0], out_size[1])]
+    prev = Image.frombytes("RGBA", out_size, bytes(raw_frames[0]))
+    for data in raw_frames[1:]:
+        curr = Image.frombytes("RGBA", out_size, bytes(data))
+        boxes.append(ImageChops.difference(prev, curr).getbbox(alpha_only=False))
+        prev = curr
+    return boxes
+
+def delta_encode(frames, boxes=None):
+    """
+    Codifica una animación como deltas: [(rect, parche)] donde el primero es
+    el frame 0 completo y cada siguiente guarda solo el rectángulo que cambió
+    respecto al anterior (parche None si no cambió nada).
+    """
+    w, h = frames[0].get_size()
+    full = pygame.Rect(0, 0, w, h)
+    if boxes is None:
+        if not pil_ok():
+            return [(full, f) for f in frames]
+        boxes = delta_boxes((w, h), [pygame.image.tobytes(f, "RGBA") for f in frames])
+    out = []
+    for f, box in zip(frames, boxes):
+        if box is None:
+            out.append((None, None))
+            continue
+        rect = pygame.Rect(box[0], box[1], box[2] - box[0], box[3] - box[1])
+        out.append((rect, f if rect == full else f.subsurface(rect).copy()))
+    return out
 
 def load_gif_frames(path, size):
-    frames, durations = [], []
-    if not PIL_OK:
+    from .loader import take_preloaded
+    from .bundle import get_bundle
+    pre = take_preloaded("gif", path, size) or get_bundle().load(path, size, "gif")
+    if pre:
+        return pre
+
+    # Arranque en caliente: frames ya decodificados en la caché de disco
+    cached = load_cached_frames(path, size)
+    if cached:
+        return cached
+
+    if not pil_ok():
         try:
             img = pygame.image.load(path).convert_alpha()
             if size: img = pygame.transform.smoothscale(img, size)
@@ -20,30 +145,8 @@ def load_gif_frames(path, size):
             return [surf], [120]
 
     try:
-        im = Image.open(path)
-        frame_count = getattr(im, "n_frames", 1)
-        canvas_size = im.size
-        prev = Image.new("RGBA", canvas_size, (0,0,0,0))
-
-        for i in range(frame_count):
-            im.seek(i)
-            dur = max(20, int(im.info.get("duration", 100)))
-            curr = im.convert("RGBA")
-            composed = prev.copy()
-            composed.alpha_composite(curr, dest=(0,0))
-
-            disposal = getattr(im, "disposal", im.info.get("disposal", 0))
-            next_prev = Image.new("RGBA", canvas_size, (0,0,0,0)) if disposal == 2 else composed
-
-            out_img = composed if not size or size==canvas_size else composed.resize(size, Image.LANCZOS)
-            data = out_img.tobytes()
-            py_img = pygame.image.fromstring(data, out_img.size, "RGBA").convert_alpha()
-            frames.append(py_img); durations.append(dur)
-            prev = next_prev
-
-        if not frames:
-            raise ValueError("GIF sin frames")
-        return frames, durations
+        out_size, raw_frames, durations = decode_gif_raw(path, size)
+        return frames_from_raw(out_size, raw_frames), durations
     except Exception as e:
         print(f"[AVISO] Error cargando GIF '{path}': {e}")
         surf = pygame.Surface(size, pygame.SRCALPHA)
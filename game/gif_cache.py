@@ -0,0 +1,191 @@
+import os, mmap, struct, hashlib, tempfile
+import pygame
+from .constants import GIF_CACHE_DIR, GIF_CACHE_MAX_BYTES, GIF_CACHE_ENABLED
+
+# Formato del archivo de caché (little endian):
+#   cabecera: magic(4) version(u16) ancho(u16) alto(u16) n_frames(u32)
+#   duraciones: n_frames * u32 (ms)
+#   pixeles: n_frames * ancho*alto*4 bytes RGBA, contiguos
+_MAGIC = b"SAGC"
+_VERSION = 2   # v2: frames duplicados consecutivos ya fundidos
+_HEADER = struct.Struct("<4sHHHI")
+
+def _cache_key(path, size):
+    """Clave: ruta absoluta + mtime + tamaño del archivo + tamaño destino."""
+    st = os.stat(path)
+    raw = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{size}|{_VERSION}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def _entry_path(key):
+    return os.path.join(GIF_CACHE_DIR, key + ".bin")
+
+def _parse_header(buf):
+    """Valida la cabecera; devuelve (w, h, durations, offset_pixeles) o None."""
+    magic, version, w, h, count = _HEADER.unpack_from(buf, 0)
+    if magic != _MAGIC or version != _VERSION or count == 0:
+        return None
+    off = _HEADER.size
+    durations = list(struct.unpack_from(f"<{count}I", buf, off))
+    off += 4 * count
+    if len(buf) != off + w * h * 4 * count:
+        return None
+    return w, h, durations, off
+
+def load_cached_frames(path, size):
+    """
+    Devuelve (frames, durations) desde la caché en disco, o None si no hay
+    entrada válida. Los pixeles se leen con mmap sin pasar por Pillow.
+    """
+    if not GIF_CACHE_ENABLED:
+        return None
+    try:
+        entry = _entry_path(_cache_key(path, size))
+        if not os.path.exists(entry):
+            return None
+        frames = []
+        with open(entry, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            parsed = _parse_header(mm)
+            if not parsed:
+                return None
+            w, h, durations, off = parsed
+            frame_bytes = w * h * 4
+            mv = memoryview(mm)
+            try:
+                for i in range(len(durations)):
+                    start = off + i * frame_bytes
+                    raw = pygame.image.frombuffer(mv[start:start + frame_bytes], (w, h), "RGBA")
+                    frames.append(raw.convert_alpha())
+                    del raw
+            finally:
+                mv.release()
+        # marcar como usado recientemente (para el recorte LRU)
+        os.utime(entry, None)
+        return frames, durations
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[AVISO] Caché de GIF inválida para '{path}': {e}")
+        return None
+
+def cached_frame_info(path, size):
+    """((w, h), n_frames) leyendo solo la cabecera de la caché, o None."""
+    if not GIF_CACHE_ENABLED:
+        return None
+    try:
+        with open(_entry_path(_cache_key(path, size)), "rb") as f:
+            head = f.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(head) != _HEADER.size:
+        return None
+    magic, version, w, h, count = _HEADER.unpack(head)
+    if magic != _MAGIC or version != _VERSION or count == 0:
+        return None
+    return (w, h), count
+
+def read_cached_raw(path, size):
+    """
+    Igual que load_cached_frames pero sin pygame (apto para hilos):
+    devuelve (out_size, raw_frames, durations) con vistas sobre los bytes leídos.
+    """
+    if not GIF_CACHE_ENABLED:
+        return None
+    try:
+        entry = _entry_path(_cache_key(path, size))
+        if not os.path.exists(entry):
+            return None
+        with open(entry, "rb") as f:
+            buf = f.read()
+        parsed = _parse_header(buf)
+        if not parsed:
+            return None
+        w, h, durations, off = parsed
+        frame_bytes = w * h * 4
+        mv = memoryview(buf)
+        raw_frames = [mv[off + i*frame_bytes: off + (i+1)*frame_bytes] for i in range(len(durations))]
+        os.utime(entry, None)
+        return (w, h), raw_frames, durations
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[AVISO] Caché de GIF inválida para '{path}': {e}")
+        return None
+
+def iter_cached_raw(path, size):
+    """
+    Generador (out_size, bytes RGBA, duración) leyendo frame a frame desde la
+    caché con mmap; None si no hay entrada. Pensado para fondos en streaming.
+    """
+    if not GIF_CACHE_ENABLED:
+        return None
+    try:
+        entry = _entry_path(_cache_key(path, size))
+        if not os.path.exists(entry):
+            return None
+    except OSError:
+        return None
+
+    def _gen():
+        with open(entry, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            parsed = _parse_header(mm)
+            if not parsed:
+                return
+            w, h, durations, off = parsed
+            frame_bytes = w * h * 4
+            for i, dur in enumerate(durations):
+                start = off + i * frame_bytes
+                yield (w, h), mm[start:start + frame_bytes], dur
+    return _gen()
+
+def store_cached_frames(path, size, out_size, raw_frames, durations):
+    """
+    Guarda los frames ya compuestos y escalados (bytes RGBA de out_size) y
+    recorta la caché si supera GIF_CACHE_MAX_BYTES.
+    """
+    if not GIF_CACHE_ENABLED or not raw_frames:
+        return
+    tmp = None
+    try:
+        os.makedirs(GIF_CACHE_DIR, exist_ok=True)
+        entry = _entry_path(_cache_key(path, size))
+        # temporal propio: dos hilos pueden guardar el mismo GIF a la vez
+        fd, tmp = tempfile.mkstemp(dir=GIF_CACHE_DIR, prefix=os.path.basename(entry), suffix=".tmp")
+        w, h = out_size
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, w, h, len(raw_frames)))
+            f.write(struct.pack(f"<{len(durations)}I", *durations))
+            for data in raw_frames:
+                f.write(data)
+        os.replace(tmp, entry)
+        tmp = None
+        _prune()
+    except Exception as e:
+        print(f"[AVISO] No se pudo escribir caché de GIF para '{path}': {e}")
+    finally:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+def _prune():
+    """Elimina las entradas usadas hace más tiempo hasta quedar bajo el límite."""
+    entries = []
+    total = 0
+    for name in os.listdir(GIF_CACHE_DIR):
+        p = os.path.join(GIF_CACHE_DIR, name)
+        if not name.endswith(".bin"):
+            continue
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue  # otro hilo pudo borrarla
+        entries.append((st.st_mtime, st.st_size, p))
+        total += st.st_size
+    entries.sort()
+    while total > GIF_CACHE_MAX_BYTES and len(entries) > 1:
+        _, sz, p = entries.pop(0)
+        try:
+            os.remove(p); total -= sz
+        except OSError:
+            pass
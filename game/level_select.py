@@ -1,6 +1,8 @@
 import pygame, os
 from .constants import ANCHO, ALTO, LEVEL_COUNT, LEVEL_PLANET_DIR, LEVEL_MENU_BG, BLANCO, AMARILLO
 from .utils import dibujar_texto
+from .ui_helpers import CachedLayer
+from .registry import REGISTRY
 
 class LevelSelect:
     def __init__(self):
@@ -17,8 +19,7 @@ class LevelSelect:
         # Cargar fondo del selector
         self.bg = None
         try:
-            self.bg = pygame.image.load(LEVEL_MENU_BG).convert()
-            self.bg = pygame.transform.scale(self.bg, (ANCHO, ALTO))
+            self.bg = REGISTRY.acquire(LEVEL_MENU_BG, (ANCHO, ALTO), "opaque")[0][0]
         except Exception as e:
             print(f"[AVISO] No se pudo cargar '{LEVEL_MENU_BG}': {e}")
 
@@ -27,8 +28,7 @@ class LevelSelect:
         for i in range(1, LEVEL_COUNT+1):
             path = os.path.join(LEVEL_PLANET_DIR, f"{i}.png")
             try:
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.smoothscale(img, (100, 100))
+                img = REGISTRY.acquire(path, (100, 100), "image")[0][0]
             except Exception as e:
                 print(f"[AVISO] No planeta '{path}': {e}")
                 img = pygame.Surface((100,100), pygame.SRCALPHA)
@@ -38,6 +38,10 @@ class LevelSelect:
         # Flechita (triángulo)
         self.arrow = self._make_arrow()
 
+        # Fondo, título y grilla no cambian: una capa; la flecha va encima
+        self.layer = CachedLayer(pygame.Rect(0, 0, ANCHO, ALTO), self._render_grid, mode="opaque")
+        self._fonts = None
+
     def _make_arrow(self):
         surf = pygame.Surface((30, 22), pygame.SRCALPHA)
         pygame.draw.polygon(surf, (255, 220, 90), [(0,11),(24,0),(24,22)])
@@ -74,7 +78,8 @@ class LevelSelect:
             return "SELECTED", self.selected
         return None, None
 
-    def draw(self, surface, fuente_titulo, fuente):
+    def _render_grid(self, surface, origin):
+        fuente_titulo, fuente = self._fonts
         # Fondo
         if self.bg: surface.blit(self.bg, (0,0))
         else: surface.fill((0,0,0))
@@ -97,6 +102,10 @@ class LevelSelect:
             # etiqueta
             dibujar_texto(surface, f"Nivel {i}", fuente, BLANCO, cx, rect.bottom - 10, centrado=True)
 
+    def draw(self, surface, fuente_titulo, fuente):
+        self._fonts = (fuente_titulo, fuente)
+        self.layer.draw(surface, key=self._fonts)
+
         # Flecha sobre el seleccionado
         cx, cy = self._index_to_pos(self.selected)
         arr = self.arrow.get_rect(midright=(cx - (self.cell_w//2) + 8, cy))
@@ -0,0 +1,99 @@
+import os, time
+import pygame
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .constants import ASSET_WORKERS
+from .gif import pil_ok, decode_gif_raw, frames_from_raw
+from .bundle import get_bundle
+
+# Resultados ya convertidos, listos para que los recojan los cargadores:
+# (tipo, ruta, tamaño) -> (frames, durations) para "gif" | Surface para "image"
+_PRELOADED = {}
+
+def take_preloaded(kind, path, size):
+    """Entrega (y olvida) un asset precargado; None si no se precargó."""
+    return _PRELOADED.pop((kind, path, tuple(size) if size else None), None)
+
+def load_image(path, size, alpha=True):
+    """Imagen estática escalada; usa la versión precargada si existe."""
+    pre = take_preloaded("image", path, size)
+    if pre is not None:
+        return pre
+    baked = get_bundle().load(path, size, "image" if alpha else "opaque")
+    if baked:
+        return baked[0][0]
+    img = pygame.image.load(path)
+    img = img.convert_alpha() if alpha else img.convert()
+    return pygame.transform.smoothscale(img, size)
+
+def _decode_image_raw(path, size):
+    from PIL import Image
+    im = Image.open(path).convert("RGBA")
+    if size and im.size != tuple(size):
+        im = im.resize(size, Image.LANCZOS)
+    return im.size, [im.tobytes()], [120]
+
+class AssetLoader:
+    """
+    Decodifica assets en un pool de hilos (Pillow libera el GIL) y deja en el
+    hilo principal solo frombuffer().convert_alpha(). Guarda tiempos por asset.
+    """
+    def __init__(self, workers=ASSET_WORKERS):
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.jobs = []
+        self.report = []
+
+    # lo que ya está horneado en el bundle no necesita decodificarse
+    def add_gif(self, path, size):
+        if not get_bundle().has(path, size, "gif"):
+            self.jobs.append(("gif", path, tuple(size), True))
+
+    def add_image(self, path, size, alpha=True):
+        if not get_bundle().has(path, size, "image"):
+            self.jobs.append(("image", path, tuple(size), alpha))
+
+    @staticmethod
+    def _decode(job):
+        kind, path, size, _ = job
+        t0 = time.perf_counter()
+        if kind == "gif":
+            out = decode_gif_raw(path, size)
+        else:
+            out = _decode_image_raw(path, size)
+        return out, (time.perf_counter() - t0) * 1000.0
+
+    def run(self, verbose=True):
+        """Ejecuta todos los trabajos; los fallos se dejan a los cargadores normales."""
+        if not self.jobs or not pil_ok():
+            return self.report
+        t_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._decode, job): job for job in self.jobs}
+            for fut in as_completed(futures):
+                kind, path, size, alpha = futures[fut]
+                try:
+                    (out_size, raw_frames, durations), decode_ms = fut.result()
+                except Exception:
+                    self.report.append({"path": path, "size": size, "ok": False})
+                    continue
+                t0 = time.perf_counter()
+                frames = frames_from_raw(out_size, raw_frames)
+                if kind == "gif":
+                    _PRELOADED[(kind, path, size)] = (frames, durations)
+                else:
+                    _PRELOADED[(kind, path, size)] = frames[0] if alpha else frames[0].convert()
+                convert_ms = (time.perf_counter() - t0) * 1000.0
+                self.report.append({"path": path, "size": size, "ok": True,
+                                    "decode_ms": decode_ms, "convert_ms": convert_ms})
+        total_ms = (time.perf_counter() - t_start) * 1000.0
+
+        if verbose:
+            for r in self.report:
+                if r["ok"]:
+                    print(f"[INFO] Carga '{r['path']}' {r['size']}: "
+                          f"decode {r['decode_ms']:.1f} ms + convert {r['convert_ms']:.1f} ms")
+                else:
+                    print(f"[AVISO] Carga paralela falló para '{r['path']}'")
+            decode_sum = sum(r.get("decode_ms", 0.0) for r in self.report)
+            print(f"[INFO] Carga paralela: {len(self.jobs)} assets en {total_ms:.1f} ms "
+                  f"(decode acumulado {decode_sum:.1f} ms, {self.workers} hilos)")
+        return self.report
@@ -0,0 +1,64 @@
+import os
+from .constants import LEVEL_COUNT
+
+ASSET_ROOT = "assets"
+
+# Formato por extensión: "gif" (animado, se compone con Pillow) o "image"
+_EXT_FORMAT = {".gif": "gif", ".png": "image", ".jpg": "image", ".jpeg": "image"}
+
+# ID lógico -> candidatos en orden de preferencia (relativos a assets/)
+_RULES = {
+    "boss:planet": ["personajes/jefe-{n}.png", "personajes/jefe-{n}.jpg",
+                    "personajes/jefe.gif", "personajes/jefe.png"],
+    "bg:level":    ["scenes/fondo-{n}.gif", "scenes/fondo-{n}.png", "scenes/fondo.gif"],
+}
+_FIXED = {
+    "bg:main": "scenes/fondo.gif",
+    "bg:boss": "scenes/fondo-gf.gif",
+    "bg:menu": "scenes/space.gif",
+}
+
+class AssetManifest:
+    """
+    Índice de assets construido con un único recorrido de assets/.
+    Resuelve IDs lógicos ("boss:planet:3", "bg:level:6") a (ruta, formato)
+    sin abrir archivos ni depender de excepciones.
+    """
+    def __init__(self, root=ASSET_ROOT):
+        self.root = root
+        self.files = set()
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                self.files.add(os.path.join(dirpath, name).replace("\\", "/"))
+        self.ids = {}
+        for prefix, candidates in _RULES.items():
+            for n in range(1, LEVEL_COUNT + 1):
+                for rel in candidates:
+                    path = f"{root}/{rel.format(n=n)}"
+                    if path in self.files:
+                        self.ids[f"{prefix}:{n}"] = (path, self.format_of(path))
+                        break
+        for asset_id, rel in _FIXED.items():
+            path = f"{root}/{rel}"
+            if path in self.files:
+                self.ids[asset_id] = (path, self.format_of(path))
+
+    @staticmethod
+    def format_of(path):
+        return _EXT_FORMAT.get(os.path.splitext(path)[1].lower(), "image")
+
+    def exists(self, path):
+        return path.replace("\\", "/") in self.files
+
+    def resolve(self, asset_id):
+        """(ruta, formato) del ID lógico, o None si no hay ningún candidato."""
+        return self.ids.get(asset_id)
+
+_MANIFEST = None
+
+def get_manifest():
+    """Manifiesto compartido (se construye la primera vez que se pide)."""
+    global _MANIFEST
+    if _MANIFEST is None:
+        _MANIFEST = AssetManifest()
+    return _MANIFEST
@@ -1,26 +1,29 @@
+from collections import OrderedDict
 import pygame
-from .gif import load_gif_frames
-from .constants import ANCHO, ALTO
+from .constants import ANCHO, ALTO, MENU_ZOOM_STEP, MENU_ZOOM_CACHE_BYTES
+from .clips import open_clip
 
 class MenuBG:
     def __init__(self, gif_path):
-        self.frames, self.durations = load_gif_frames(gif_path, size=(ANCHO, ALTO))
-        self.current_frame = 0
-        self.time_accumulator = 0
+        # Frames en memoria o en streaming según el peso del GIF
+        self.clip = open_clip(gif_path, (ANCHO, ALTO))
         self.zoom_factor = 1.0  # Inicializamos el factor de zoom
         self.offset_x = 0  # Para mover el fondo horizontalmente
         self.offset_y = 0  # Para mover el fondo verticalmente
         self.zoom_speed = 0.001  # Velocidad de incremento del zoom
         self.offset_speed = 0.05  # Velocidad de desplazamiento del fondo
+        self.pan_range = ANCHO * 0.1  # Desplazamiento máximo antes de rebotar
+
+        # Frames ya escalados por (índice de frame, nivel de zoom), recortados
+        # a la zona alcanzable por el desplazamiento; LRU acotada en bytes.
+        self._zoom_cache = OrderedDict()   # clave -> (Surface, x0, y0)
+        self._cache_bytes = 0
+        self.hits = self.misses = 0
 
     def update(self, dt_ms):
         """Actualiza la animación del fondo y el zoom"""
-        self.time_accumulator += dt_ms
-
         # Avanzamos la animación del gif
-        if self.time_accumulator >= self.durations[self.current_frame]:
-            self.time_accumulator = 0
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
+        self.clip.update(dt_ms)
 
         # Aplicamos zoom progresivo (se puede ajustar la velocidad)
         self.zoom_factor += self.zoom_speed  # Aumenta el zoom poco a poco
@@ -29,20 +32,62 @@ class MenuBG:
 
         # Movemos el fondo (desplazamiento)
         self.offset_x += self.offset_speed
-        if self.offset_x > ANCHO * 0.1 or self.offset_x < -ANCHO * 0.1:  # Si el fondo se desplaza mucho, revertimos
+        if self.offset_x > self.pan_range or self.offset_x < -self.pan_range:  # Si el fondo se desplaza mucho, revertimos
             self.offset_speed *= -1
 
+    def _scaled(self, level):
+        """Frame actual escalado al nivel de zoom, desde la caché si se puede."""
+        idx = getattr(self.clip, "idx", None)   # en streaming no hay índice estable
+        key = (idx, level)
+        if idx is not None:
+            hit = self._zoom_cache.get(key)
+            if hit:
+                self.hits += 1
+                self._zoom_cache.move_to_end(key)
+                return hit
+        self.misses += 1
+
+        zoom = level * MENU_ZOOM_STEP
+        w, h = int(ANCHO * zoom), int(ALTO * zoom)
+        scaled = pygame.transform.smoothscale(self.clip.frame, (w, h))
+        # solo la ventana que puede verse con el desplazamiento
+        mx = int(self.pan_range) + 1
+        my = int(abs(self.offset_y)) + 1
+        crop = pygame.Rect((w - ANCHO) // 2 - mx, (h - ALTO) // 2 - my, ANCHO + 2 * mx, ALTO + 2 * my)
+        crop = crop.clip(scaled.get_rect())
+        # el fondo del menú es opaco: sin alfa el blit es más barato
+        entry = (scaled.subsurface(crop).convert(), crop.x, crop.y)
+        if idx is None:
+            return entry
+
+        self._zoom_cache[key] = entry
+        self._cache_bytes += entry[0].get_width() * entry[0].get_height() * entry[0].get_bytesize()
+        while self._cache_bytes > MENU_ZOOM_CACHE_BYTES and len(self._zoom_cache) > 1:
+            _, (old, _, _) = self._zoom_cache.popitem(last=False)
+            self._cache_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        return entry
+
     def draw(self, surface):
         """Dibuja el fondo escalado sobre la superficie con desplazamiento"""
-        frame = self.frames[self.current_frame]
-        
-        # Escalamos el fotograma actual del gif
-        scaled_frame = pygame.transform.smoothscale(frame, 
-                                                     (int(ANCHO * self.zoom_factor), int(ALTO * self.zoom_factor)))
-        
+        # Zoom cuantizado a niveles discretos (MENU_ZOOM_STEP)
+        level = int(round(self.zoom_factor / MENU_ZOOM_STEP))
+        scaled_frame, x0, y0 = self._scaled(level)
+        w, h = int(ANCHO * level * MENU_ZOOM_STEP), int(ALTO * level * MENU_ZOOM_STEP)
+
         # Calculamos la posición para centrar la imagen escalada, desplazándola también
-        offset_x = (scaled_frame.get_width() - ANCHO) // 2 + int(self.offset_x)
-        offset_y = (scaled_frame.get_height() - ALTO) // 2 + int(self.offset_y)
+        offset_x = (w - ANCHO) // 2 + int(self.offset_x)
+        offset_y = (h - ALTO) // 2 + int(self.offset_y)
+
+        # Dibujamos el fondo escalado y desplazado (el recorte empieza en x0, y0)
+        surface.blit(scaled_frame, (x0 - offset_x, y0 - offset_y))
+
+    def signature(self):
+        """Clave de lo que se vería al dibujar: cambia solo si cambia la imagen."""
+        idx = getattr(self.clip, "idx", None)
+        return (idx if idx is not None else id(self.clip.frame),
+                int(round(self.zoom_factor / MENU_ZOOM_STEP)),
+                int(self.offset_x), int(self.offset_y))
 
-        # Dibujamos el fondo escalado y desplazado
-        surface.blit(scaled_frame, (-offset_x, -offset_y))
\ No newline at end of file
+    def stats(self):
+        return {"entries": len(self._zoom_cache), "bytes": self._cache_bytes,
+                "hits": self.hits, "misses": self.misses}
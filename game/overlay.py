@@ -0,0 +1,62 @@
+import time
+from collections import OrderedDict
+import pygame
+from .constants import OVERLAY_POOL_SIZE
+
+class OverlayPool:
+    """
+    Superficies translúcidas de color liso reutilizables, en vez de crear un
+    Surface SRCALPHA por frame (láser del jefe, bandas de cine).
+    get() entrega una superficie exacta por (tamaño, color, alfa);
+    fill_rect() rellena un rect con alfa blitteando un trozo de una superficie
+    por (color, alfa) que solo crece, así los rects de tamaño variable no
+    crean superficies nuevas.
+    """
+    def __init__(self, max_entries=OVERLAY_POOL_SIZE):
+        self.max_entries = max_entries
+        self._pool = OrderedDict()   # clave -> Surface
+        self.allocations = self.reuses = 0
+        self._t0 = time.perf_counter()
+
+    def _lookup(self, key, size):
+        surf = self._pool.get(key)
+        if surf is not None and surf.get_width() >= size[0] and surf.get_height() >= size[1]:
+            self._pool.move_to_end(key)
+            self.reuses += 1
+            return surf
+        if surf is not None:   # crece hasta el mayor tamaño pedido
+            size = (max(size[0], surf.get_width()), max(size[1], surf.get_height()))
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(key[-2] + (key[-1],))
+        self.allocations += 1
+        self._pool[key] = surf
+        self._pool.move_to_end(key)
+        while len(self._pool) > self.max_entries:
+            self._pool.popitem(last=False)
+        return surf
+
+    def get(self, size, color, alpha):
+        """Superficie (size) rellena de color con alfa; no modificarla."""
+        size = (int(size[0]), int(size[1]))
+        return self._lookup((size, tuple(color[:3]), int(alpha)), size)
+
+    def fill_rect(self, surface, rect, color, alpha):
+        """Como surface.fill(color, rect) pero mezclando con alfa."""
+        rect = pygame.Rect(rect).clip(surface.get_clip())
+        if rect.width <= 0 or rect.height <= 0:
+            return rect
+        if alpha >= 255:
+            return surface.fill(color, rect)
+        src = self._lookup((tuple(color[:3]), int(alpha)), rect.size)
+        return surface.blit(src, rect.topleft, (0, 0, rect.width, rect.height))
+
+    def stats(self):
+        elapsed = max(1e-6, time.perf_counter() - self._t0)
+        return {
+            "entries": len(self._pool),
+            "bytes": sum(s.get_width() * s.get_height() * 4 for s in self._pool.values()),
+            "allocations": self.allocations, "reuses": self.reuses,
+            "avoided_per_s": self.reuses / elapsed,
+        }
+
+OVERLAYS = OverlayPool()
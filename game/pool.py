@@ -0,0 +1,63 @@
+class ObjectPool:
+    """
+    Reserva de entidades reutilizables (balas, power-ups, bombas) para no
+    crear basura en cada disparo: acquire() reutiliza un objeto libre
+    llamando a su reset() con los mismos argumentos que el constructor, o
+    crea uno nuevo si no hay; release() lo devuelve. Se retienen como mucho
+    max_free objetos libres; el resto se deja al GC.
+    Cada objeto lleva un atributo in_pool: liberar dos veces el mismo se
+    ignora (no se duplica en la lista libre) y se cuenta en double_releases.
+    """
+    def __init__(self, cls, max_free):
+        self.cls = cls
+        self.max_free = max_free
+        self._free = []
+        self.created = self.reused = self.released = self.dropped = 0
+        self.double_releases = 0
+        self.in_use = self.high_water = 0
+        POOLS.append(self)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        obj.in_pool = False
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """Devuelve un objeto; no debe quedar referenciado en ninguna lista."""
+        if getattr(obj, "in_pool", True):
+            self.double_releases += 1   # ya devuelto (o no salió de esta reserva)
+            return
+        obj.in_pool = True
+        self.in_use -= 1
+        self.released += 1
+        if len(self._free) < self.max_free:
+            self._free.append(obj)
+        else:
+            self.dropped += 1
+
+    def release_all(self, objs):
+        """Devuelve todos los objetos de una lista y la vacía."""
+        for obj in objs:
+            self.release(obj)
+        objs.clear()
+
+    def stats(self):
+        total = self.created + self.reused
+        return {
+            "name": self.cls.__name__, "created": self.created, "reused": self.reused,
+            "reuse_rate": self.reused / total if total else 0.0,
+            "in_use": self.in_use, "high_water": self.high_water,
+            "free": len(self._free), "max_free": self.max_free, "dropped": self.dropped,
+            "double_releases": self.double_releases,
+        }
+
+POOLS = []   # todas las reservas creadas, para el informe al salir
@@ -0,0 +1,123 @@
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from .constants import ANCHO, ALTO, PREFETCH_CACHE_SIZE, PREFETCH_CONVERT_PER_FRAME
+from .gif import pil_ok, decode_gif_raw, frames_from_raw, delta_boxes
+from .registry import REGISTRY
+from .clips import should_stream, clip_format, hold_frames
+
+class BackgroundPrefetcher:
+    """
+    Precarga en un hilo los fondos de nivel que probablemente se elijan.
+    El hilo solo decodifica; la conversión a Surface se reparte entre frames
+    del hilo principal (poll) y el resultado queda retenido en el registro,
+    así AnimatedBackground lo obtiene al instante al elegir el planeta.
+    """
+    def __init__(self, size=(ANCHO, ALTO), max_cached=PREFETCH_CACHE_SIZE):
+        self.size = size
+        self.max_cached = max_cached
+        self._pool = None            # se crea en la primera petición
+        self._inflight = {}          # ruta -> Future
+        self._converting = {}        # ruta -> [out_size, raw, durs, frames, cost_ms, boxes]
+        self.fmt = clip_format(size)  # misma clave de registro que usará el fondo
+        self._ready = OrderedDict()  # ruta -> coste de carga evitado (ms)
+        self._streamed = {}          # ruta -> bool (los de streaming no se precargan)
+        self.hits = self.misses = 0
+        self.stall_avoided_ms = 0.0
+        self.stall_paid_ms = 0.0
+
+    def _decode(self, path, size):
+        t0 = time.perf_counter()
+        out_size, raw, durs = decode_gif_raw(path, size)
+        # las cajas de los deltas también se calculan en el hilo
+        boxes = delta_boxes(out_size, raw) if self.fmt == "delta" and len(raw) > 1 else None
+        return (out_size, raw, durs, boxes), (time.perf_counter() - t0) * 1000.0
+
+    def request(self, paths):
+        """Pide precargar estas rutas (idempotente, se llama cada frame)."""
+        if self._pool is None:
+            if not pil_ok():
+                return
+            self._pool = ThreadPoolExecutor(max_workers=1)
+        for path in paths:
+            if path in self._ready or path in self._inflight or path in self._converting:
+                continue
+            if path not in self._streamed:
+                self._streamed[path] = should_stream(path, self.size)
+            if self._streamed[path] or REGISTRY.peek(path, self.size, self.fmt):
+                continue
+            self._inflight[path] = self._pool.submit(self._decode, path, self.size)
+        self._trim(keep=set(paths))
+
+    def poll(self):
+        """Recoge decodificaciones terminadas y convierte unos pocos frames."""
+        for path, fut in list(self._inflight.items()):
+            if fut.done():
+                del self._inflight[path]
+                try:
+                    (out_size, raw, durs, boxes), decode_ms = fut.result()
+                except Exception:
+                    continue
+                self._converting[path] = [out_size, raw, durs, [], decode_ms, boxes]
+
+        budget = PREFETCH_CONVERT_PER_FRAME
+        for path, job in list(self._converting.items()):
+            out_size, raw, durs, frames, _, boxes = job
+            t0 = time.perf_counter()
+            while budget > 0 and len(frames) < len(raw):
+                frames.extend(frames_from_raw(out_size, [raw[len(frames)]]))
+                budget -= 1
+            job[4] += (time.perf_counter() - t0) * 1000.0
+            if len(frames) == len(raw):
+                del self._converting[path]
+                # retener en el registro mientras siga en la caché de precarga
+                hold_frames(path, self.size, frames, durs, boxes)
+                self._ready[path] = job[4]
+            if budget <= 0:
+                break
+
+    def _trim(self, keep):
+        while len(self._ready) > self.max_cached:
+            victim = next((p for p in self._ready if p not in keep), None)
+            if victim is None:
+                break
+            del self._ready[victim]
+            REGISTRY.release(victim, self.size, self.fmt)
+
+    def claim(self, path):
+        """
+        Llamar justo antes de crear el fondo elegido. Si la precarga aún está
+        en curso se termina aquí (el tiempo esperado cuenta como stall).
+        """
+        t0 = time.perf_counter()
+        if path in self._inflight or path in self._converting:
+            if path in self._inflight:
+                self._inflight[path].result()
+            while path not in self._ready and (path in self._inflight or path in self._converting):
+                self.poll()
+        if path in self._ready:
+            waited = (time.perf_counter() - t0) * 1000.0
+            self.hits += 1
+            self.stall_avoided_ms += max(0.0, self._ready[path] - waited)
+            self.stall_paid_ms += waited
+            self._ready.move_to_end(path)
+            return True
+        if REGISTRY.peek(path, self.size, self.fmt):
+            self.hits += 1   # ya residente (p. ej. el fondo actual)
+            return True
+        self.misses += 1
+        return False
+
+    def record_stall(self, ms):
+        """Coste de una carga síncrona tras un fallo de precarga."""
+        self.stall_paid_ms += ms
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "stall_avoided_ms": self.stall_avoided_ms,
+            "stall_paid_ms": self.stall_paid_ms,
+            "cached": list(self._ready.keys()),
+        }
@@ -0,0 +1,256 @@
+import math
+from .constants import ANCHO, ALTO, PROJECTILE_CAPACITY, PROJECTILE_BACKEND
+
+# Movimiento de cada bala (columna "kind")
+KIND_LINEAR = 0
+KIND_WAVE = 1
+WAVE_AMP = 3.2      # px por frame a 60 Hz de la oscilación lateral
+
+# NumPy está en requirements.txt; se importa en el primer uso y, si falta,
+# se usa el almacén de listas (mismo resultado, sin vectorizar)
+np = None
+_NP_STATE = None   # None = sin probar, True/False = resultado
+
+def numpy_ok():
+    """Importa NumPy la primera vez; False si no está instalado."""
+    global np, _NP_STATE
+    if _NP_STATE is None:
+        try:
+            import numpy as _np
+            np = _np
+            _NP_STATE = True
+        except Exception as e:
+            print(f"[AVISO] NumPy no disponible ({e}; pip install -r requirements.txt): "
+                  "las balas del jefe se mueven sin vectorizar")
+            _NP_STATE = False
+    return _NP_STATE
+
+# Columnas: posición actual y del paso anterior (para interpolar), velocidad
+# en px por frame a 60 Hz, fase de la onda, tamaño, movimiento y sprite
+FLOAT_FIELDS = ("x", "y", "px", "py", "vx", "vy", "phase", "dphase")
+INT_FIELDS = ("w", "h", "kind", "sprite")
+
+class ListProjectiles:
+    """
+    Balas en estructura de arrays (una lista por columna) sin NumPy.
+    Las muertas se marcan y se compactan en el siguiente paso conservando el
+    orden de disparo, así el orden de dibujo y de impactos no cambia.
+    """
+    backend = "python"
+
+    def __init__(self, capacity=PROJECTILE_CAPACITY):
+        self.n = 0
+        for f in FLOAT_FIELDS + INT_FIELDS:
+            setattr(self, f, [])
+        self.alive = []
+        self._dead = 0
+
+    def __len__(self):
+        return self.n - self._dead
+
+    def clear(self):
+        for f in FLOAT_FIELDS + INT_FIELDS:
+            getattr(self, f).clear()
+        self.alive.clear()
+        self.n = self._dead = 0
+
+    def spawn(self, x, y, w, h, vx, vy, kind=KIND_LINEAR, sprite=0, phase=0.0, dphase=0.0):
+        x = float(x); y = float(y)
+        self.x.append(x); self.y.append(y); self.px.append(x); self.py.append(y)
+        self.vx.append(vx); self.vy.append(vy)
+        self.phase.append(phase); self.dphase.append(dphase)
+        self.w.append(w); self.h.append(h); self.kind.append(kind); self.sprite.append(sprite)
+        self.alive.append(True)
+        self.n += 1
+
+    def kill(self, i):
+        if self.alive[i]:
+            self.alive[i] = False
+            self._dead += 1
+
+    def step(self, scale=1.0, width=ANCHO, height=ALTO):
+        """Mueve todas las balas un paso y quita las que salen de pantalla."""
+        X, Y, PX, PY, VX, VY = self.x, self.y, self.px, self.py, self.vx, self.vy
+        PH, DPH, W, H, K, S, A = self.phase, self.dphase, self.w, self.h, self.kind, self.sprite, self.alive
+        sin, floor = math.sin, math.floor
+        j = 0
+        for i in range(self.n):
+            if not A[i]:
+                continue
+            x, y, w = X[i], Y[i], W[i]
+            # desplazamientos truncados con int() como hacía update_logic
+            if K[i] == KIND_WAVE:
+                PH[i] += DPH[i] * scale
+                nx = x + int(WAVE_AMP * sin(PH[i])) * scale
+            else:
+                nx = x + int(VX[i]) * scale
+            ny = y + int(VY[i]) * scale
+            fx = floor(nx)
+            if floor(ny) > height or fx + w < 0 or fx > width:
+                continue
+            if j != i:   # compacta en el sitio conservando el orden
+                VX[j], VY[j], PH[j], DPH[j] = VX[i], VY[i], PH[i], DPH[i]
+                W[j], H[j], K[j], S[j] = w, H[i], K[i], S[i]
+            X[j], Y[j], PX[j], PY[j] = nx, ny, x, y
+            j += 1
+        if j != self.n:
+            for col in (X, Y, PX, PY, VX, VY, PH, DPH, W, H, K, S, A):
+                del col[j:]
+            for i in range(j):
+                A[i] = True
+        self.n = j; self._dead = 0
+
+    def hits(self, rect):
+        """Índices (en orden de disparo) de las balas vivas que chocan con rect."""
+        floor = math.floor
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        X, Y, W, H, A = self.x, self.y, self.w, self.h, self.alive
+        out = []
+        for i in range(self.n):
+            fx = floor(X[i])
+            if fx < right and left < fx + W[i] and A[i]:
+                fy = floor(Y[i])
+                if fy < bottom and top < fy + H[i]:
+                    out.append(i)
+        return out
+
+    def positions(self, alpha=1.0):
+        """(x, y, sprite) de dibujo de las balas vivas, interpolando entre pasos."""
+        floor = math.floor
+        X, Y, PX, PY, S, A = self.x, self.y, self.px, self.py, self.sprite, self.alive
+        return [(floor(PX[i] + (X[i] - PX[i]) * alpha), floor(PY[i] + (Y[i] - PY[i]) * alpha), S[i])
+                for i in range(self.n) if A[i]]
+
+    def __iter__(self):
+        """(x, y, w, h, kind, sprite) de cada bala viva."""
+        floor = math.floor
+        for i in range(self.n):
+            if self.alive[i]:
+                yield (floor(self.x[i]), floor(self.y[i]), self.w[i], self.h[i],
+                       self.kind[i], self.sprite[i])
+
+class NumpyProjectiles:
+    """
+    Balas en estructura de arrays NumPy: movimiento, onda, descarte fuera de
+    pantalla y choques AABB se hacen con operaciones vectoriales.
+    Crece duplicando la capacidad; las muertas se compactan con una máscara
+    (estable, conserva el orden de disparo).
+    """
+    backend = "numpy"
+
+    def __init__(self, capacity=PROJECTILE_CAPACITY):
+        self.n = 0
+        self._dead = 0
+        self.capacity = 0
+        self._grow(max(16, capacity))
+
+    def _grow(self, capacity):
+        n = self.n
+        for f in FLOAT_FIELDS:
+            col = np.zeros(capacity, dtype=np.float64)
+            if n: col[:n] = getattr(self, f)[:n]
+            setattr(self, f, col)
+        for f in INT_FIELDS:
+            col = np.zeros(capacity, dtype=np.int32)
+            if n: col[:n] = getattr(self, f)[:n]
+            setattr(self, f, col)
+        alive = np.zeros(capacity, dtype=bool)
+        if n: alive[:n] = self.alive[:n]
+        self.alive = alive
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.n - self._dead
+
+    def clear(self):
+        self.n = self._dead = 0
+
+    def spawn(self, x, y, w, h, vx, vy, kind=KIND_LINEAR, sprite=0, phase=0.0, dphase=0.0):
+        i = self.n
+        if i == self.capacity:
+            self._grow(self.capacity * 2)
+        self.x[i] = self.px[i] = x; self.y[i] = self.py[i] = y
+        self.vx[i] = vx; self.vy[i] = vy
+        self.phase[i] = phase; self.dphase[i] = dphase
+        self.w[i] = w; self.h[i] = h; self.kind[i] = kind; self.sprite[i] = sprite
+        self.alive[i] = True
+        self.n = i + 1
+
+    def kill(self, i):
+        if self.alive[i]:
+            self.alive[i] = False
+            self._dead += 1
+
+    def _compact(self, keep):
+        n = int(keep.sum())
+        for f in FLOAT_FIELDS + INT_FIELDS:
+            col = getattr(self, f)
+            col[:n] = col[:self.n][keep]
+        self.alive[:n] = True
+        self.n = n; self._dead = 0
+
+    def step(self, scale=1.0, width=ANCHO, height=ALTO):
+        """Mueve todas las balas un paso y quita las que salen de pantalla."""
+        if self._dead:
+            self._compact(self.alive[:self.n].copy())
+        n = self.n
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        self.px[:n] = x; self.py[:n] = y
+        wave = self.kind[:n] == KIND_WAVE
+        # desplazamientos truncados con int() como hacía update_logic
+        dx = np.trunc(self.vx[:n])
+        if wave.any():
+            phase = self.phase[:n]
+            phase[wave] += self.dphase[:n][wave] * scale
+            dx[wave] = np.trunc(WAVE_AMP * np.sin(phase[wave]))
+        x += dx * scale
+        y += np.trunc(self.vy[:n]) * scale
+        fx = np.floor(x)
+        out = (np.floor(y) > height) | (fx + self.w[:n] < 0) | (fx > width)
+        if out.any():
+            self._compact(~out)
+
+    def hits(self, rect):
+        """Índices (en orden de disparo) de las balas vivas que chocan con rect."""
+        n = self.n
+        if not n:
+            return []
+        fx = np.floor(self.x[:n]); fy = np.floor(self.y[:n])
+        m = ((fx < rect.right) & (fx + self.w[:n] > rect.left) &
+             (fy < rect.bottom) & (fy + self.h[:n] > rect.top) & self.alive[:n])
+        return np.flatnonzero(m).tolist()
+
+    def positions(self, alpha=1.0):
+        """(x, y, sprite) de dibujo de las balas vivas, interpolando entre pasos."""
+        n = self.n
+        if not n:
+            return []
+        px, py = self.px[:n], self.py[:n]
+        xs = np.floor(px + (self.x[:n] - px) * alpha).astype(np.int64)
+        ys = np.floor(py + (self.y[:n] - py) * alpha).astype(np.int64)
+        sprites = self.sprite[:n]
+        if self._dead:
+            alive = self.alive[:n]
+            xs, ys, sprites = xs[alive], ys[alive], sprites[alive]
+        return list(zip(xs.tolist(), ys.tolist(), sprites.tolist()))
+
+    def __iter__(self):
+        """(x, y, w, h, kind, sprite) de cada bala viva."""
+        n = self.n
+        alive = self.alive[:n]
+        cols = (np.floor(self.x[:n]).astype(np.int64)[alive], np.floor(self.y[:n]).astype(np.int64)[alive],
+                self.w[:n][alive], self.h[:n][alive], self.kind[:n][alive], self.sprite[:n][alive])
+        return zip(*(c.tolist() for c in cols))
+
+_BACKEND_LOGGED = None
+
+def new_store(capacity=PROJECTILE_CAPACITY, backend=PROJECTILE_BACKEND):
+    """Almacén de balas: NumPy si está instalado (requirements.txt), si no listas."""
+    global _BACKEND_LOGGED
+    cls = NumpyProjectiles if backend != "python" and numpy_ok() else ListProjectiles
+    if _BACKEND_LOGGED != cls.backend:
+        _BACKEND_LOGGED = cls.backend
+        print(f"[INFO] Balas del jefe: almacén {cls.backend}")
+    return cls(capacity)
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from .constants import ASSET_MEMORY_BUDGET
+
+def _default_loader(path, size, fmt):
+    from .gif import load_gif_frames
+    from .loader import load_image
+    if fmt == "gif":
+        return load_gif_frames(path, size)
+    if fmt == "image":
+        return [load_image(path, size)], [120]
+    if fmt == "opaque":
+        return [load_image(path, size, alpha=False)], [120]
+    raise ValueError(f"Formato desconocido: {fmt}")
+
+def _surface_bytes(frames):
+    total = 0
+    for f in frames:
+        if isinstance(f, tuple):   # deltas: (rect, parche)
+            f = f[1]
+        if f is not None:
+            total += f.get_width() * f.get_height() * f.get_bytesize()
+    return total
+
+class AssetRegistry:
+    """
+    Registro único de frames decodificados, clave (ruta, tamaño, formato).
+    Cada clave se decodifica una sola vez y todos comparten la misma lista.
+    acquire/release llevan la cuenta de referencias; cuando la memoria de
+    surfaces supera el presupuesto se expulsan las entradas sin referencias
+    menos usadas recientemente.
+    """
+    def __init__(self, budget_bytes=ASSET_MEMORY_BUDGET):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()   # clave -> [frames, durations, refs, bytes]
+        self.total_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def key(path, size, fmt="gif"):
+        return (path, tuple(size) if size else None, fmt)
+
+    def acquire(self, path, size, fmt="gif", loader=None):
+        """
+        Devuelve (frames, durations) compartidos y suma una referencia.
+        `loader(path, size)` permite cargadores propios (con placeholder).
+        """
+        key = self.key(path, size, fmt)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if loader is not None:
+                frames, durations = loader(path, size)
+            else:
+                frames, durations = _default_loader(path, size, fmt)
+            entry = [frames, durations, 0, _surface_bytes(frames)]
+            self._entries[key] = entry
+            self.total_bytes += entry[3]
+        entry[2] += 1
+        self._entries.move_to_end(key)
+        self._evict()
+        return entry[0], entry[1]
+
+    def release(self, path, size, fmt="gif"):
+        key = self.key(path, size, fmt)
+        entry = self._entries.get(key)
+        if entry is None or entry[2] <= 0:
+            return
+        entry[2] -= 1
+        if entry[2] == 0:
+            # recién liberada: la más reciente entre las candidatas a expulsión
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def peek(self, path, size, fmt="gif"):
+        """(frames, durations) sin tocar referencias; None si no está cargado."""
+        entry = self._entries.get(self.key(path, size, fmt))
+        return (entry[0], entry[1]) if entry is not None else None
+
+    def _evict(self):
+        if self.total_bytes <= self.budget_bytes:
+            return
+        for key in list(self._entries.keys()):
+            if self.total_bytes <= self.budget_bytes:
+                break
+            entry = self._entries[key]
+            if entry[2] == 0:
+                del self._entries[key]
+                self.total_bytes -= entry[3]
+                self.evictions += 1
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "budget": self.budget_bytes,
+            "hits": self.hits, "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+# Instancia compartida por todo el juego
+REGISTRY = AssetRegistry()
@@ -0,0 +1,113 @@
+import pygame
+from .constants import ANCHO, ALTO
+
+# Capas de la escena de juego (se dibujan de menor a mayor)
+LAYER_PLAYER = 10
+LAYER_SHOTS = 20          # balas del jugador
+LAYER_ENEMIES = 30        # asteroides / jefe
+LAYER_BOSS_FX = 35        # barra de vida y láser del jefe
+LAYER_PICKUPS = 40        # power-ups
+LAYER_ENEMY_SHOTS = 40    # balas del jefe (no conviven con los power-ups)
+LAYER_BOMB_PICKUP = 50
+LAYER_BOMBS = 60
+
+class RenderQueue:
+    """
+    Cola de dibujo por capas para la escena de juego.
+    Las entidades envían (capa, sprite, rect de mundo[, área]); la cola
+    descarta lo que cae fuera del viewport, agrupa cada capa por textura
+    (en orden de primera aparición) y la vuelca con un solo Surface.blits.
+    Lo que no es un sprite (barras, láser, explosiones) se registra con
+    call() y se dibuja después de los sprites de su capa.
+    """
+    def __init__(self, viewport=(0, 0, ANCHO, ALTO)):
+        self.viewport = pygame.Rect(viewport)
+        self._layers = {}   # capa -> {textura: [(page, dest[, area])]}
+        self._calls = {}    # capa -> [fn(surface)]
+        self.ox = self.oy = 0
+        self.alpha = 1.0    # fracción de paso para interpolar posiciones
+        self.submitted = self.culled = self.drawn = self.batches = 0
+        self.frames = 0
+        self._totals = [0, 0, 0, 0]
+
+    def begin(self, cam_apply_point, alpha=1.0):
+        """Empieza un frame con el desplazamiento de la cámara y el alpha de interpolación."""
+        self.ox, self.oy = cam_apply_point(0, 0)
+        self.alpha = alpha
+        self._layers.clear(); self._calls.clear()
+        self.submitted = self.culled = self.drawn = self.batches = 0
+
+    def _bucket(self, layer, page):
+        groups = self._layers.get(layer)
+        if groups is None:
+            groups = self._layers[layer] = {}
+        bucket = groups.get(page)
+        if bucket is None:
+            bucket = groups[page] = []
+        return bucket
+
+    def submit_screen(self, layer, page, rect, area=None):
+        """Sprite ya proyectado a pantalla (rect con la posición final)."""
+        x, y, w, h = rect
+        self.submit(layer, page, (x - self.ox, y - self.oy, w, h), area)
+
+    def submit(self, layer, page, rect, area=None):
+        """Sprite en coordenadas de mundo; rect da posición y tamaño."""
+        self.submitted += 1
+        x, y, w, h = rect
+        x += self.ox; y += self.oy
+        vp = self.viewport
+        if x >= vp.right or y >= vp.bottom or x + w <= vp.left or y + h <= vp.top:
+            self.culled += 1
+            return
+        self._bucket(layer, page).append((page, (x, y), area) if area is not None else (page, (x, y)))
+
+    def submit_many(self, layer, sprites):
+        """Varios sprites (page, x, y, w, h) de mundo en la misma capa."""
+        ox, oy = self.ox, self.oy
+        vp = self.viewport
+        left, top, right, bottom = vp.left, vp.top, vp.right, vp.bottom
+        last = bucket = None
+        kept = 0
+        for page, x, y, w, h in sprites:
+            x += ox; y += oy
+            if x < right and y < bottom and x + w > left and y + h > top:
+                if page is not last:
+                    last, bucket = page, self._bucket(layer, page)
+                bucket.append((page, (x, y)))
+                kept += 1
+        self.submitted += len(sprites)
+        self.culled += len(sprites) - kept
+
+    def call(self, layer, fn):
+        """Dibujo inmediato fn(surface) tras los sprites de la capa."""
+        calls = self._calls.get(layer)
+        if calls is None:
+            calls = self._calls[layer] = []
+        calls.append(fn)
+
+    def flush(self, surface):
+        for layer in sorted(self._layers.keys() | self._calls.keys()):
+            groups = self._layers.get(layer)
+            if groups:
+                items = next(iter(groups.values())) if len(groups) == 1 else \
+                        [it for bucket in groups.values() for it in bucket]
+                surface.blits(items, doreturn=False)
+                self.drawn += len(items)
+                self.batches += 1
+            for fn in self._calls.get(layer, ()):
+                fn(surface)
+        self.frames += 1
+        for i, n in enumerate((self.submitted, self.culled, self.drawn, self.batches)):
+            self._totals[i] += n
+
+    def stats(self):
+        """Contadores del último frame y medias por frame."""
+        f = max(1, self.frames)
+        sub, cul, drw, bat = self._totals
+        return {
+            "submitted": self.submitted, "culled": self.culled,
+            "drawn": self.drawn, "batches": self.batches, "frames": self.frames,
+            "avg_submitted": sub / f, "avg_culled": cul / f,
+            "avg_drawn": drw / f, "avg_batches": bat / f,
+        }
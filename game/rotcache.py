@@ -0,0 +1,71 @@
+"""
+Caché de rotaciones cuantizadas para sprites que se inclinan (la nave).
+
+`python tools/bench.py rotation` compara, para cada skin, el coste por
+frame de rotozoom directo contra la caché.
+"""
+import time
+import pygame
+from pygame.math import Vector2
+from .constants import PLAYER_ROT_STEP
+
+class RotationCache:
+    """
+    Frames rotados con clave (skin, índice de frame, ángulo cuantizado a
+    `step` grados), más los desplazamientos rotados (p. ej. la punta del
+    cañón) por ángulo. Solo se guarda un skin a la vez.
+    """
+    def __init__(self, step=PLAYER_ROT_STEP):
+        self.step = step
+        self.skin = None
+        self._frames = {}    # (skin, idx, paso) -> Surface rotada
+        self._offsets = {}   # (offset, paso) -> (dx, dy)
+        self.hits = self.misses = 0
+
+    def quantize(self, angle):
+        return int(round(angle / self.step))
+
+    def _use_skin(self, skin):
+        if skin != self.skin:
+            self._frames.clear()
+            self.skin = skin
+
+    def rotated(self, skin, idx, frame, angle):
+        """Frame rotado -angle grados (como rotozoom(frame, -angle, 1.0))."""
+        self._use_skin(skin)
+        q = self.quantize(angle)
+        key = (skin, idx, q)
+        surf = self._frames.get(key)
+        if surf is None:
+            self.misses += 1
+            surf = pygame.transform.rotozoom(frame, -q * self.step, 1.0)
+            self._frames[key] = surf
+        else:
+            self.hits += 1
+        return surf
+
+    def rotated_offset(self, offset, angle):
+        """Vector `offset` (dx, dy) rotado -angle grados, cuantizado igual."""
+        q = self.quantize(angle)
+        key = (offset, q)
+        out = self._offsets.get(key)
+        if out is None:
+            v = Vector2(offset).rotate(-q * self.step)
+            out = self._offsets[key] = (v.x, v.y)
+        return out
+
+    def prebuild(self, skin, frames, max_angle):
+        """Rellena todas las rotaciones de [-max_angle, +max_angle] de un skin."""
+        t0 = time.perf_counter()
+        self._use_skin(skin)
+        n = self.quantize(max_angle)
+        for idx, frame in enumerate(frames):
+            for q in range(-n, n + 1):
+                key = (skin, idx, q)
+                if key not in self._frames:
+                    self._frames[key] = pygame.transform.rotozoom(frame, -q * self.step, 1.0)
+        return (time.perf_counter() - t0) * 1000.0
+
+    def stats(self):
+        return {"skin": self.skin, "surfaces": len(self._frames),
+                "hits": self.hits, "misses": self.misses}
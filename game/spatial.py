@@ -0,0 +1,139 @@
+from .constants import SPATIAL_CELL, SPATIAL_MIN_ITEMS
+
+def _rect_attr(obj):
+    return obj.rect
+
+class SpatialHash:
+    """
+    Rejilla uniforme para la fase amplia de colisiones.
+    build() reparte los objetos de una lista en celdas de `cell` px según su
+    rect; query() solo prueba colliderect con los que comparten celda con el
+    rect pedido y los devuelve en el orden de la lista original, así el
+    resultado es el mismo que el de un bucle anidado.
+    Los rects se guardan por referencia: si uno se mueve entre consultas hay
+    que llamar a move() para recolocarlo.
+    Con menos de min_items objetos no se reparten en celdas: las consultas
+    recorren la lista con collidelist, que hasta unos cientos de objetos es
+    más barato que montar la rejilla (en partida normal siempre es así).
+    """
+    def __init__(self, cell=SPATIAL_CELL, min_items=SPATIAL_MIN_ITEMS):
+        self.cell = cell
+        self.min_items = min_items
+        self._linear = True
+        self._cells = {}    # clave de celda -> [índice]
+        self._objs = []     # índice -> objeto
+        self._rects = []    # índice -> Rect
+        self._keys = []     # índice -> claves de celda que ocupa
+        self._index = {}    # id(objeto) -> índice
+        self.queries = self.tests = 0
+        self.builds = self.grid_builds = 0
+
+    def _cover(self, r):
+        c = self.cell
+        x0, x1 = r.left // c, (r.right - 1) // c
+        y0, y1 = r.top // c, (r.bottom - 1) // c
+        if x0 == x1 and y0 == y1:
+            return ((y0 << 16) + x0,)
+        return tuple((y << 16) + x for y in range(y0, y1 + 1) for x in range(x0, x1 + 1))
+
+    def build(self, objs, rect_of=_rect_attr):
+        """Vacía la rejilla y mete todos los objetos (en ese orden)."""
+        self._cells.clear(); self._index.clear()
+        self._objs = list(objs)
+        self._rects = [rect_of(o) for o in self._objs]
+        self._keys = []
+        self._linear = len(self._objs) < self.min_items
+        self.builds += 1
+        if self._linear:
+            return self
+        self.grid_builds += 1
+        cells = self._cells
+        for i, r in enumerate(self._rects):
+            keys = self._cover(r)
+            self._keys.append(keys)
+            for k in keys:
+                bucket = cells.get(k)
+                if bucket is None:
+                    cells[k] = [i]
+                else:
+                    bucket.append(i)
+        return self
+
+    def move(self, obj):
+        """Recoloca un objeto cuyo rect cambió desde build()."""
+        if self._linear:
+            return
+        if not self._index:
+            self._index = {id(o): i for i, o in enumerate(self._objs)}
+        i = self._index.get(id(obj))
+        if i is None:
+            return
+        keys = self._cover(self._rects[i])
+        old = self._keys[i]
+        if keys == old:
+            return
+        cells = self._cells
+        for k in old:
+            cells[k].remove(i)
+        for k in keys:
+            bucket = cells.get(k)
+            if bucket is None:
+                cells[k] = [i]
+            else:
+                bucket.append(i)
+        self._keys[i] = keys
+
+    def query(self, rect, start=0):
+        """Objetos que chocan con rect, en orden de lista (desde el índice start)."""
+        self.queries += 1
+        rects, objs = self._rects, self._objs
+        if self._linear:
+            self.tests += max(0, len(rects) - start)
+            return [objs[i] for i in range(start, len(rects)) if rect.colliderect(rects[i])]
+        cells = self._cells
+        keys = self._cover(rect)
+        if len(keys) == 1:
+            cand = sorted(cells.get(keys[0], ()))   # move() puede desordenar
+        else:
+            seen = set()
+            for k in keys:
+                bucket = cells.get(k)
+                if bucket:
+                    seen.update(bucket)
+            cand = sorted(seen)
+        self.tests += len(cand)
+        return [objs[i] for i in cand if i >= start and rect.colliderect(rects[i])]
+
+    def query_index(self, rect, start=0):
+        """Como query() pero devuelve el índice del primer choque (o None)."""
+        self.queries += 1
+        rects = self._rects
+        if self._linear:
+            i = rect.collidelist(rects[start:]) if start else rect.collidelist(rects)
+            self.tests += max(0, len(rects) - start)
+            return None if i < 0 else i + start
+        cells = self._cells
+        best = None
+        for k in self._cover(rect):
+            for i in cells.get(k, ()):
+                self.tests += 1
+                if i >= start and (best is None or i < best) and rect.colliderect(rects[i]):
+                    best = i
+        return best
+
+    def first(self, rect, start=0):
+        """Primer objeto (en orden de lista) que choca con rect, o None."""
+        i = self.query_index(rect, start)
+        return None if i is None else self._objs[i]
+
+    def __getitem__(self, i):
+        return self._objs[i]
+
+    def __len__(self):
+        return len(self._objs)
+
+    def stats(self):
+        """Consultas, pruebas colliderect y cuántas construcciones usaron la rejilla."""
+        return {"queries": self.queries, "tests": self.tests,
+                "builds": self.builds, "grid_builds": self.grid_builds,
+                "tests_per_query": self.tests / self.queries if self.queries else 0.0}
@@ -0,0 +1,48 @@
+import time
+
+class StartupProfile:
+    """
+    Cronómetro de las fases del arranque (import, set_mode, fuentes, cada
+    grupo de assets, audio y primer flip) para `main.py --startup-report`.
+    Cada mark() guarda el tiempo transcurrido desde la marca anterior.
+    """
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._last = self.t0
+        self.phases = []            # (fase, ms)
+        self.first_frame_ms = None
+        self.verbose = False        # imprimir el informe tras el primer frame
+        self.stop_after_first_frame = False
+
+    def start(self, t0=None):
+        self.t0 = self._last = t0 if t0 is not None else time.perf_counter()
+        self.phases.clear()
+        self.first_frame_ms = None
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000.0))
+        self._last = now
+
+    def first_frame(self):
+        """Llamar tras cada flip; True solo la primera vez."""
+        if self.first_frame_ms is not None:
+            return False
+        self.mark("primer flip")
+        self.first_frame_ms = (self._last - self.t0) * 1000.0
+        if self.verbose:
+            self.report()
+        return True
+
+    def report(self):
+        print("[INFO] Arranque por fases:")
+        for phase, ms in self.phases:
+            print(f"[INFO]   {phase:<28} {ms:8.1f} ms")
+        if self.first_frame_ms is not None:
+            print(f"[INFO]   {'tiempo hasta el primer frame':<28} {self.first_frame_ms:8.1f} ms")
+
+    def within_budget(self, budget_ms):
+        return self.first_frame_ms is not None and self.first_frame_ms <= budget_ms
+
+# Instancia compartida (main.py la inicia antes de importar el juego)
+STARTUP = StartupProfile()
@@ -3,10 +3,17 @@ from .constants import *
 from .entities.player import Jugador
 from .entities.enemy import crear_enemigos, respawnear_enemigo
 from .entities.boss import Boss
-from .entities.bullet import Bala
-from .entities.powerups import PowerUp, BombPickup, BombProjectile
+from .entities.bullet import Bala, BULLET_POOL
+from .entities.powerups import PowerUp, BombPickup, BombProjectile, POWERUP_POOL, BOMB_POOL
 from .utils import reproducir
-from .assets import BALA_IMG  # (asegura carga)
+from .projectiles import new_store
+
+def liberar_entidades(juego):
+    """Devuelve balas, power-ups y bombas a sus reservas y vacía las listas."""
+    BULLET_POOL.release_all(juego["balas"])
+    POWERUP_POOL.release_all(juego["powerups"])
+    BOMB_POOL.release_all(juego["bombs"])
+    juego["boss_bullets"].clear()
 
 def activar_pantalla_nivel(juego, ahora):
     juego["vidas"] = 3
@@ -14,16 +21,15 @@ def activar_pantalla_nivel(juego, ahora):
     juego["player"].rect.bottom = ALTO - 10
     juego["player"].angle = 0.0
     juego["player"].target_angle = 0.0
-    juego["balas"].clear()
-    juego["boss_bullets"].clear()
-    juego["powerups"].clear()
-    juego["bombs"].clear()
+    liberar_entidades(juego)
     juego["bomb_pickup"] = None
     juego["invulnerable_hasta"] = 0
     juego["intro_end_time"] = ahora + LEVEL_INTRO_MS
     juego["intro_text"] = f"NIVEL {juego['nivel']}"
 
-def reset_juego():
+def reset_juego(anterior=None):
+    if anterior is not None:
+        liberar_entidades(anterior)
     player = Jugador(ANCHO//2, ALTO - 10)
     balas = []
     vel_bala = -9
@@ -36,7 +42,7 @@ def reset_juego():
     nivel = 1; puntaje = 0; vidas = 3
     invulnerable_hasta = 0; invulnerable_ms = 1200
 
-    boss = None; boss_active=False; boss_bullets=[]
+    boss = None; boss_active=False; boss_bullets=new_store()
     boss_threshold_cleared=set()
 
     powerups=[]; s_active_until=0; f_active_until=0; p_active_until=0
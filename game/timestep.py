@@ -0,0 +1,95 @@
+from math import floor
+from .constants import SIM_HZ, SIM_BASE_HZ, SIM_MAX_STEPS
+
+class FixedTimestep:
+    """
+    Acumulador de paso fijo: advance(ms del frame) dice cuántos pasos de
+    simulación tocan; lo que sobra queda para el siguiente frame y alpha
+    (0..1) es la fracción de paso pendiente, para interpolar al dibujar.
+    Si un frame tarda demasiado se simulan como mucho max_steps pasos y el
+    resto se descarta (el juego se ralentiza en vez de congelarse).
+    """
+    def __init__(self, hz=SIM_HZ, max_steps=SIM_MAX_STEPS):
+        self.configure(hz, max_steps)
+
+    def configure(self, hz, max_steps=None):
+        self.hz = hz
+        self.step_ms = 1000.0 / hz
+        # las velocidades están pensadas por frame a SIM_BASE_HZ
+        self.scale = SIM_BASE_HZ / hz
+        if max_steps is not None:
+            self.max_steps = max_steps
+        self.acc = 0.0
+        self.frames = self.steps = 0
+        self.dropped_ms = 0.0
+
+    def advance(self, frame_ms):
+        self.frames += 1
+        self.acc += frame_ms
+        n = int(self.acc // self.step_ms)
+        if n > self.max_steps:
+            self.dropped_ms += (n - self.max_steps) * self.step_ms
+            n = self.max_steps
+        self.acc -= n * self.step_ms
+        if n == self.max_steps:
+            self.acc = min(self.acc, self.step_ms)
+        self.steps += n
+        return n
+
+    @property
+    def alpha(self):
+        return min(1.0, self.acc / self.step_ms)
+
+    def stats(self):
+        return {
+            "hz": self.hz, "frames": self.frames, "steps": self.steps,
+            "steps_per_frame": self.steps / self.frames if self.frames else 0.0,
+            "dropped_ms": self.dropped_ms,
+        }
+
+SIM = FixedTimestep()
+
+def rect_delta(pos, v):
+    """
+    Desplazamiento entero que aplicaba un Rect al hacer `coord += v` con v
+    decimal: pygame redondea pos + v alejándose de cero (1.7 -> 2, -2.5 -> -3).
+    """
+    t = pos + v
+    return (floor(t + 0.5) if t >= 0 else -floor(-t + 0.5)) - pos
+
+class Motion:
+    """
+    Posición en coma flotante de un Rect y la del paso anterior: permite
+    velocidades fraccionarias y dibujar interpolando entre los dos pasos.
+    El Rect sigue siendo la referencia (colisiones); si se mueve desde fuera
+    (respawn, reinicio, clamp) la posición se resincroniza sin interpolar.
+    """
+    __slots__ = ("rect", "x", "y", "px", "py")
+
+    def __init__(self, rect):
+        self.rect = rect
+        self.x = self.px = float(rect.x)
+        self.y = self.py = float(rect.y)
+
+    def sync(self):
+        """Toma la posición del rect sin interpolar (entidad recolocada o reutilizada)."""
+        self.x = self.px = float(self.rect.x)
+        self.y = self.py = float(self.rect.y)
+
+    def step(self, dx, dy):
+        r = self.rect
+        if r.x != floor(self.x):
+            self.x = float(r.x)
+        if r.y != floor(self.y):
+            self.y = float(r.y)
+        self.px, self.py = self.x, self.y
+        self.x += dx; self.y += dy
+        r.x = floor(self.x); r.y = floor(self.y)
+
+    def at(self, alpha):
+        """(x, y) de dibujo entre el paso anterior y el actual."""
+        r = self.rect
+        x, y = self.x, self.y
+        if r.x != floor(x) or r.y != floor(y):
+            return r.x, r.y   # movido desde fuera después del último paso
+        return floor(self.px + (x - self.px) * alpha), floor(self.py + (y - self.py) * alpha)
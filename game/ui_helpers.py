@@ -1,9 +1,11 @@
 import pygame
 from .constants import ANCHO, ALTO
+from .overlay import OVERLAYS
 
 def draw_letterbox(surface, alpha=200, size=90):
-    s = pygame.Surface((ANCHO, size), pygame.SRCALPHA); s.fill((0,0,0,alpha))
-    surface.blit(s, (0,0)); surface.blit(s, (0,ALTO-size))
+    # ambas bandas comparten la superficie del pool
+    OVERLAYS.fill_rect(surface, (0, 0, ANCHO, size), (0,0,0), alpha)
+    OVERLAYS.fill_rect(surface, (0, ALTO-size, ANCHO, size), (0,0,0), alpha)
 
 def draw_focus_ring(surface, rect, color=(255,255,255), width=3):
     pygame.draw.rect(surface, color, rect, width, border_radius=12)
@@ -15,3 +17,68 @@ def draw_slider(surface, x, y, w, value, selected):
     fill_rect = pygame.Rect(x, y, fill_w, 10)
     pygame.draw.rect(surface, (255,215,0) if selected else (120,160,255), fill_rect, border_radius=6)
     pygame.draw.rect(surface, (180,180,200), bg_rect, 2, border_radius=6)
+
+def _partial_alpha(surf):
+    """True si algún pixel no es ni opaco ni totalmente transparente."""
+    return pygame.mask.from_surface(surf, 0).count() != pygame.mask.from_surface(surf, 254).count()
+
+class CachedLayer:
+    """
+    Capa estática: se dibuja una vez en su propia superficie con `render` y
+    se reutiliza mientras la clave no cambie (índice seleccionado, skin...).
+    Cada frame cuesta un blit. `mode`: "opaque" (sin transparencia),
+    "colorkey" (pixeles opacos o totalmente transparentes; blit barato) o
+    "alpha" (alfa por pixel).
+    "colorkey" solo es exacto si todo lo semitransparente (bordes suavizados
+    del texto) cae sobre algo opaco dentro de la capa, como la tarjeta del
+    menú: sobre el hueco se mezclaría con el color clave. Si al reconstruir
+    aparece algún pixel semitransparente la capa pasa a "alpha".
+    """
+    _UNSET = object()
+    COLORKEY = (255, 0, 255)
+
+    def __init__(self, rect, render, mode="alpha"):
+        self.rect = pygame.Rect(rect)
+        self.render = render          # render(surface, origin) dibuja la capa
+        self.mode = mode
+        self.surface = None
+        self.key = self._UNSET
+        self.rebuilds = self.reuses = 0
+
+    def invalidate(self):
+        self.key = self._UNSET
+
+    def _new_surface(self):
+        if self.mode == "alpha":
+            return pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        surf = pygame.Surface(self.rect.size).convert()
+        if self.mode == "colorkey":
+            surf.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+        return surf
+
+    def draw(self, surface, key=None):
+        if self.key is self._UNSET or key != self.key:
+            if self.surface is None:
+                self.surface = self._new_surface()
+            if self.mode == "colorkey":
+                # se compone con alfa y luego se aplana sobre el color clave,
+                # así los bordes suavizados del texto quedan igual que en pantalla
+                scratch = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+                self.render(scratch, self.rect.topleft)
+                if _partial_alpha(scratch):
+                    print("[AVISO] Capa con bordes semitransparentes fuera de fondo opaco: "
+                          "se usa alfa por pixel")
+                    self.mode = "alpha"
+                    self.surface = scratch
+                else:
+                    self.surface.fill(self.COLORKEY)
+                    self.surface.blit(scratch, (0, 0))
+            else:
+                self.surface.fill((0, 0, 0, 0))
+                # render dibuja en coordenadas de pantalla; origin las traslada
+                self.render(self.surface, self.rect.topleft)
+            self.key = key
+            self.rebuilds += 1
+        else:
+            self.reuses += 1
+        surface.blit(self.surface, self.rect)
@@ -1,5 +1,7 @@
 import os
+from collections import OrderedDict
 import pygame
+from .constants import TEXT_CACHE_SIZE
 
 # --------- Audio helpers ----------
 def cargar_sonido(ruta, volumen=0.5):
@@ -43,8 +45,98 @@ def load_font(size, bold=False):
     # Fallback
     return pygame.font.SysFont("Arial", size, bold=bold)
 
+class TextCache:
+    """
+    Textos ya rasterizados con clave (fuente, texto, color, antialias) y
+    expulsión LRU. Los textos con dígitos no se rasterizan: se componen
+    desde un atlas de glifos por (fuente, color, antialias) más los tramos
+    sin dígitos ya cacheados, así "Puntaje: 1234" -> "Puntaje: 1244" solo
+    cuesta unos blits.
+    """
+    DIGITS = "0123456789"
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._texts = OrderedDict()    # (fuente, texto, color, aa) -> Surface
+        self._glyphs = OrderedDict()   # (fuente, color, aa) -> (atlas, [Rect] por dígito)
+        self.hits = self.misses = 0
+        self.glyph_hits = self.glyph_misses = 0
+
+    def render(self, fuente, texto, color, antialias=True):
+        key = (fuente, texto, tuple(color), antialias)
+        img = self._texts.get(key)
+        if img is not None:
+            self.hits += 1
+            self._texts.move_to_end(key)
+            return img
+        self.misses += 1
+        if any(c in self.DIGITS for c in texto):
+            img = self._compose(fuente, texto, key[2], antialias)
+        else:
+            img = fuente.render(texto, antialias, color)
+        self._texts[key] = img
+        if len(self._texts) > self.max_entries:
+            self._texts.popitem(last=False)
+        return img
+
+    def digits(self, fuente, color, antialias=True):
+        """(atlas, rects) con los glifos 0-9 en una sola superficie."""
+        key = (fuente, tuple(color), antialias)
+        entry = self._glyphs.get(key)
+        if entry is not None:
+            self.glyph_hits += 1
+            self._glyphs.move_to_end(key)
+            return entry
+        self.glyph_misses += 1
+        imgs = [fuente.render(d, antialias, color) for d in self.DIGITS]
+        atlas = pygame.Surface((sum(i.get_width() for i in imgs),
+                                max(i.get_height() for i in imgs)), pygame.SRCALPHA)
+        rects, x = [], 0
+        for img in imgs:
+            atlas.blit(img, (x, 0))
+            rects.append(pygame.Rect(x, 0, img.get_width(), img.get_height()))
+            x += img.get_width()
+        entry = self._glyphs[key] = (atlas, rects)
+        if len(self._glyphs) > max(8, self.max_entries // 16):
+            self._glyphs.popitem(last=False)
+        return entry
+
+    def _compose(self, fuente, texto, color, antialias):
+        """Texto con dígitos: tramos de letras cacheados + glifos del atlas."""
+        atlas, rects = self.digits(fuente, color, antialias)
+        pieces, run = [], ""
+        for c in texto:
+            if c in self.DIGITS:
+                if run:
+                    img = self.render(fuente, run, color, antialias)
+                    pieces.append((img, img.get_rect())); run = ""
+                pieces.append((atlas, rects[ord(c) - 48]))
+            else:
+                run += c
+        if run:
+            img = self.render(fuente, run, color, antialias)
+            pieces.append((img, img.get_rect()))
+        out = pygame.Surface((sum(a.width for _, a in pieces),
+                              max(a.height for _, a in pieces)), pygame.SRCALPHA)
+        x = 0
+        for img, area in pieces:
+            # sobre transparente, sumar RGBA copia el glifo tal cual
+            out.blit(img, (x, 0), area, special_flags=pygame.BLEND_RGBA_ADD)
+            x += area.width
+        return out
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"entries": len(self._texts), "hits": self.hits, "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "glyph_atlases": len(self._glyphs),
+                "glyph_hits": self.glyph_hits, "glyph_misses": self.glyph_misses}
+
+# Caché compartida por todo el juego
+TEXT_CACHE = TextCache()
+
 def dibujar_texto(superficie, texto, fuente, color, x, y, centrado=False):
-    img = fuente.render(texto, True, color)
+    img = TEXT_CACHE.render(fuente, texto, color)
     rect = img.get_rect()
     if centrado:
         rect.center = (x, y)
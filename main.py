@@ -1,17 +1,59 @@
+import time
+_T0 = time.perf_counter()   # el informe de arranque incluye los imports
+
+import argparse, sys
 import pygame
+from game.startup import STARTUP
+STARTUP.start(_T0)
 from game.app import GameApp
+from game.constants import STARTUP_BUDGET_MS, SIM_HZ, FPS
+from game.timestep import SIM
+STARTUP.mark("import")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Space Adventure")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="imprime el tiempo de cada fase del arranque")
+    parser.add_argument("--startup-budget", type=float, nargs="?", const=STARTUP_BUDGET_MS,
+                        metavar="MS",
+                        help="sale tras el primer frame; código 1 si se superan MS "
+                             f"(por defecto {STARTUP_BUDGET_MS} ms)")
+    parser.add_argument("--sim-hz", type=int, default=SIM_HZ, metavar="HZ",
+                        help=f"frecuencia fija de la simulación (por defecto {SIM_HZ})")
+    parser.add_argument("--fps", type=int, default=FPS, metavar="N",
+                        help=f"tope de frames dibujados, 0 = sin tope (por defecto {FPS})")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
+    args = parse_args()
+    STARTUP.verbose = args.startup_report
+    STARTUP.stop_after_first_frame = args.startup_budget is not None
+    SIM.configure(args.sim_hz)
+
     pygame.init()
+    STARTUP.mark("pygame.init")
     try:
         pygame.mixer.init()
     except Exception as e:
         print("[AVISO] Audio deshabilitado:", e)
+    STARTUP.mark("audio: mixer")
 
     app = GameApp()
+    app.render_fps = args.fps
+    exit_code = 0
     try:
         app.run()
     except KeyboardInterrupt:
         pass
     finally:
         pygame.quit()
+
+    if args.startup_budget is not None:
+        if STARTUP.within_budget(args.startup_budget):
+            print(f"[INFO] Primer frame en {STARTUP.first_frame_ms:.0f} ms "
+                  f"(presupuesto {args.startup_budget:.0f} ms)")
+        else:
+            print(f"[AVISO] Primer frame en {STARTUP.first_frame_ms or 0:.0f} ms: "
+                  f"supera el presupuesto de {args.startup_budget:.0f} ms")
+            exit_code = 1
+    sys.exit(exit_code)
@@ -0,0 +1,546 @@
+"""
+Comprobaciones y mediciones de rendimiento: `python tools/bench.py [nombre ...]`
+
+Cada sección comprueba con assert el invariante que promete la optimización
+(mismo resultado que el código anterior) y luego imprime tiempos. Sin
+argumentos se ejecutan todas; el código de salida es 1 si alguna falla.
+"""
+import os, sys, time, argparse, traceback
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import pygame
+from game.constants import ANCHO, ALTO
+
+SECTIONS = {}
+
+def section(fn):
+    SECTIONS[fn.__name__] = fn
+    return fn
+
+def _display():
+    if not pygame.display.get_surface():
+        pygame.init()
+        pygame.display.set_mode((ANCHO, ALTO))
+        from game import assets as Assets
+        Assets.init_after_display()
+
+@section
+def motion(frames=60):
+    """Paso fijo: asteroides y pickup de bomba recorren lo mismo que con `rect.y += v`."""
+    _display()
+    import math
+    from game.timestep import SIM
+    from game.entities.enemy import FallingEnemy
+    from game.entities.powerups import BombPickup
+    for hz in (60, 120, 240):
+        SIM.configure(hz)
+        steps = hz // 60
+        for v in (1.7, 2.0, 2.5, 2.9, 3.5, 3.8, 4.6):
+            for y0 in (-120, 0, 200):
+                ref = pygame.Rect(100, y0, 40, 40)
+                e = FallingEnemy(100, y0)
+                for _ in range(frames):
+                    ref.y += v
+                    for _ in range(steps):
+                        e.update(1000 / hz, v)
+                assert e.rect.y == ref.y, f"asteroide v={v} y0={y0} a {hz} Hz: {e.rect.y} != {ref.y}"
+        bp = BombPickup(300, -20, 0)
+        bp.phase = 0.3
+        ref = bp.rect.copy(); phase = 0.3
+        for _ in range(frames):
+            phase += 0.06
+            ref.y += bp.vy
+            ref.x += int(2.0 * math.sin(phase))
+            for _ in range(steps):
+                bp.update(0)
+        assert bp.rect.topleft == ref.topleft, f"pickup a {hz} Hz: {bp.rect.topleft} != {ref.topleft}"
+    SIM.configure(60)
+    print(f"[INFO] motion: {frames} frames a 60/120/240 Hz = mismas posiciones que el Rect")
+
+@section
+def spatial(sizes=(24, 96, 384, 768, 1536, 10000), repeat=5):
+    """Colisiones: la rejilla da los mismos choques que recorrer la lista; tiempos de ambas."""
+    import random
+    from game.constants import ASTEROID_W, ASTEROID_H, PLAYER_W, PLAYER_H, SPATIAL_MIN_ITEMS
+    from game.spatial import SpatialHash
+    rng = random.Random(7)
+    linear = SpatialHash(min_items=1 << 30)
+    grid = SpatialHash(min_items=0)
+    for n in sizes:
+        # densidad constante: el área crece con el número de entidades
+        scale = max(1.0, (n / 20) ** 0.5)
+        w, h = int(ANCHO * scale), int(ALTO * scale)
+        n_shots, n_enemies = n // 2, n - n // 2
+        shots = [pygame.Rect(rng.randrange(w), rng.randrange(h), 6, 14) for _ in range(n_shots)]
+        enemies = [pygame.Rect(rng.randrange(w), rng.randrange(h), ASTEROID_W, ASTEROID_H)
+                   for _ in range(n_enemies)]
+        player = pygame.Rect(w // 2, h - PLAYER_H - 10, PLAYER_W, PLAYER_H)
+
+        # mismos resultados, incluso tras mover un objeto como hace respawnear_enemigo
+        big = pygame.Rect(0, 0, 3 * ASTEROID_W, 3 * ASTEROID_H)
+        for g in (linear, grid):
+            g.build(enemies, rect_of=lambda r: r)
+        for k, s in enumerate(shots[:200]):
+            big.center = s.center
+            assert linear.first(s) is grid.first(s), f"{n}: first() distinto"
+            assert linear.query(big) == grid.query(big), f"{n}: query() distinto"
+            start = k % max(1, n_enemies)
+            assert linear.query_index(big, start) == grid.query_index(big, start), \
+                f"{n}: query_index(start={start}) distinto"
+            hit = grid.first(s)
+            if hit is not None:
+                hit.topleft = (rng.randrange(w), -rng.randrange(ASTEROID_H, 4 * ASTEROID_H))
+                linear.move(hit); grid.move(hit)
+
+        def nested():
+            hits = []
+            for s in shots:
+                for e in enemies:
+                    if s.colliderect(e):
+                        hits.append(e); break
+            for e in enemies:
+                if player.colliderect(e):
+                    hits.append(e); break
+            return hits
+
+        def hashed(g):
+            def run():
+                g.build(enemies, rect_of=lambda r: r)
+                hits = [e for e in map(g.first, shots) if e is not None]
+                e = g.first(player)
+                if e is not None:
+                    hits.append(e)
+                return hits
+            return run
+
+        res = []
+        for fn in (nested, hashed(linear), hashed(grid)):
+            out = fn()
+            reps = 1 if n >= 10000 and fn is nested else repeat
+            t0 = time.perf_counter()
+            for _ in range(reps):
+                fn()
+            res.append(((time.perf_counter() - t0) * 1000.0 / reps, out))
+        (t_n, a), (t_l, b), (t_g, c) = res
+        assert a == b == c, f"{n}: choques distintos entre bucles, lista y rejilla"
+        used = "rejilla" if n_enemies >= SPATIAL_MIN_ITEMS else "lista"
+        print(f"[INFO] spatial {n:>6} entidades: bucles {t_n:9.3f} ms, collidelist {t_l:8.3f} ms, "
+              f"rejilla {t_g:8.3f} ms (SPATIAL_MIN_ITEMS={SPATIAL_MIN_ITEMS} -> usa {used})")
+
+@section
+def projectiles(n_steps=400, sizes=(100, 1000, 5000, 20000), n_timed=60, n_mem=5000):
+    """Balas del jefe: almacenes iguales al bucle de dicts anterior y entre sí; coste y memoria."""
+    import math, random, tracemalloc
+    from game import projectiles as P
+    from game.timestep import Motion
+    backends = [("listas", P.ListProjectiles)]
+    if P.numpy_ok():
+        backends.append(("numpy", P.NumpyProjectiles))
+    else:
+        print("[AVISO] projectiles: NumPy no instalado, solo se mide el almacén de listas")
+
+    if P.numpy_ok():
+        rng = random.Random(3)
+        a, b = P.ListProjectiles(), P.NumpyProjectiles(16)   # 16 fuerza varios _grow()
+        for t in range(n_steps):
+            for _ in range(rng.randint(0, 12)):
+                args = (rng.randint(-20, ANCHO + 20), rng.randint(-50, ALTO), 10, 18,
+                        rng.uniform(-6, 6), rng.uniform(-2, 7), rng.choice((P.KIND_LINEAR, P.KIND_WAVE)),
+                        rng.randint(0, 5), rng.uniform(0, 6), rng.uniform(0.1, 0.2))
+                a.spawn(*args); b.spawn(*args)
+            r = pygame.Rect(rng.randint(0, ANCHO), rng.randint(0, ALTO), 60, 60)
+            ha, hb = a.hits(r), b.hits(r)
+            assert ha == hb, f"paso {t}: hits {ha} != {hb}"
+            for i in sorted(ha[: rng.randint(0, len(ha))], reverse=True):
+                a.kill(i); b.kill(i)
+            alpha = rng.random()
+            assert a.positions(alpha) == b.positions(alpha), f"paso {t}: positions({alpha:.2f})"
+            scale = rng.choice((1.0, 0.5, 0.25))
+            a.step(scale); b.step(scale)
+            assert list(a) == list(b), f"paso {t}: step({scale})"
+        print(f"[INFO] projectiles: {n_steps} pasos, listas == numpy en hits/kill/step/positions "
+              f"({len(a)} balas vivas al final)")
+
+    player = pygame.Rect(ANCHO // 2 - 30, ALTO - 70, 60, 60)
+    height = 10 ** 6   # que no salgan de pantalla durante la medida
+
+    def volley(n):
+        rng = random.Random(n)
+        out = []
+        for i in range(n):
+            wave = i % 4 == 0
+            out.append((rng.randrange(ANCHO), rng.randrange(-ALTO, ALTO), 10, 18,
+                        0.0 if wave else rng.uniform(-3, 3), rng.uniform(3, 7),
+                        P.KIND_WAVE if wave else P.KIND_LINEAR, 0,
+                        rng.uniform(0, math.pi * 2), 0.11 + rng.random() * 0.09))
+        return out
+
+    def make_dicts(shots):
+        # lo que hacía update_logic: un dict + Rect por bala, remove() al salir
+        bullets = []
+        for x, y, w, h, vx, vy, kind, _, phase, dphase in shots:
+            r = pygame.Rect(x, y, w, h)
+            bullets.append({"rect": r, "m": Motion(r), "vx": vx, "vy": vy,
+                            "type": "wave" if kind == P.KIND_WAVE else "aim",
+                            "phase": phase, "phase_speed": dphase})
+        return bullets
+
+    def make_store(cls, shots):
+        store = cls()
+        for s in shots:
+            store.spawn(*s)
+        return store
+
+    def memory(build, shots):
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        kept = build(shots)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        del kept
+        return sum(d.size_diff for d in after.compare_to(before, "filename")) / len(shots)
+
+    def run_dicts(shots):
+        bullets = make_dicts(shots)
+        t0 = time.perf_counter()
+        for _ in range(n_timed):
+            for b in bullets[:]:
+                r = b["rect"]
+                if b["type"] == "wave":
+                    b["phase"] += b["phase_speed"]
+                    b["m"].step(int(P.WAVE_AMP * math.sin(b["phase"])), int(b["vy"]))
+                else:
+                    b["m"].step(int(b["vx"]), int(b["vy"]))
+                if r.top > height or r.right < 0 or r.left > ANCHO:
+                    bullets.remove(b)
+            hits = [b for b in bullets if b["rect"].colliderect(player)]
+        ms = (time.perf_counter() - t0) * 1000.0 / n_timed
+        return ms, sorted((b["rect"].x, b["rect"].y) for b in bullets), len(hits)
+
+    def run_store(cls, shots):
+        store = make_store(cls, shots)
+        t0 = time.perf_counter()
+        for _ in range(n_timed):
+            store.step(1.0, ANCHO, height)
+            hits = store.hits(player)
+        ms = (time.perf_counter() - t0) * 1000.0 / n_timed
+        return ms, sorted((x, y) for x, y, *_ in store), len(hits)
+
+    for n in sizes:
+        shots = volley(n)
+        base_ms, base_pos, base_hits = run_dicts(shots)
+        line = f"[INFO] projectiles {n:>6} balas: dict+Rect {base_ms:8.3f} ms"
+        for name, cls in backends:
+            ms, pos, hits = run_store(cls, shots)
+            assert pos == base_pos and hits == base_hits, f"{n} balas: {name} difiere de dict+Rect"
+            line += f" | {name} {ms:7.3f} ms (x{base_ms / ms:.1f})"
+        print(line + " por paso")
+    shots = volley(n_mem)
+    line = f"[INFO] projectiles memoria con {n_mem} balas: dict+Rect {memory(make_dicts, shots):.0f} bytes/bala"
+    for name, cls in backends:
+        line += f" | {name} {memory(lambda s: make_store(cls, s), shots):.0f}"
+    print(line)
+
+@section
+def bullets(n=5000, n_steps=120):
+    """Balas del jugador: __slots__ + compactación en el sitio dejan las mismas balas vivas."""
+    import random, tracemalloc
+    from game.entities.bullet import Bala, update_bullets, compact
+    from game.timestep import Motion
+    _display()
+    image = pygame.Surface((6, 14))
+
+    class OldBala:
+        # la Bala de antes: atributos en __dict__
+        def __init__(self, x, y, vy=-9, image=None):
+            self.page, self.area = image, image.get_rect()
+            self.rect = pygame.Rect(0, 0, self.area.width, self.area.height)
+            self.rect.center = (x, y)
+            self.motion = Motion(self.rect)
+            self.vx = 0
+            self.vy = vy
+        update = Bala.update
+
+    def make(cls, rng):
+        return cls(rng.randrange(ANCHO), rng.randrange(ALTO), image=image)
+
+    def memory(cls):
+        rng = random.Random(1)
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        balas = [make(cls, rng) for _ in range(n)]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        size = sum(s.size_diff for s in after.compare_to(before, "filename"))
+        del balas
+        return size / n
+
+    def old_tick(balas, rng):
+        for b in balas[:]:
+            if not b.update():
+                balas.remove(b)
+        for b in balas[:]:
+            if rng.random() < 0.01:   # ~1% impacta cada paso
+                balas.remove(b)
+
+    def new_tick(balas, rng):
+        update_bullets(balas)
+        for b in balas:
+            if rng.random() < 0.01:
+                b.alive = False
+        compact(balas)
+
+    res = []
+    for cls, tick in ((OldBala, old_tick), (Bala, new_tick)):
+        rng = random.Random(2)
+        balas = [make(cls, rng) for _ in range(n)]
+        total = 0.0
+        for _ in range(n_steps):
+            t0 = time.perf_counter()
+            tick(balas, rng)
+            total += time.perf_counter() - t0
+            while len(balas) < n:   # repone por abajo: siempre N vivas
+                balas.append(cls(rng.randrange(ANCHO), ALTO - 1, image=image))
+        res.append((memory(cls), total * 1000.0 / n_steps, [b.rect.topleft for b in balas]))
+    (m0, t0, a), (m1, t1, b) = res
+    assert a == b, "la compactación en el sitio deja otras balas (u otro orden) que copia + remove"
+    print(f"[INFO] bullets {n} balas del jugador: {m0:.0f} -> {m1:.0f} bytes/bala, "
+          f"paso {t0:.3f} ms (copia + remove) -> {t1:.3f} ms (compactación en el sitio)")
+
+@section
+def pool(n_steps=3000):
+    """Reservas: se reutilizan balas, in_use vuelve a 0 y la doble liberación no duplica."""
+    import gc, random
+    from game.pool import ObjectPool, POOLS
+    from game.entities.bullet import Bala, BULLET_POOL, update_bullets, compact
+    _display()
+    image = pygame.Surface((6, 14))
+    gen0 = [0]
+
+    def count(phase, info):
+        if phase == "start" and info["generation"] == 0:
+            gen0[0] += 1
+
+    def fight(pool):
+        # TETE con power-up P: 3 balas cada 100 ms a 120 Hz, ~1% impacta por paso
+        rng = random.Random(5)
+        balas = []
+        gen0[0] = 0
+        gc.callbacks.append(count)
+        t0 = time.perf_counter()
+        for step in range(n_steps):
+            if step % 12 == 0:
+                x = rng.randrange(40, ANCHO - 40)
+                for dx in (0, -14, 14):
+                    balas.append(pool.acquire(x + dx, ALTO - 80, vy=-9, image=image))
+            update_bullets(balas, pool)
+            for b in balas:
+                if rng.random() < 0.01:
+                    b.alive = False
+            compact(balas, pool)
+        ms = (time.perf_counter() - t0) * 1000.0
+        gc.callbacks.remove(count)
+        pool.release_all(balas)
+        return ms, gen0[0]
+
+    # max_free=0 equivale a no tener reserva: cada bala es un objeto nuevo
+    plain = ObjectPool(Bala, 0)
+    POOLS.remove(plain)
+    ms0, g0 = fight(plain)
+    before = BULLET_POOL.stats()
+    ms1, g1 = fight(BULLET_POOL)
+    st = BULLET_POOL.stats()
+    acquired = (st["created"] + st["reused"]) - (before["created"] + before["reused"])
+    created = st["created"] - before["created"]
+    assert acquired == plain.created, "las dos partidas deberían disparar las mismas balas"
+    assert created <= st["high_water"] and created < acquired, \
+        f"{created} balas creadas para {acquired} disparos: la reserva no reutiliza"
+    assert st["in_use"] == 0 and plain.stats()["in_use"] == 0, "quedan balas sin devolver"
+
+    probe = ObjectPool(Bala, 4)
+    POOLS.remove(probe)
+    a = probe.acquire(1, 2, image=image)
+    probe.release(a); probe.release(a)
+    assert probe.stats()["double_releases"] == 1 and probe.stats()["in_use"] == 0
+    assert probe.acquire(3, 4, image=image) is a and probe.acquire(5, 6, image=image) is not a, \
+        "la doble liberación entregó el mismo objeto dos veces"
+    print(f"[INFO] pool {n_steps} pasos: sin reserva {plain.created} balas creadas, {ms0:.1f} ms, "
+          f"{g0} recolecciones gen-0 -> con reserva {created} creadas para {acquired} disparos, "
+          f"{ms1:.1f} ms, {g1} recolecciones gen-0 (pico {st['high_water']} en uso)")
+
+@section
+def boss(n_bullets=(50, 300, 1000), n_frames=300):
+    """Balas del jefe: la cola de dibujo pinta lo mismo que un draw.rect por bala."""
+    import random
+    from game.camera import Camera
+    from game.render_queue import RenderQueue
+    from game.projectiles import new_store
+    from game.entities.boss import BULLET_COLORS, bullet_sprite_id, submit_bullets
+    _display()
+    screen = pygame.display.get_surface()
+    rng = random.Random(11)
+    cam = Camera(); cam.x, cam.y = 3.4, -2.7
+    queue = RenderQueue()
+    tipos = list(BULLET_COLORS)
+    for n in n_bullets:
+        # en celdas sin solape: la cola agrupa por textura y cambiaría el orden
+        cells = rng.sample([(x, y) for x in range(0, ANCHO, 12) for y in range(0, ALTO, 20)], n)
+        bullets = [{"rect": pygame.Rect(x, y, 10, 18), "type": tipos[i % len(tipos)]}
+                   for i, (x, y) in enumerate(cells)]
+        store = new_store()
+        for b in bullets:
+            r = b["rect"]
+            store.spawn(r.x, r.y, r.w, r.h, 0.0, 0.0, sprite=bullet_sprite_id(b["type"], r.w, r.h))
+
+        def old_draw():
+            for b in bullets:
+                color = (255,140,0)
+                t = b.get("type","normal")
+                if t == "wave": color = (255,200,0)
+                elif t == "aim": color = (255,80,80)
+                elif t == "spread": color = (255,160,60)
+                elif t == "burst": color = (255,100,0)
+                pygame.draw.rect(screen, color, cam.apply_rect(b["rect"]))
+
+        def queued_draw():
+            queue.begin(cam.apply_point)
+            submit_bullets(queue, store)
+            queue.flush(screen)
+
+        res = []
+        for draw in (old_draw, queued_draw):
+            screen.fill((0, 0, 0)); draw()
+            frame = pygame.image.tobytes(screen, "RGB")
+            t0 = time.perf_counter()
+            for _ in range(n_frames):
+                draw()
+            res.append(((time.perf_counter() - t0) * 1000.0 / n_frames, frame))
+        assert res[0][1] == res[1][1], f"{n} balas: la cola no pinta lo mismo que draw.rect"
+        print(f"[INFO] boss {n:>5} balas: draw.rect {res[0][0]:.3f} ms -> cola {res[1][0]:.3f} ms")
+
+@section
+def background(n_frames=300):
+    """Transición de fondos: sin Surfaces por frame y mismos extremos que copy()+set_alpha."""
+    from game.background import AnimatedBackground, Crossfade, CURVES
+    _display()
+    screen = pygame.display.get_surface()
+    bg = AnimatedBackground()
+    a, b = bg.clip_a.frame, bg.clip_b.frame
+
+    def run(draw):
+        t0 = time.perf_counter()
+        for i in range(n_frames):
+            draw(i / n_frames)
+        return (time.perf_counter() - t0) * 1000.0 / n_frames
+
+    def draw_copy(t):
+        img = b.copy(); img.set_alpha(int(255 * t))
+        screen.blit(a, (0, 0)); screen.blit(img, (0, 0))
+
+    def shot(draw, t):
+        draw(t)
+        return pygame.image.tobytes(screen, "RGB")
+
+    ends = [shot(draw_copy, t) for t in (0.0, 1.0)]
+    print(f"[INFO] background copy()+set_alpha: {run(draw_copy):.3f} ms/frame "
+          f"({n_frames} Surfaces de {ANCHO}x{ALTO})")
+    for curve in CURVES:
+        fade = Crossfade((ANCHO, ALTO), curve)
+        fade.prepare()
+        draw = lambda t: fade.draw(screen, a, b, t)
+        # dissolve deja los revelados en <= 254 para no chocar con el colorkey
+        tol = 1 if curve == "dissolve" else 0
+        for t, want in zip((0.0, 1.0), ends):
+            got = shot(draw, t)
+            worst = max((abs(x - y) for x, y in zip(got, want) if x != y), default=0)
+            assert worst <= tol, f"{curve} a t={t}: difiere en {worst} niveles de copy()+set_alpha"
+        ms = run(draw)
+        st = fade.stats()
+        assert st["frame_allocations"] == 0, f"{curve}: {st['frame_allocations']} Surfaces en draw"
+        print(f"[INFO] background {curve:<8} {ms:.3f} ms/frame, Surfaces en prepare {st['allocations']}, "
+              f"por frame {st['frame_allocations']}")
+    bg.release()
+
+@section
+def rotation(n_frames=600):
+    """Nave: la caché da los mismos frames que rotozoom al ángulo cuantizado y no falla tras prebuild."""
+    from pygame.math import Vector2
+    from game import assets as Assets
+    from game.entities.player import Jugador
+    from game.constants import SHIP_DISPLAY
+    from game.render_queue import RenderQueue
+    _display()
+    screen = pygame.Surface((200, 200))
+    cam = lambda x, y: (x, y)
+    queue = RenderQueue(screen.get_rect())
+
+    def run(jug, draw, muzzle):
+        t0 = time.perf_counter()
+        for i in range(n_frames):
+            jug.angle = jug.ANGLE_MAX * ((i % 90) / 45.0 - 1.0)   # barrido -22..+22
+            jug.anim_idx = i
+            draw(screen)
+            muzzle()
+        return (time.perf_counter() - t0) * 1000.0 / n_frames
+
+    for skin in SHIP_DISPLAY:
+        Assets.set_player_skin(skin)
+        jug = Jugador(100, 150)
+        views = Assets.views("player")
+        cache = Assets.PLAYER_ROT
+
+        def draw_uncached(surface):
+            frame = views[jug.anim_idx % len(views)]
+            rotated = pygame.transform.rotozoom(frame, -jug.angle, 1.0)
+            surface.blit(rotated, rotated.get_rect(center=jug.rect.center))
+
+        def muzzle_uncached():
+            offset = Vector2(jug.nose_local) - Vector2(jug.w/2, jug.h/2)
+            return Vector2(jug.rect.center) + offset.rotate(-jug.angle)
+
+        for angle in (-jug.ANGLE_MAX, -7.3, 0.0, 4.9, jug.ANGLE_MAX):
+            q = cache.quantize(angle) * cache.step
+            want = pygame.transform.rotozoom(views[0], -q, 1.0)
+            got = cache.rotated(skin, 0, views[0], angle)
+            assert got.get_size() == want.get_size() and \
+                pygame.image.tobytes(got, "RGBA") == pygame.image.tobytes(want, "RGBA"), \
+                f"{skin} a {angle} grados: la caché no coincide con rotozoom({-q})"
+        before = run(jug, draw_uncached, muzzle_uncached)
+
+        def draw_cached(surface):
+            queue.begin(cam)
+            jug.submit(queue, cam)
+            queue.flush(surface)
+
+        run(jug, draw_cached, jug.get_muzzle_world)   # calienta la caché
+        misses = cache.stats()["misses"]
+        after = run(jug, draw_cached, jug.get_muzzle_world)
+        assert cache.stats()["misses"] == misses, f"{skin}: rotaciones nuevas en un barrido ya visto"
+        print(f"[INFO] rotation {skin:<9} rotozoom {before:.3f} ms/frame -> caché {after:.3f} ms/frame "
+              f"({cache.stats()['surfaces']} rotaciones)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Comprobaciones y mediciones de rendimiento.")
+    parser.add_argument("names", nargs="*", metavar="NOMBRE",
+                        help="secciones: " + ", ".join(SECTIONS))
+    args = parser.parse_args(argv)
+    unknown = [n for n in args.names if n not in SECTIONS]
+    if unknown:
+        parser.error(f"secciones desconocidas: {', '.join(unknown)}")
+    failed = 0
+    for name in args.names or SECTIONS:
+        try:
+            SECTIONS[name]()
+        except AssertionError:
+            failed += 1
+            print(f"[AVISO] {name} falló:")
+            traceback.print_exc()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())